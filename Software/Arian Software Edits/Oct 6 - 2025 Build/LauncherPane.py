@@ -1,22 +1,22 @@
 """
 Aries Launcher (CTk) — CoverFlow fluid (circular icons, fast + smooth)
 - Loads icons from: VisionAriesAssets (Fall 2025, Color)
-- 5 icons visible, bounce-free glide
-- On-demand cache with quantized sizes/alpha (low churn)
+- 5 icons visible, critically damped spring glide; the loop sleeps at rest
+- Optional rotary encoder (ARIES_ENCODER), coalesced to one step per frame
+- One base sprite per icon size; opacity + glow applied by the compositor
 """
 
 import os, time, threading
 from datetime import datetime
 import customtkinter as ctk
-from PIL import Image, ImageTk, ImageDraw, ImageFilter
-try:
-    import psutil
-except Exception:
-    psutil = None
-try:
-    import requests
-except Exception:
-    requests = None
+from PIL import Image, ImageDraw, ImageFilter
+from telemetry import Telemetry
+from sprite_atlas import SpriteAtlas, flow_sizes, quantize, circle_base
+from sprite_cache import SpriteCache
+from compositor import StripCompositor
+from spring import SpringArray
+from rotary_input import make_encoder
+from services import EventBus
 
 import platform
 IS_PI = platform.machine().startswith(("armv7l","armv6l","aarch64")) and "raspberrypi" in platform.platform().lower()
@@ -26,13 +26,17 @@ if IS_PI:
     TARGET_FPS    = 30
     BASE_ICON     = 112
     SPACING       = 148
-    FLOW_LAMBDA   = 18.0
+    SPRING_OMEGA  = 18.0
     SIZE_STEP_PX  = 4
-    ALPHA_STEP_8  = 32
 
 # ---------- Configuration -------------
 WIDTH, HEIGHT = 1280, 720
 TARGET_FPS     = 144
+# Sprite memory shared by all CoverFlow icons (MB): an in-memory atlas is
+# charged first, the rest holds resized copies; the 5 visible are pinned
+SPRITE_CACHE_MB = float(os.environ.get("ARIES_SPRITE_CACHE_MB", 4 if IS_PI else 12))
+# "evdev:/dev/input/event0", "gpio:17,18,27" or "trace:ticks.txt" (see rotary_input.py)
+ENCODER_SPEC   = os.environ.get("ARIES_ENCODER", "none")
 ASSETS_DIR     = os.path.join(os.getcwd(), "VisionAriesAssets (Fall 2025, Color)")
 
 APPS = [
@@ -69,9 +73,8 @@ SPACING     = 180
 BASE_ICON   = 132
 SCALE_DROP  = 0.14
 ALPHA_DROP  = 0.22
-FLOW_LAMBDA = 26.0
+SPRING_OMEGA = 24.0
 SIZE_STEP_PX  = 2
-ALPHA_STEP_8  = 8
 
 def load_image(path):
     try:
@@ -79,14 +82,6 @@ def load_image(path):
     except Exception:
         return None
 
-def circle_crop_rgba(img: Image.Image, size: int) -> Image.Image:
-    img = img.resize((size, size), Image.LANCZOS)
-    mask = Image.new("L", (size, size), 0)
-    ImageDraw.Draw(mask).ellipse((0, 0, size, size), fill=255)
-    out = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-    out.paste(img, (0, 0), mask)
-    return out
-
 def make_soft_glow(radius: int, alpha: int = 140) -> Image.Image:
     w = h = radius * 2
     img = Image.new("RGBA", (w, h), (0, 0, 0, 0))
@@ -103,34 +98,18 @@ def make_soft_glow(radius: int, alpha: int = 140) -> Image.Image:
     img = img.filter(ImageFilter.GaussianBlur(int(radius * 0.30)))
     return img
 
-def safe_batt():
-    if psutil and hasattr(psutil, "sensors_battery"):
-        try:
-            b = psutil.sensors_battery()
-            if b: return f"{int(b.percent)}%"
-        except Exception: pass
-    return "–%"
-
-def safe_cpu():
-    if psutil:
-        try: return f"{psutil.cpu_percent():.0f}%"
-        except Exception: pass
-    return "–%"
-
-def safe_ram():
-    if psutil:
-        try: return f"{psutil.virtual_memory().percent:.0f}%"
-        except Exception: pass
-    return "–%"
-
 # ---------- User Interface ----------
 class StatusBar:
     def __init__(self, canvas: ctk.CTkCanvas):
         self.cv = canvas
         self.console = []
-        self.weather = "…"
+        self.weather = None          # manual override, else telemetry weather
         self.text_id = None
+        self._text = None
         self._last_update = 0.0
+        # psutil/weather sampled off the render loop; tick() only formats
+        self.telemetry = Telemetry()
+        self.telemetry.start()
 
     def append(self, line: str):
         self.console.append(line); self.console = self.console[-3:]
@@ -140,10 +119,15 @@ class StatusBar:
         if nowt - self._last_update < 0.25:
             return
         self._last_update = nowt
+        snap = self.telemetry.snapshot
         now = datetime.now().strftime("%-I:%M %p")
         lines = "\n".join(self.console)
-        txt = f"{now} · {safe_batt()} · {self.weather} · CPU {safe_cpu()} · RAM {safe_ram()}\n{BUILD_STR}"
+        weather = self.weather or snap.weather
+        txt = f"{now} · {snap.batt_str} · {weather} · CPU {snap.cpu_str} · RAM {snap.ram_str}\n{BUILD_STR}"
         if lines: txt += "\n" + lines
+        if txt == self._text:
+            return
+        self._text = txt
         if self.text_id is None:
             self.text_id = self.cv.create_text(16, 84, anchor="nw",
                                                fill="white", font=("Helvetica", 12), text=txt)
@@ -156,107 +140,128 @@ class CoverFlow:
         self.cv = canvas
         self.base_icon = base_icon
         self.spacing   = spacing
-        self.sel = 0
+        self.sel = 0              # unwrapped; taken mod len(apps) when indexing
         self.sel_anim = 0.0
+        self.flow = SpringArray(1, omega=SPRING_OMEGA)
 
-        self.icons = []
-        self._img_refs = [None]*5
         self.label_id = None
+        self._drawn = None
 
         # Load assets
         self.apps = []
         for fn, label in apps:
-            img = load_image(os.path.join(ASSETS_DIR, fn)) or Image.new("RGBA",(base_icon,base_icon),(200,200,200,255))
+            path = os.path.join(ASSETS_DIR, fn)
+            img = load_image(path) or Image.new("RGBA",(base_icon,base_icon),(200,200,200,255))
             self.apps.append({
                 "id": os.path.splitext(fn)[0],
                 "label": label,
                 "img": img,
-                "cache": {}
+                "path": path,
             })
+        self.sprite_budget = SPRITE_CACHE_MB * 2**20
+        self.sprites = SpriteCache(self.sprite_budget)
+        self._atlas_charged = False
 
-        # Strong glow effect under center
-        glow_img = make_soft_glow(int(base_icon*1.2), 140)
-        self._glow_tk = ImageTk.PhotoImage(glow_img)
-        self.glow_id = self.cv.create_image(0, 0, image=self._glow_tk, anchor="nw")
+        # One base sprite per size the flow can reach, built off the Tk
+        # thread (or mmap'd from the last boot) so the first scroll is smooth
+        sizes = flow_sizes(base_icon, SCALE_DROP, SIZE_STEP_PX)
+        self.atlas = SpriteAtlas([(a["id"], a["img"], a["path"]) for a in self.apps], sizes).start()
 
-        # five icon slots + label
-        for _ in range(5):
-            self.icons.append(self.cv.create_image(0, 0, image=None, anchor="nw"))
+        # The five slots and the centre glow are composited into one strip
+        # image; the glow is blurred once here and only re-blended per frame
+        glow_img = make_soft_glow(int(base_icon*1.2), 140)
+        self.strip_w = 4*spacing + glow_img.width
+        self.strip_h = glow_img.height
+        self.strip_x = WIDTH//2 - self.strip_w//2
+        self.strip_y = HEIGHT//2 - 10 - self.strip_h//2
+        bg = tuple(c >> 8 for c in self.cv.winfo_rgb(self.cv.cget("bg")))
+        self.comp = StripCompositor(self.strip_w, self.strip_h, bg, glow_img)
+        self.strip_id = self.cv.create_image(self.strip_x, self.strip_y,
+                                             image=self.comp.photo, anchor="nw")
+        self.cv.tag_lower(self.strip_id)
         self.label_id = self.cv.create_text(0, 0, text="", fill=LABEL_COLOR,
                                             font=("Helvetica", 16, "bold"))
 
-    def _get_tkimg(self, app, size_px: int, alpha: float):
-        size_q  = max(14, int(round(size_px / SIZE_STEP_PX) * SIZE_STEP_PX))
-        a255    = int(max(0, min(255, round(alpha * 255 / ALPHA_STEP_8) * ALPHA_STEP_8)))
-        key = (size_q, a255)
-        cache = app["cache"]
-        if key in cache:
-            return cache[key]
-        # build
-        circ = circle_crop_rgba(app["img"], size_q)
-        if a255 < 255:
-            am = circ.split()[-1].point(lambda p, a=a255: int(p * a / 255))
-            circ.putalpha(am)
-        tkimg = ImageTk.PhotoImage(circ)
-        cache[key] = tkimg
-        return tkimg
+    def _sprite(self, app, size_px: int):
+        size_q = quantize(size_px, SIZE_STEP_PX)
+        key = (app["id"], size_q)
+        # atlas sprites are views into one buffer: caching them frees nothing
+        rgba = self.atlas.get(app["id"], size_q)
+        if rgba is not None:
+            if not self._atlas_charged:
+                self._atlas_charged = True
+                self.sprites.set_budget(max(0, self.sprite_budget - self.atlas.resident_bytes))
+            return rgba, key
+        rgba = self.sprites.get(key)
+        if rgba is not None:
+            return rgba, key
+        # atlas still building (or unavailable): a real copy, so budget it
+        rgba = circle_base(app["img"], size_q)
+        self.sprites.put(key, rgba, size_q * size_q * 4)
+        return rgba, key
 
     def step(self, dt):
+        """Advance the flow spring and redraw; False once it has settled."""
         n = len(self.apps)
-        if n == 0: return
-        d = self.sel - self.sel_anim
-        if d >  n/2: d -= n
-        if d < -n/2: d += n
-        dt = max(1/480, dt)
-        alpha = 1.0 - pow(2.718281828, -FLOW_LAMBDA * dt)
-        self.sel_anim += d * alpha
-        if abs(d) < 1e-4:
-            self.sel_anim = round(self.sel_anim)
+        if n == 0: return False
+        moving = self.flow.step(min(dt, 0.1))
+        self.sel_anim = float(self.flow.x[0])
         self._redraw_icons()
+        if not moving and abs(self.sel) >= n:
+            # fold the unwrapped position back once at rest (same picture)
+            self.sel %= n
+            self.flow.snap(self.sel)
+            self.sel_anim = self._drawn = float(self.sel)
+        return moving
 
     def update_selection(self, delta):
         if self.apps:
-            self.sel = (self.sel + delta) % len(self.apps)
+            # retarget only: velocity from earlier clicks carries over
+            self.sel += delta
+            self.flow.set_target(self.sel)
 
     def current_app(self):
         if not self.apps: return None
         return self.apps[self.sel % len(self.apps)]
 
     def _redraw_icons(self):
+        if self.sel_anim == self._drawn:
+            return
+        self._drawn = self.sel_anim
         midx, midy = WIDTH//2, HEIGHT//2 - 10
         x0   = midx - 2*self.spacing
         frac = self.sel_anim - round(self.sel_anim)
         order = (0, 4, 1, 3, 2)
 
-        positions = []
-        for slot, i in enumerate(order):
+        layers = []
+        visible = []
+        glow = None
+        label = None
+        for i in order:
             idx = int(round(self.sel_anim) - 2 + i) % len(self.apps)
             app = self.apps[idx]
             dist  = abs(i - 2 + frac)
             scale = max(0.70, 1.0 - SCALE_DROP*dist)
             alpha = max(0.46, 1.0 - ALPHA_DROP*dist)
 
-            size  = int(self.base_icon * scale)
-            tkimg = self._get_tkimg(app, size, alpha)
-
-            cx, cy = x0 + i*self.spacing, midy
-            self.cv.itemconfigure(self.icons[slot], image=tkimg)
-            self.cv.coords(self.icons[slot], int(cx - tkimg.width()/2), int(cy - tkimg.height()/2))
-            self._img_refs[slot] = tkimg  # keep ref
+            rgba, key = self._sprite(app, int(self.base_icon * scale))
+            visible.append(key)
 
+            cx = x0 + i*self.spacing - self.strip_x
+            cy = midy - self.strip_y
+            layers.append((key, rgba, cx, cy, alpha))
             if i == 2:
-                gx = int(cx - self._glow_tk.width()/2)
-                gy = int(cy - self._glow_tk.height()/2 + self.base_icon*0.03)
-                self.cv.coords(self.glow_id, gx, gy)
-
-            positions.append((cx, cy, tkimg.width(), app["label"]))
+                glow = (cx, cy + self.base_icon*0.03, 1.0)
+                if abs(frac) < 2/self.spacing:
+                    label = (app["label"], cx + self.strip_x, midy + rgba.shape[0]/2 + 28)
+        self.sprites.pin(visible)
+        self.comp.compose(layers, glow)
 
         # Label
-        for cx, cy, size_w, label in positions:
-            if abs(cx - midx) < 2:
-                self.cv.itemconfigure(self.label_id, text=label, fill=LABEL_COLOR)
-                self.cv.coords(self.label_id, cx, cy + size_w/2 + 28)
-                break
+        if label:
+            text, lx, ly = label
+            self.cv.itemconfigure(self.label_id, text=text, fill=LABEL_COLOR)
+            self.cv.coords(self.label_id, lx, ly)
 
 class VAApp(ctk.CTk):
     def __init__(self):
@@ -278,18 +283,30 @@ class VAApp(ctk.CTk):
         self.bind("<Return>", lambda e: self.open_current())
         self.bind("<space>",  lambda e: self.open_current())
         self.bind("h",        lambda e: self.go_home())
+        self.bind("i",        lambda e: self.show_cache_stats())
         self.bind("<Escape>", lambda e: self.quit())
         self.bind_all("<MouseWheel>", self._wheel)
         self.bind_all("<Button-4>", lambda e: self.nav(+1))
         self.bind_all("<Button-5>", lambda e: self.nav(-1))
 
-        # time-step loop
+        # Encoder ticks arrive on their own thread; the bus hands us one
+        # INPUT event per burst and take() returns the summed delta
+        self.bus = EventBus()
+        self.bus.subscribe("INPUT", self._on_input)
+        self.encoder = make_encoder(ENCODER_SPEC, self.bus)
+        if self.encoder:
+            self._pump_bus()
+
+        # time-step loop: runs only while the flow is moving (see _wake)
+        self._ticking = False
         self._last_time = time.perf_counter()
-        self._tick()
+        self._wake()
+        self._status_tick()
 
     def nav(self, d):
         if self.current_view == "home":
             self.cflow.update_selection(d)
+            self._wake()
 
     def open_current(self):
         app = self.cflow.current_app()
@@ -298,6 +315,14 @@ class VAApp(ctk.CTk):
 
     def go_home(self):
         self.current_view = "home"
+        self._wake()
+
+    def show_cache_stats(self):
+        st = self.cflow.sprites.stats()
+        self.status.append(f"sprites {st['bytes']/2**20:.1f}/{st['budget']/2**20:.0f}MB · "
+                           f"{st['entries']} sprites · {st['evictions']} evicted · "
+                           f"{st['rebuilds_per_s']:.1f} rebuilds/s · "
+                           f"atlas {self.cflow.atlas.resident_bytes/2**20:.1f}MB in heap")
 
     def _wheel(self, e):
         self.nav(1 if e.delta > 0 else -1)
@@ -305,16 +330,38 @@ class VAApp(ctk.CTk):
     def _set_weather(self, txt):
         self.status.weather = txt
 
+    def _wake(self):
+        if not self._ticking:
+            self._ticking = True
+            self._last_time = time.perf_counter() - 1 / TARGET_FPS
+            self._tick()
+
     def _tick(self):
         now = time.perf_counter()
         dt  = max(1e-3, now - self._last_time)
         self._last_time = now
-        if self.current_view == "home":
-            self.cflow.step(dt)
-        self.status.tick()
+        moving = self.current_view == "home" and self.cflow.step(dt)
+        if not moving:
+            self._ticking = False      # at rest: nav()/go_home() wake us
+            return
         delay_ms = max(1, int(1000 / TARGET_FPS))
         self.after(delay_ms, self._tick)
 
+    def _on_input(self, evt):
+        delta, presses = self.encoder.take()
+        if delta:
+            self.nav(delta)
+        if presses:
+            self.open_current()
+
+    def _pump_bus(self):
+        self.bus.drain(max_n=16, budget_ms=2.0)
+        self.after(int(1000 / 60), self._pump_bus)
+
+    def _status_tick(self):
+        self.status.tick()
+        self.after(250, self._status_tick)
+
 if __name__ == "__main__":
     app = VAApp()
     app.mainloop()
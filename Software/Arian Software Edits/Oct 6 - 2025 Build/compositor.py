@@ -0,0 +1,120 @@
+"""
+CoverFlow strip compositor
+- Each icon keeps one opaque base sprite per size; opacity is applied here,
+  at composite time, instead of being baked into extra bitmap variants
+- One shared pre-blurred glow texture, blended with its own opacity
+- The strip is blended onto the canvas background in a single RGB buffer
+  and pasted into one reusable PhotoImage (no per-frame image allocation)
+- Only the rects sprites covered last frame or cover now are repainted, in
+  uint16 integer math with preallocated scratch; each sprite's alpha plane
+  is split out once and reused while the sprite stays on screen
+"""
+
+import numpy as np
+from PIL import Image, ImageTk
+
+
+class StripCompositor:
+    def __init__(self, width, height, bg_rgb, glow: Image.Image):
+        self.width, self.height = width, height
+        # a filled background to copy from: a slice copy is a memcpy, a
+        # broadcast fill from an RGB triple is several times slower
+        self.bg = np.empty((height, width, 3), np.uint8)
+        self.bg[...] = np.array(bg_rgb, np.uint8)
+        self.out = self.bg.copy()
+        g = np.asarray(glow.convert("RGBA"))
+        self.glow_rgb = np.ascontiguousarray(g[..., :3])
+        self.glow_a = self._split_alpha(g)
+        self.photo = ImageTk.PhotoImage(Image.new("RGB", (width, height), tuple(bg_rgb)))
+        self._alpha = {}        # sprite key -> uint16 (h, w, 3) alpha plane
+        self._dirty = []        # rects painted last frame
+        self._scratch = [np.empty(0, np.uint16) for _ in range(3)]
+        self.frames = 0
+
+    def _rect(self, w, h, cx, cy):
+        """Clipped (x0, y0, x1, y1) of a w x h image centred at (cx, cy), or None."""
+        x, y = int(cx - w / 2), int(cy - h / 2)
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.width, x + w), min(self.height, y + h)
+        return (x0, y0, x1, y1) if x1 > x0 and y1 > y0 else None
+
+    @staticmethod
+    def _split_alpha(rgba):
+        # repeated per channel: same-shape uint16 math is far cheaper than
+        # broadcasting an (h, w, 1) plane across RGB
+        return np.repeat(rgba[..., 3:4], 3, axis=2).astype(np.uint16)
+
+    def _tmp(self, i, shape):
+        n = shape[0] * shape[1] * shape[2]
+        if self._scratch[i].size < n:
+            self._scratch[i] = np.empty(n, np.uint16)
+        return self._scratch[i][:n].reshape(shape)
+
+    def _blend(self, rgb, a, opacity, cx, cy):
+        """Straight-alpha 'over' of (rgb, a * opacity/255) centred at (cx, cy), clipped."""
+        h, w = rgb.shape[:2]
+        r = self._rect(w, h, cx, cy)
+        if r is None:
+            return
+        x0, y0, x1, y1 = r
+        x, y = int(cx - w / 2), int(cy - h / 2)
+        src = rgb[y0 - y:y1 - y, x0 - x:x1 - x]
+        sa = a[y0 - y:y1 - y, x0 - x:x1 - x]
+        dst = self.out[y0:y1, x0:x1]
+        shape = dst.shape
+        # k = a * opacity in 0..255; src*k + dst*(255-k) <= 255*255 fits uint16
+        k = self._tmp(0, shape)
+        np.multiply(sa, opacity, out=k)
+        self._div255(k, self._tmp(2, shape))
+        acc = self._tmp(1, shape)
+        np.multiply(src, k, out=acc)
+        np.subtract(255, k, out=k)
+        tmp = self._tmp(2, shape)
+        np.multiply(dst, k, out=tmp)
+        acc += tmp
+        self._div255(acc, tmp)
+        np.copyto(dst, acc, casting="unsafe")
+
+    @staticmethod
+    def _div255(x, tmp):
+        """x = round(x / 255) in place, for x <= 65025; shifts, no division."""
+        x += 128
+        np.right_shift(x, 8, out=tmp)
+        x += tmp
+        x >>= 8
+
+    def compose(self, sprites, glow=None):
+        """
+        sprites: [(key, rgba uint8 array, cx, cy, opacity)] in paint order;
+                 `key` identifies the sprite bitmap (same key, same pixels)
+        glow:    (cx, cy, opacity) or None
+        Coordinates are strip-local. Returns the PhotoImage to display.
+        """
+        rects = []
+        if glow is not None:
+            gh, gw = self.glow_rgb.shape[:2]
+            rects.append(self._rect(gw, gh, glow[0], glow[1]))
+        for _key, rgba, cx, cy, _op in sprites:
+            rects.append(self._rect(rgba.shape[1], rgba.shape[0], cx, cy))
+        rects = [r for r in rects if r is not None]
+        # background only where something was or will be drawn
+        for x0, y0, x1, y1 in self._dirty + rects:
+            self.out[y0:y1, x0:x1] = self.bg[y0:y1, x0:x1]
+        self._dirty = rects
+
+        if glow is not None:
+            gx, gy, go = glow
+            self._blend(self.glow_rgb, self.glow_a, int(go * 255 + 0.5), gx, gy)
+        alpha = {}
+        for key, rgba, cx, cy, opacity in sprites:
+            a = self._alpha.get(key)
+            if a is None:
+                a = self._split_alpha(rgba)
+            alpha[key] = a
+            self._blend(rgba[..., :3], a, int(opacity * 255 + 0.5), cx, cy)
+        self._alpha = alpha     # only what is on screen stays split out
+
+        self.photo.paste(Image.frombuffer("RGB", (self.width, self.height),
+                                          self.out, "raw", "RGB", 0, 1))
+        self.frames += 1
+        return self.photo
@@ -0,0 +1,306 @@
+# aOS1/main_ui_layer/event_bus.py
+# =============================================================================
+# EVENT BUS
+# -----------------------------------------------------------------------------
+# Topic publish/subscribe with priority lanes, drained in batches by the UI
+# loop.
+#
+#   * Events are slotted dataclasses (Navigate, Voice, Input, ...), not dicts.
+#   * Each topic has its own bounded queue. Each queue is either drop-oldest
+#     (the default) or coalescing: a new event merges into or replaces the
+#     pending one. The coalescing mode suits high-rate topics like FRAME and
+#     TELEMETRY. With a `key`, "the pending one" is whichever queued event
+#     has the same key (one per TELEMETRY metric), found through an index.
+#   * Topics sit in lanes. drain() always empties INPUT before NAVIGATION,
+#     NAVIGATION before VOICE, and VOICE before TELEMETRY. Topics that share
+#     a lane take turns.
+#   * drain(max_n, budget_ms) never blocks. It dispatches until the batch is
+#     done, or the time budget runs out, and leaves the rest for the next
+#     frame.
+#
+#   bus.subscribe("NAVIGATE", lambda e: switch(e.pane_id))
+#   bus.emit("NAVIGATE", pane_id="wifi")      # any thread
+#   bus.drain(max_n=32, budget_ms=2.0)        # UI thread, once per frame
+# =============================================================================
+
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, ClassVar, Optional
+
+# ---------------------------- EVENTS ------------------------------------
+class Lane(IntEnum):
+    INPUT = 0
+    NAVIGATION = 1
+    VOICE = 2
+    TELEMETRY = 3
+
+
+@dataclass(slots=True)
+class Event:
+    topic: ClassVar[str] = "EVENT"
+    lane: ClassVar[Lane] = Lane.NAVIGATION
+    ts: float = field(default=0.0, kw_only=True)   # stamped by the bus
+
+
+@dataclass(slots=True)
+class Input(Event):
+    topic: ClassVar[str] = "INPUT"
+    lane: ClassVar[Lane] = Lane.INPUT
+    source: str = "encoder"
+
+
+@dataclass(slots=True)
+class Navigate(Event):
+    topic: ClassVar[str] = "NAVIGATE"
+    lane: ClassVar[Lane] = Lane.NAVIGATION
+    pane_id: str = ""
+
+
+@dataclass(slots=True)
+class Voice(Event):
+    topic: ClassVar[str] = "VOICE"
+    lane: ClassVar[Lane] = Lane.VOICE
+    text: str = ""
+
+
+@dataclass(slots=True)
+class Telemetry(Event):
+    topic: ClassVar[str] = "TELEMETRY"
+    lane: ClassVar[Lane] = Lane.TELEMETRY
+    name: str = ""
+    value: Any = None
+
+
+@dataclass(slots=True)
+class Frame(Event):
+    topic: ClassVar[str] = "FRAME"
+    lane: ClassVar[Lane] = Lane.TELEMETRY
+    seq: int = 0
+
+
+@dataclass(slots=True)
+class Generic(Event):
+    """Any topic without its own event class; fields live in `payload`."""
+    name: str = "EVENT"
+    payload: dict = field(default_factory=dict)
+
+    def __getattr__(self, key: str) -> Any:
+        if key == "payload":
+            raise AttributeError(key)
+        try:
+            return self.payload[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+
+EVENT_TYPES: dict[str, type[Event]] = {
+    cls.topic: cls for cls in (Input, Navigate, Voice, Telemetry, Frame)
+}
+
+
+def topic_of(evt: Event) -> str:
+    return evt.name if isinstance(evt, Generic) else evt.topic
+
+
+_WARNED: set[tuple] = set()    # (topic, *fields) already reported by make_event()
+
+def make_event(type_: str, payload: dict) -> Event:
+    """
+    The event for emit(type_, **payload). Keys a typed event has no field
+    for are dropped (with one warning per topic and key set), never raised:
+    emit() runs on whatever thread produced the event.
+    """
+    cls = EVENT_TYPES.get(type_)
+    if cls is None:
+        return Generic(name=type_, payload=payload)
+    fields = cls.__dataclass_fields__
+    if not fields.keys() >= payload.keys():
+        extra = (type_, *sorted(payload.keys() - fields.keys()))
+        if extra not in _WARNED:
+            _WARNED.add(extra)
+            print(f"[event_bus] ?? {type_}: ignoring unknown field(s) {', '.join(extra[1:])}")
+        payload = {k: v for k, v in payload.items() if k in fields}
+    return cls(**payload)
+
+# ---------------------------- QUEUE POLICIES ----------------------------
+def _newest(old: Event, new: Event) -> Event:
+    return new
+
+
+def _metric(evt: Event) -> Any:
+    return getattr(evt, "name", None)
+
+
+@dataclass(slots=True)
+class TopicQueue:
+    maxlen: int = 256
+    coalesce: Optional[Callable[[Event, Event], Optional[Event]]] = None
+    lane: Optional[Lane] = None          # None: use the event class' lane
+    key: Optional[Callable[[Event], Any]] = None   # coalesce per key, not just with the tail
+    items: deque = field(default_factory=deque)    # cells: [event, key]
+    index: dict = field(default_factory=dict)      # key -> its queued cell
+    published: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+
+    def forget(self, cell: list) -> None:
+        """Drop a cell that left the queue from the key index."""
+        if self.key is not None and self.index.get(cell[1]) is cell:
+            del self.index[cell[1]]
+
+
+# FRAME keeps only the newest; TELEMETRY keeps the newest per metric name.
+DEFAULT_POLICIES: dict[str, dict] = {
+    "FRAME": {"maxlen": 1, "coalesce": _newest},
+    "TELEMETRY": {"maxlen": 32, "coalesce": _newest, "key": _metric},
+    "INPUT": {"maxlen": 64},
+}
+
+# ---------------------------- BUS ---------------------------------------
+class EventBus:
+    """Thread-safe topic pub/sub. Publish from anywhere, drain on the UI thread."""
+    def __init__(self, policies: Optional[dict[str, dict]] = None) -> None:
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._subs: dict[str, list[Callable[[Event], Any]]] = {}
+        self._queues: dict[str, TopicQueue] = {}
+        # per lane: topics with pending events, in arrival order
+        self._lanes: list[OrderedDict] = [OrderedDict() for _ in Lane]
+        self._pending = 0
+        self.on_publish: Optional[Callable[[], None]] = None   # e.g. wake the UI loop
+        self.dispatched = 0
+        self.handler_errors = 0
+        for topic, kw in {**DEFAULT_POLICIES, **(policies or {})}.items():
+            self.configure(topic, **kw)
+
+    # ----- setup -----
+    def configure(self, topic: str, maxlen: int = 256,
+                  coalesce: Optional[Callable[[Event, Event], Optional[Event]]] = None,
+                  lane: Optional[Lane] = None,
+                  key: Optional[Callable[[Event], Any]] = None) -> None:
+        """
+        Bound a topic's queue. `coalesce(old, new)` returns a merged event or
+        None; `old` is the queued event with the same key(event), or the
+        newest queued event when there is no key.
+        """
+        with self._lock:
+            q = self._queues.get(topic)
+            if q is None:
+                self._queues[topic] = TopicQueue(maxlen, coalesce, lane, key)
+            else:
+                q.maxlen, q.coalesce, q.lane = maxlen, coalesce, lane
+                if key is not q.key:
+                    q.key = key
+                    q.index.clear()
+                    for cell in q.items:
+                        cell[1] = key(cell[0]) if key else None
+                        if key:
+                            q.index[cell[1]] = cell
+
+    def subscribe(self, topic: str, handler: Callable[[Event], Any]) -> Callable[[], None]:
+        """Call handler(event) for each `topic` event ("*" for all). Returns an unsubscribe."""
+        with self._lock:
+            self._subs.setdefault(topic, []).append(handler)
+        return lambda: self.unsubscribe(topic, handler)
+
+    def unsubscribe(self, topic: str, handler: Callable[[Event], Any]) -> None:
+        with self._lock:
+            subs = self._subs.get(topic)
+            if subs and handler in subs:
+                # copy-on-write so a drain in progress keeps its snapshot
+                self._subs[topic] = [h for h in subs if h is not handler]
+
+    # ----- producers (any thread) -----
+    def emit(self, type_: str, **payload: Any) -> None:
+        self.publish(make_event(type_, payload))
+
+    def publish(self, evt: Event) -> None:
+        topic = topic_of(evt)
+        evt.ts = time.monotonic()
+        with self._lock:
+            q = self._queues.get(topic)
+            if q is None:
+                q = self._queues[topic] = TopicQueue()
+            q.published += 1
+            k = q.key(evt) if q.key else None
+            if q.coalesce and q.items:
+                cell = q.index.get(k) if q.key else q.items[-1]
+                merged = q.coalesce(cell[0], evt) if cell is not None else None
+                if merged is not None:
+                    cell[0] = merged     # keeps its place in the queue
+                    q.coalesced += 1
+                    return           # already queued, so the loop is already awake
+            if len(q.items) >= q.maxlen:
+                q.forget(q.items.popleft())
+                q.dropped += 1
+                self._pending -= 1
+            cell = [evt, k]
+            q.items.append(cell)
+            if q.key:
+                q.index[k] = cell
+            self._pending += 1
+            lane = q.lane if q.lane is not None else evt.lane
+            self._lanes[lane][topic] = q
+            self._ready.notify()
+        if self.on_publish:
+            self.on_publish()
+
+    # ----- consumer (UI thread) -----
+    def drain(self, max_n: int = 64, budget_ms: float = 4.0) -> int:
+        """Dispatch up to max_n events, highest lane first, within budget_ms. Never blocks."""
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        n = 0
+        while n < max_n:
+            with self._lock:
+                evt, topic = self._pop()
+                if evt is None:
+                    break
+                handlers = self._subs.get(topic, []) + self._subs.get("*", [])
+            for h in handlers:
+                try:
+                    h(evt)
+                except Exception as e:
+                    self.handler_errors += 1
+                    print(f"[event_bus] ?? {topic} handler failed: {e}")
+            n += 1
+            if time.perf_counter() >= deadline:
+                break
+        self.dispatched += n
+        return n
+
+    def _pop(self) -> tuple[Optional[Event], str]:
+        for lane in self._lanes:
+            if lane:
+                topic, q = next(iter(lane.items()))
+                cell = q.items.popleft()
+                q.forget(cell)
+                evt = cell[0]
+                self._pending -= 1
+                del lane[topic]
+                if q.items:
+                    lane[topic] = q       # round-robin within the lane
+                return evt, topic
+        return None, ""
+
+    def wait(self, timeout: float) -> bool:
+        """Block until something is pending (for loops with nothing else to do)."""
+        with self._ready:
+            if not self._pending:
+                self._ready.wait(timeout)
+            return self._pending > 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def stats(self) -> dict:
+        with self._lock:
+            topics = {t: {"published": q.published, "dropped": q.dropped,
+                          "coalesced": q.coalesced, "queued": len(q.items)}
+                      for t, q in self._queues.items() if q.published}
+        return {"dispatched": self.dispatched, "pending": self._pending,
+                "handler_errors": self.handler_errors, "topics": topics}
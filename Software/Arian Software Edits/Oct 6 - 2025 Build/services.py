@@ -17,7 +17,6 @@
 from __future__ import annotations
 
 import os
-import queue
 from dataclasses import dataclass
 from types import SimpleNamespace
 from typing import Any, Optional
@@ -102,25 +101,17 @@ class DisplayProfile:
 
 
 # -------------------------------- EVENT BUS ----------------------------------
-# Tiny, thread-safe FIFO queue. Everything in the system talks by posting events.
+# Topic pub/sub with priority lanes (input > navigation > voice > telemetry)
+# and bounded per-topic queues; lives in event_bus.py.
 # Example events:
-#   {"type": "NAVIGATE", "payload": {"pane_id": "maps"}}
-#   {"type": "VOICE", "payload": {"text": "open bluetooth"}}
+#   Navigate(pane_id="maps")       bus.emit("NAVIGATE", pane_id="maps")
+#   Voice(text="open bluetooth")   bus.emit("VOICE", text="open bluetooth")
+# Consumers subscribe per topic and the UI loop calls bus.drain() each frame.
 
-class EventBus:
-    def __init__(self) -> None:
-        import threading
-        self._q: "queue.Queue[dict]" = queue.Queue()
-        self._lock = threading.Lock()
-
-    def emit(self, type_: str, **payload: Any) -> None:
-        self._q.put({"type": type_, "payload": payload})
-
-    def next(self, block: bool = False, timeout: float = 0.0) -> dict:
-        try:
-            return self._q.get(block=block, timeout=timeout)
-        except queue.Empty:
-            return {"type": "NOP", "payload": {}}
+try:
+    from .event_bus import EventBus
+except ImportError:   # flat layout (LauncherPane.py next to this file)
+    from event_bus import EventBus
 
 
 # ------------------------------ ASSET LOADER ---------------------------------
@@ -0,0 +1,158 @@
+"""
+CoverFlow sprite atlas
+- Pre-builds one opaque base sprite per icon for every size the flow curve
+  can reach; opacity and glow are applied later by the compositor
+- Runs on a worker thread at startup
+- Saved as one raw file + JSON index, keyed by icon content hash,
+  and memory-mapped on later boots (and right after a build, so the pages
+  are clean file cache the kernel can drop instead of private heap)
+"""
+
+import hashlib, json, os, threading, time
+import numpy as np
+from PIL import Image, ImageDraw
+
+ATLAS_VERSION = 2
+CACHE_DIR = os.environ.get("ARIES_CACHE_DIR",
+                           os.path.join(os.path.expanduser("~"), ".cache", "aries"))
+
+def quantize(size_px, size_step):
+    """size_q used as the CoverFlow sprite key."""
+    return max(14, int(round(size_px / size_step) * size_step))
+
+def flow_sizes(base_icon, scale_drop, size_step,
+               min_scale=0.70, max_dist=2.5, samples=5000):
+    """Every sprite size CoverFlow can ask for while an icon travels 0..max_dist slots."""
+    sizes = set()
+    for k in range(samples + 1):
+        dist  = max_dist * k / samples
+        scale = max(min_scale, 1.0 - scale_drop * dist)
+        sizes.add(quantize(int(base_icon * scale), size_step))
+    return sorted(sizes)
+
+_masks = {}
+def circle_mask(size):
+    m = _masks.get(size)
+    if m is None:
+        img = Image.new("L", (size, size), 0)
+        ImageDraw.Draw(img).ellipse((0, 0, size, size), fill=255)
+        m = _masks[size] = np.asarray(img) > 0
+    return m
+
+def circle_base(img, size):
+    """LANCZOS resize + circular cut, as an (s, s, 4) uint8 array."""
+    rgba = np.array(img.resize((size, size), Image.LANCZOS), dtype=np.uint8)
+    rgba[~circle_mask(size)] = 0
+    return rgba
+
+
+class SpriteAtlas:
+    """
+    Every CoverFlow base sprite in one contiguous uint8 buffer.
+
+        atlas = SpriteAtlas(apps, sizes)  # apps: [(id, PIL RGBA, path)]
+        atlas.start()                     # load from disk or build in background
+        view  = atlas.get("camera", 120)  # None until ready
+    """
+    def __init__(self, apps, sizes, cache_dir=CACHE_DIR):
+        self.apps = apps
+        self.sizes = list(sizes)
+        self.cache_dir = cache_dir
+        self.digest = self._digest()
+        self.path = os.path.join(cache_dir, f"coverflow-{self.digest}.bin")
+        self.index = {}            # (app_id, size_q) -> (offset, size_q)
+        self._data = None
+        self.ready = threading.Event()
+        self.loaded_from_disk = False
+        self.build_s = 0.0
+
+    # ----- lookup (any thread) -----
+    def get(self, app_id, size_q):
+        if not self.ready.is_set():
+            return None
+        ent = self.index.get((app_id, size_q))
+        if ent is None:
+            return None
+        off, s = ent
+        return self._data[off:off + s * s * 4].reshape(s, s, 4)
+
+    @property
+    def nbytes(self):
+        return 0 if self._data is None else self._data.nbytes
+
+    @property
+    def resident_bytes(self):
+        """Heap the atlas pins: 0 once it is memory-mapped from disk."""
+        return 0 if self._data is None or isinstance(self._data, np.memmap) else self._data.nbytes
+
+    # ----- build / load -----
+    def start(self):
+        threading.Thread(target=self._run, name="sprite-atlas", daemon=True).start()
+        return self
+
+    def _run(self):
+        try:
+            if not self._load():
+                self._build()
+        except Exception as e:
+            print(f"⚠️ sprite atlas unavailable: {e}")
+            return
+        self.ready.set()
+
+    def _digest(self):
+        h = hashlib.sha1(f"v{ATLAS_VERSION}|{self.sizes}".encode())
+        for app_id, img, path in self.apps:
+            h.update(app_id.encode())
+            try:
+                with open(path, "rb") as f:
+                    h.update(f.read())
+            except OSError:
+                h.update(img.tobytes())   # placeholder icon
+        return h.hexdigest()[:16]
+
+    def _layout(self):
+        index, off = {}, 0
+        for app_id, _img, _path in self.apps:
+            for s in self.sizes:
+                index[(app_id, s)] = (off, s)
+                off += s * s * 4
+        return index, off
+
+    def _load(self):
+        meta = self.path[:-4] + ".json"
+        if not (os.path.exists(self.path) and os.path.exists(meta)):
+            return False
+        with open(meta) as f:
+            entries = json.load(f)["entries"]
+        self.index = {tuple(k): tuple(v) for k, v in entries}
+        self._data = np.memmap(self.path, dtype=np.uint8, mode="r")
+        self.loaded_from_disk = True
+        return True
+
+    def _build(self):
+        t0 = time.perf_counter()
+        self.index, total = self._layout()
+        data = np.empty(total, np.uint8)
+        for app_id, img, _path in self.apps:
+            for s in self.sizes:
+                off, _ = self.index[(app_id, s)]
+                data[off:off + s * s * 4] = circle_base(img, s).ravel()
+        self._data = data
+        self.build_s = time.perf_counter() - t0
+        if self._save():
+            self._data = np.memmap(self.path, dtype=np.uint8, mode="r")
+
+    def _save(self):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = self.path + ".tmp"
+            self._data.tofile(tmp)
+            os.replace(tmp, self.path)
+            # the index goes last: _load() only trusts a .bin that has one
+            with open(self.path[:-4] + ".json", "w") as f:
+                json.dump({"version": ATLAS_VERSION,
+                           "entries": [[list(k), list(v)] for k, v in self.index.items()]}, f)
+            return True
+        except OSError as e:
+            print(f"⚠️ could not save sprite atlas: {e}")
+            return False
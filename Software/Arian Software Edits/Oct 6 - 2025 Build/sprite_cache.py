@@ -0,0 +1,84 @@
+"""
+Byte-budgeted sprite cache for CoverFlow
+- One cache shared by every app (replaces the unbounded per-app dicts)
+- CLOCK eviction (second-chance LRU approximation, O(1) on hits)
+- Pinned keys (the on-screen slots) are never evicted
+"""
+
+import time
+from collections import OrderedDict, deque
+
+
+class SpriteCache:
+    def __init__(self, budget_bytes, rate_window=5.0):
+        self.budget = int(budget_bytes)
+        self.bytes = 0
+        self._items = OrderedDict()     # key -> [value, nbytes, referenced]
+        self._pinned = frozenset()
+        self._evicted = set()           # keys we dropped, to spot rebuilds
+        self._rebuild_ts = deque()
+        self.rate_window = rate_window
+        self.hits = self.misses = self.evictions = self.rebuilds = 0
+
+    def get(self, key):
+        ent = self._items.get(key)
+        if ent is None:
+            self.misses += 1
+            return None
+        ent[2] = True
+        self.hits += 1
+        return ent[0]
+
+    def put(self, key, value, nbytes):
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        if key in self._evicted:
+            self._evicted.discard(key)
+            self.rebuilds += 1
+            self._rebuild_ts.append(time.monotonic())
+        self._items[key] = [value, nbytes, True]
+        self.bytes += nbytes
+        self._evict()
+        return value
+
+    def set_budget(self, budget_bytes):
+        """Change the budget (e.g. after charging memory held elsewhere) and evict to it."""
+        self.budget = int(budget_bytes)
+        self._evict()
+
+    def pin(self, keys):
+        """Replace the pinned set (e.g. the five visible slots)."""
+        self._pinned = frozenset(keys)
+
+    def _evict(self):
+        # CLOCK: the hand walks from the oldest entry; referenced or pinned
+        # entries get a second chance (moved behind the hand, bit cleared).
+        spins = 2 * len(self._items)
+        while self.bytes > self.budget and spins > 0:
+            spins -= 1
+            key, ent = self._items.popitem(last=False)
+            if ent[2] or key in self._pinned:
+                ent[2] = False
+                self._items[key] = ent
+                continue
+            self.bytes -= ent[1]
+            self.evictions += 1
+            self._evicted.add(key)
+            if len(self._evicted) > 4096:
+                self._evicted.clear()
+
+    def stats(self):
+        now = time.monotonic()
+        while self._rebuild_ts and now - self._rebuild_ts[0] > self.rate_window:
+            self._rebuild_ts.popleft()
+        return {
+            "bytes": self.bytes,
+            "budget": self.budget,
+            "entries": len(self._items),
+            "pinned": len(self._pinned),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "rebuilds_per_s": len(self._rebuild_ts) / self.rate_window,
+        }
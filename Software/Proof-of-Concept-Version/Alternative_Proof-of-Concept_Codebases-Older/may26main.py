@@ -15,7 +15,7 @@ from PyQt5.QtGui import (
     QPixmap, QPainter, QColor, QPainterPath, QFont
 )
 from PyQt5.QtCore import (
-    Qt, QTimer, QPropertyAnimation, QEasingCurve,
+    Qt, QTimer, QEasingCurve,
     QPointF, QRectF, pyqtProperty, QEvent
 )
 
@@ -23,6 +23,7 @@ from PyQt5.QtCore import (
 from camera import CameraFeed
 from floating_card import FloatingCard
 from assistant_pill import AssistantPillIcon
+import tween
 
 # Built-in panes
 from apps.settings_pane import SettingsPane
@@ -217,25 +218,20 @@ class CoverFlowLauncher(QGraphicsView):
             it.graphicsEffect().setEnabled(sel)
 
             if sel and animated:
-                shine = QPropertyAnimation(it, b"shine", self)
-                shine.setDuration(300)
-                shine.setKeyValueAt(0, 0.8)
-                shine.setKeyValueAt(0.5, 0.0)
-                shine.setEndValue(0.0)
-                shine.start()
+                # flash to 0.8 and fade out over the first half of 300 ms
+                tween.animate(it, "shine", 0.0, 150, start=0.8,
+                              easing=QEasingCurve.Linear)
 
             for prop, end in (
-                (b"pos", QPointF(x, mid_y)),
-                (b"scale", 1.4 if sel else 1.0),
+                ("pos", QPointF(x, mid_y)),
+                ("scale", 1.4 if sel else 1.0),
             ):
                 if animated:
-                    a = QPropertyAnimation(it, prop, self)
-                    a.setDuration(80)
-                    a.setEasingCurve(QEasingCurve.InOutCubic)
-                    a.setEndValue(end)
-                    a.start()
+                    # retargets an in-flight tween when the key is held
+                    tween.animate(it, prop, end, 80)
                 else:
-                    if prop == b"pos":
+                    tween.stop(it, prop)
+                    if prop == "pos":
                         it.setPos(end)
                     else:
                         it.setScale(end)
@@ -424,6 +420,7 @@ class VisionAriesUI(QMainWindow):
         super().resizeEvent(ev)
         r = self.rect()
         self.launcher.setGeometry(r)
+        tween.stop(self.pages, "geometry")
         self.pages.setGeometry(r)
         self.status.move(8, self.height() - self.status.height() - 80)
         self.pill_bg.move((self.width() - 56) // 2, self.height() - 72)
@@ -446,23 +443,12 @@ class VisionAriesUI(QMainWindow):
     def _slide_to(self, tgt):
         cur = self.pages.currentIndex()
         direction = 1 if tgt > cur else -1
-        w = self.width()
-        # animate out
-        anim_out = QPropertyAnimation(self.pages, b"geometry", self)
-        anim_out.setDuration(180)
-        anim_out.setEasingCurve(QEasingCurve.InOutCubic)
-        anim_out.setStartValue(self.pages.geometry())
-        anim_out.setEndValue(self.pages.geometry().translated(-direction * w, 0))
-        anim_out.start()
-        # switch page
+        home = self.rect()
+        # switch page, then slide it in from the side we are moving towards;
+        # a new slide mid-flight retargets the running geometry tween
         self.pages.setCurrentIndex(tgt)
-        # animate in
-        anim_in = QPropertyAnimation(self.pages, b"geometry", self)
-        anim_in.setDuration(180)
-        anim_in.setEasingCurve(QEasingCurve.InOutCubic)
-        anim_in.setStartValue(self.pages.geometry().translated(direction * w, 0))
-        anim_in.setEndValue(self.pages.geometry())
-        anim_in.start()
+        tween.animate(self.pages, "geometry", home, 180,
+                      start=home.translated(direction * home.width(), 0))
 
     def update_camera_feed(self, pixmap):
         if pixmap and not pixmap.isNull():
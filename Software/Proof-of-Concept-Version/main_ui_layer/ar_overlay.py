@@ -1,5 +1,5 @@
 # ar_overlay.py
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QObject, QRectF, Qt, pyqtSignal
 from PyQt5.QtGui import QPainter, QColor, QPen, QFont
 import cv2
 
@@ -7,16 +7,39 @@ class AROverlayManager(QObject):
     overlayUpdated = pyqtSignal(object)    # QPixmap
     commandReceived = pyqtSignal(str)
 
-    def __init__(self, camera_widget, ctx_assistant, parent=None):
+    def __init__(self, camera_widget, ctx_assistant, parent=None, tracker=None):
         super().__init__(parent)
         self.camera = camera_widget
         self.ctx = ctx_assistant
+        # newest TrackedObjects from the object tracker (normalised boxes)
+        self.tracks = []
+        if tracker is not None:
+            tracker.tracksUpdated.connect(self._on_tracks)
         # connect to frameOverlay for follow-me annotation
         self.ctx.frameOverlay.connect(self._on_frame)
 
+    def _on_tracks(self, tracks):
+        self.tracks = tracks
+
     def _on_frame(self, pixmap):
+        if self.tracks:
+            pixmap = pixmap.copy()
+            self._annotate(pixmap)
         # Emit directly back for main to update
         self.overlayUpdated.emit(pixmap)
 
+    def _annotate(self, pixmap):
+        """Box and '#id label' for each confirmed track; ids stay put across frames."""
+        w, h = pixmap.width(), pixmap.height()
+        p = QPainter(pixmap)
+        p.setPen(QPen(QColor(0, 255, 160, 220), 2))
+        p.setFont(QFont("Arial", 10))
+        for t in self.tracks:
+            x0, y0, x1, y1 = t.box
+            r = QRectF(x0 * w, y0 * h, (x1 - x0) * w, (y1 - y0) * h)
+            p.drawRect(r)
+            p.drawText(r.adjusted(4, 2, 0, 0), Qt.AlignLeft | Qt.AlignTop,
+                       f"#{t.track_id} {t.label}")
+        p.end()
+
     # Existing gesture or voice events can emit via commandReceived
-    # No extra QGraphicsScene drawing here, handled in main
\ No newline at end of file
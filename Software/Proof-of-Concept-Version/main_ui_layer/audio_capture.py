@@ -0,0 +1,196 @@
+# audio_capture.py
+
+import threading
+import time
+
+import numpy as np
+
+try:
+    import sounddevice as sd
+except Exception:
+    sd = None
+try:
+    import webrtcvad
+except Exception:
+    webrtcvad = None
+
+SAMPLE_RATE = 16000
+BLOCK = 320                  # 20 ms: a VAD frame, and small enough for early partials
+
+
+class AudioRing:
+    """
+    Single-writer ring of int16 samples, preallocated.
+
+    The writer (PortAudio's callback thread) copies a block in and then
+    advances `head`, a plain int, so it never takes a lock or waits on a
+    reader. Readers keep their own absolute sample cursor and copy out
+    whatever lies between it and `head`. A reader that falls more than the
+    ring's capacity behind skips forward to the oldest sample still held,
+    and the skip is counted in `overruns`.
+    """
+    def __init__(self, seconds=10.0, rate=SAMPLE_RATE):
+        self.rate = rate
+        self.size = int(seconds * rate)
+        self._buf = np.zeros(self.size, np.int16)
+        self.head = 0                    # total samples ever written
+        self.head_ts = 0.0               # monotonic time of the newest sample
+        self.overruns = 0
+        self._new = threading.Event()
+
+    def write(self, samples):
+        n = len(samples)
+        if n >= self.size:
+            samples, n = samples[-self.size:], self.size
+        i = self.head % self.size
+        k = min(n, self.size - i)
+        self._buf[i:i + k] = samples[:k]
+        self._buf[:n - k] = samples[k:]
+        self.head += n                   # publish only after the copy
+        self.head_ts = time.monotonic()
+        self._new.set()
+
+    def read(self, cursor, max_n=None):
+        """(samples, new_cursor) from `cursor` up to the head (or max_n samples)."""
+        head = self.head
+        if head - cursor > self.size:
+            self.overruns += 1
+            cursor = head - self.size
+        n = head - cursor
+        if max_n is not None:
+            n = min(n, max_n)
+        if n <= 0:
+            return np.empty(0, np.int16), cursor
+        i = cursor % self.size
+        k = min(n, self.size - i)
+        out = np.concatenate((self._buf[i:i + k], self._buf[:n - k])) if k < n \
+            else self._buf[i:i + n].copy()
+        return out, cursor + n
+
+    def cursor(self, preroll_s=0.0):
+        """A reader cursor at the head, or `preroll_s` seconds before it."""
+        return max(0, self.head - int(preroll_s * self.rate))
+
+    def wait(self, cursor, timeout):
+        """Block until samples past `cursor` exist (or timeout)."""
+        if self.head > cursor:
+            return True
+        self._new.clear()
+        if self.head > cursor:
+            return True
+        return self._new.wait(timeout)
+
+
+class AudioCapture:
+    """
+    One always-open 16 kHz mono input stream feeding an AudioRing in
+    BLOCK-sized pieces. Opening PortAudio takes far longer than a spoken
+    word, so the stream stays open and listeners just take a cursor
+    (with some preroll, so the first syllable before a trigger is kept).
+    """
+    def __init__(self, rate=SAMPLE_RATE, block=BLOCK, seconds=10.0, device=None):
+        self.rate = rate
+        self.block = block
+        self.device = device
+        self.ring = AudioRing(seconds, rate)
+        self.stream = None
+        self.status_errors = 0
+
+    def start(self):
+        if self.stream is not None:
+            return True
+        if sd is None:
+            print("⚠️ AudioCapture: sounddevice not available")
+            return False
+        try:
+            self.stream = sd.RawInputStream(
+                samplerate=self.rate, blocksize=self.block, device=self.device,
+                dtype="int16", channels=1, callback=self._callback)
+            self.stream.start()
+        except Exception as e:
+            print(f"⚠️ AudioCapture failed to open the mic: {e}")
+            self.stream = None
+            return False
+        return True
+
+    def _callback(self, indata, frames, time_info, status):
+        if status:
+            self.status_errors += 1
+        self.ring.write(np.frombuffer(indata, np.int16))
+
+    def stop(self):
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream.close()
+            self.stream = None
+
+    @property
+    def running(self):
+        return self.stream is not None
+
+
+class Endpointer:
+    """
+    Voice-activity endpointing on BLOCK-sized frames.
+
+    Uses webrtcvad when installed, otherwise an energy gate whose threshold
+    tracks the noise floor. Speech starts after `start_ms` of voiced frames
+    and ends after `hangover_ms` of unvoiced ones (or at `max_s`).
+    """
+    def __init__(self, rate=SAMPLE_RATE, block=BLOCK, aggressiveness=2,
+                 start_ms=60, hangover_ms=600, max_s=8.0, energy_ratio=3.0):
+        self.rate, self.block = rate, block
+        self.frame_ms = 1000.0 * block / rate
+        self.start_frames = max(1, int(start_ms / self.frame_ms))
+        self.hang_frames = max(1, int(hangover_ms / self.frame_ms))
+        self.max_frames = int(max_s * 1000 / self.frame_ms)
+        self.energy_ratio = energy_ratio
+        self.vad = webrtcvad.Vad(aggressiveness) if webrtcvad is not None else None
+        self.noise = None
+        self.reset()
+
+    def reset(self):
+        self.in_speech = False
+        self._voiced = self._silent = self._frames = 0
+
+    def is_voiced(self, frame):
+        if self.vad is not None:
+            return self.vad.is_speech(frame.tobytes(), self.rate)
+        rms = float(np.sqrt(np.mean(frame.astype(np.float32) ** 2))) + 1.0
+        if self.noise is None:
+            self.noise = rms
+        voiced = rms > self.noise * self.energy_ratio
+        if not voiced:
+            self.noise += (rms - self.noise) * 0.05     # follow the room, not the talker
+        return voiced
+
+    def push(self, frame):
+        """Feed one frame. Returns "start", "end" or None."""
+        voiced = self.is_voiced(frame)
+        if not self.in_speech:
+            self._voiced = self._voiced + 1 if voiced else 0
+            if self._voiced >= self.start_frames:
+                self.in_speech = True
+                self._silent = self._frames = 0
+                return "start"
+            return None
+        self._frames += 1
+        self._silent = 0 if voiced else self._silent + 1
+        if self._silent >= self.hang_frames or self._frames >= self.max_frames:
+            self.reset()
+            return "end"
+        return None
+
+
+_SHARED = None
+_SHARED_LOCK = threading.Lock()
+
+
+def shared():
+    """The process-wide capture stream, opened on first use."""
+    global _SHARED
+    with _SHARED_LOCK:
+        if _SHARED is None:
+            _SHARED = AudioCapture()
+        _SHARED.start()
+        return _SHARED
@@ -0,0 +1,168 @@
+# boot_timeline.py
+
+import builtins
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import psutil
+    _PROC = psutil.Process()
+except Exception:
+    _PROC = None
+
+
+def _rss() -> int:
+    """Resident set size in bytes (psutil, else /proc, else 0)."""
+    if _PROC is not None:
+        try:
+            return _PROC.memory_info().rss
+        except Exception:
+            pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        return 0
+
+
+class BootTimeline:
+    """
+    Records boot phases (wall time, process CPU time, time spent importing,
+    RSS delta, modules loaded) and writes them as a Chrome trace
+    (chrome://tracing or ui.perfetto.dev) plus a one-line summary.
+
+        with BOOT.phase("camera.open"):
+            self.camera = CameraFeed()
+
+    Import timing wraps builtins.__import__ until finish() is called. A
+    process that never gets that far (headless, no camera) is unhooked
+    after `timeout` seconds (ARIES_BOOT_TIMEOUT, default 60) anyway.
+    """
+    def __init__(self, path=None, timeout=None):
+        self.t0 = time.perf_counter()
+        self.cpu0 = time.process_time()
+        self.rss0 = _rss()
+        self.path = path or os.environ.get("ARIES_BOOT_TRACE", "boot_trace.json")
+        self.events = []
+        self.import_s = 0.0
+        self.end = None
+        self._stack = []
+        self._main = threading.main_thread()
+        self._import_depth = 0
+        self._orig_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+        if timeout is None:
+            timeout = float(os.environ.get("ARIES_BOOT_TIMEOUT", "60"))
+        self._timer = threading.Timer(timeout, self._expire)
+        self._timer.daemon = True
+        self._timer.start()
+
+    # ----- import accounting --------------------------------------------------
+
+    def _timed_import(self, *args, **kwargs):
+        # only the outermost import on the main thread is timed, so nested
+        # imports are not double counted
+        if threading.current_thread() is not self._main:
+            return self._orig_import(*args, **kwargs)
+        self._import_depth += 1
+        t = time.perf_counter()
+        try:
+            return self._orig_import(*args, **kwargs)
+        finally:
+            self._import_depth -= 1
+            if self._import_depth == 0:
+                self.import_s += time.perf_counter() - t
+
+    def _unhook(self):
+        self._timer.cancel()
+        if builtins.__import__ == self._timed_import:
+            builtins.__import__ = self._orig_import
+
+    def _expire(self):
+        # boot never finished: stop taxing every later import, keep the events
+        if self.end is None and builtins.__import__ == self._timed_import:
+            self.mark("boot_timeout")
+            self._unhook()
+
+    # ----- recording ----------------------------------------------------------
+
+    @contextmanager
+    def phase(self, name: str, cat: str = "boot"):
+        """Time the enclosed block as one trace slice."""
+        start = (time.perf_counter(), time.process_time(), self.import_s,
+                 _rss(), len(sys.modules))
+        frame = {"children": False}
+        if self._stack:
+            self._stack[-1]["children"] = True
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            wall, cpu, imp, rss, mods = start
+            now = time.perf_counter()
+            self.events.append({
+                "name": name, "cat": cat, "ph": "X",
+                "ts": (wall - self.t0) * 1e6,
+                "dur": (now - wall) * 1e6,
+                "pid": os.getpid(), "tid": threading.get_ident(),
+                "args": {
+                    "cpu_ms": round((time.process_time() - cpu) * 1e3, 2),
+                    "import_ms": round((self.import_s - imp) * 1e3, 2),
+                    "rss_delta_kb": (_rss() - rss) // 1024,
+                    "modules_loaded": len(sys.modules) - mods,
+                    "leaf": not frame["children"],
+                },
+            })
+
+    def mark(self, name: str):
+        """Instant event, e.g. the first camera frame."""
+        self.events.append({
+            "name": name, "cat": "boot", "ph": "i", "s": "g",
+            "ts": (time.perf_counter() - self.t0) * 1e6,
+            "pid": os.getpid(), "tid": threading.get_ident(),
+        })
+
+    def finish(self, name: str = "first_frame") -> str:
+        """Close the boot window, stop import accounting and save the trace."""
+        if self.end is None:
+            self.mark(name)
+            self.end = (time.perf_counter() - self.t0,
+                        time.process_time() - self.cpu0,
+                        _rss() - self.rss0)
+            self._unhook()
+        self.save()
+        return self.summary()
+
+    # ----- output -------------------------------------------------------------
+
+    def save(self, path=None):
+        """Write the Chrome-trace JSON. Safe to call again as phases arrive."""
+        path = path or self.path
+        try:
+            with open(path, "w") as f:
+                json.dump({"traceEvents": self.events,
+                           "displayTimeUnit": "ms"}, f)
+        except OSError as e:
+            print(f"⚠️ BootTimeline failed to write {path}: {e}")
+
+    def summary(self) -> str:
+        wall, cpu, rss = self.end or (time.perf_counter() - self.t0,
+                                      time.process_time() - self.cpu0,
+                                      _rss() - self.rss0)
+        leaves = [e for e in self.events
+                  if e["ph"] == "X" and e["args"]["leaf"]]
+        txt = (f"Boot {wall:.2f}s · CPU {cpu:.2f}s · "
+               f"imports {self.import_s:.2f}s · RSS +{rss / 2**20:.0f}MB")
+        if leaves:
+            worst = max(leaves, key=lambda e: e["dur"])
+            txt += f" · slowest {worst['name']} {worst['dur'] / 1e3:.0f}ms"
+        return txt
+
+
+# Process-wide timeline, started as early as this module is imported.
+BOOT = BootTimeline()
@@ -2,52 +2,108 @@ import cv2
 import numpy as np
 from PyQt5.QtWidgets import QLabel
 from PyQt5.QtGui import QImage, QPixmap, QPainter
-from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtCore import QTimer, QRect, Qt, pyqtSignal
+from PyQt5 import sip
+
+from capture_ring import CaptureThread
+from frame_bus import FrameBus
+from frame_scheduler import invalidate
+
+# Qt >= 5.14 can wrap OpenCV's BGR buffers directly
+HAS_BGR888 = hasattr(QImage, "Format_BGR888")
 
 class CameraFeed(QLabel):
-    def __init__(self, parent=None):
+    """
+    Live camera view. Frames are captured on a background thread into a
+    ring of preallocated buffers (see capture_ring.py); the GUI thread only
+    wraps the newest slot in a QImage and lets the painter scale it.
+
+    Consumers should subscribe on `frames` (a FrameBus) for the format and
+    size they need, or call latest() for the raw read-only BGR view, instead
+    of going through pixmap().
+    """
+    SMOOTH = False   # bilinear scaling costs too much on the Radxa GPU path
+
+    firstFrame = pyqtSignal(float)   # monotonic timestamp of the first shown frame
+    frameArrived = pyqtSignal(int)   # seq of each new frame, at the camera's own pace
+
+    def __init__(self, parent=None, slots=4):
         super().__init__(parent)
-        self.cap = cv2.VideoCapture(0)
-        if not self.cap.isOpened():
-            print("Error: Could not open camera at index 0. Trying index 1...")
-            self.cap = cv2.VideoCapture(1)
-            if not self.cap.isOpened():
-                print("Error: No camera available.")
-                self.image = QImage()
-                return
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 960)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 540)
         self.image = QImage()
+        self._seq = 0
+        self._rgb = None
+        self._target = QRect()
+
+        self.capture = CaptureThread(960, 540, slots=slots)
+        self.frames = FrameBus(self)
+        if not self.capture.isOpened():
+            return
+        self.capture.start()
 
         timer = QTimer(self)
         timer.timeout.connect(self.update_frame)
         timer.start(1000 // 30)
 
+    def latest(self):
+        """Newest FrameSlot (index, seq, ts, read-only BGR frame) or None."""
+        return self.capture.latest()
+
+    def wait(self, after_seq=0, timeout=None):
+        """Block until a newer frame arrives; for worker threads only."""
+        if not self.capture.isOpened():
+            return None
+        return self.capture.wait(after_seq, timeout)
+
     def update_frame(self):
-        ret, frame = self.cap.read()
-        if ret:
-            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = frame.shape
-            bytes_per_line = ch * w
-            self.image = QImage(frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
-            pixmap = QPixmap.fromImage(self.image)
-            if not pixmap.isNull():
-                self.setPixmap(pixmap.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
-            else:
-                print("Error: Failed to convert QImage to QPixmap")
+        slot = self.capture.latest()
+        if slot is None or slot.seq == self._seq:
+            return
+        first = self._seq == 0
+        self._seq = slot.seq
+        size_changed = (self.image.width(), self.image.height()) != slot.frame.shape[1::-1]
+        self.image = self._wrap(slot.frame)
+        if size_changed:
+            self._target = self._fit_rect()
+            invalidate(self)
         else:
-            print("Error: Failed to capture frame.")
+            invalidate(self, self._target)
+        if first:
+            self.firstFrame.emit(slot.ts)
+        self.frameArrived.emit(slot.seq)
+
+    def _wrap(self, frame):
+        h, w = frame.shape[:2]
+        if HAS_BGR888:
+            ptr = sip.voidptr(frame.ctypes.data)
+            return QImage(ptr, w, h, frame.strides[0], QImage.Format_BGR888)
+        if self._rgb is None or self._rgb.shape != frame.shape:
+            self._rgb = np.empty_like(frame)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        ptr = sip.voidptr(self._rgb.ctypes.data)
+        return QImage(ptr, w, h, self._rgb.strides[0], QImage.Format_RGB888)
+
+    def _fit_rect(self):
+        if self.image.isNull():
+            return QRect()
+        size = self.image.size().scaled(self.size(), Qt.KeepAspectRatio)
+        return QRect(0, 0, size.width(), size.height())
 
     def pixmap(self):
         return QPixmap.fromImage(self.image) if not self.image.isNull() else None
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._target = self._fit_rect()
+
     def paintEvent(self, event):
         if not self.image.isNull():
-            pixmap = QPixmap.fromImage(self.image).scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
             painter = QPainter(self)
-            painter.drawPixmap(0, 0, pixmap)
+            painter.setRenderHint(QPainter.SmoothPixmapTransform, self.SMOOTH)
+            painter.drawImage(self._target, self.image)
+
+    def stop(self):
+        self.capture.stop()
 
     def closeEvent(self, event):
-        if self.cap.isOpened():
-            self.cap.release()
-        super().closeEvent(event)
\ No newline at end of file
+        self.stop()
+        super().closeEvent(event)
@@ -0,0 +1,189 @@
+# capture_ring.py
+
+import threading
+import time
+from collections import namedtuple
+
+import cv2
+import numpy as np
+
+# One committed frame. `frame` is a read-only view into the ring's storage,
+# so it stays valid only until the writer laps around to `index` again.
+FrameSlot = namedtuple("FrameSlot", "index seq ts frame")
+
+
+class FrameRing:
+    """
+    Fixed ring of preallocated frame buffers with one writer (the capture
+    thread) and any number of readers.
+
+    Readers get read-only views of the newest committed slot, so nothing is
+    allocated or copied per frame. A slot is recycled after `slots - 1` newer
+    frames; consumers that hold a view longer than that should check
+    `is_current()` or copy what they need.
+    """
+    def __init__(self, shape, slots: int = 4, dtype=np.uint8):
+        if slots < 3:
+            raise ValueError("FrameRing needs at least 3 slots")
+        self.shape = tuple(shape)
+        self.slots = slots
+        self._bufs = np.zeros((slots,) + self.shape, dtype=dtype)
+        self._views = []
+        for buf in self._bufs:
+            view = buf.view()
+            view.flags.writeable = False
+            self._views.append(view)
+        self._seq = [0] * slots
+        self._ts = [0.0] * slots
+        self._head = -1
+        self._next_seq = 1
+        self._cond = threading.Condition()
+
+    def write_buffer(self):
+        """
+        Return (index, writable buffer) for the slot after the head.
+        The slot is invalidated first so stale readers can tell it was reused.
+        """
+        idx = (self._head + 1) % self.slots
+        with self._cond:
+            self._seq[idx] = 0
+        return idx, self._bufs[idx]
+
+    def commit(self, idx: int, ts: float) -> int:
+        """Publish slot `idx` as the newest frame. Returns its sequence number."""
+        with self._cond:
+            seq = self._next_seq
+            self._next_seq += 1
+            self._seq[idx] = seq
+            self._ts[idx] = ts
+            self._head = idx
+            self._cond.notify_all()
+        return seq
+
+    def latest(self):
+        """Newest committed FrameSlot, or None before the first frame."""
+        with self._cond:
+            return self._latest_locked()
+
+    def wait(self, after_seq: int = 0, timeout=None):
+        """Block until a frame newer than `after_seq` is committed."""
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._head >= 0 and self._seq[self._head] > after_seq,
+                timeout)
+            return self._latest_locked()
+
+    def is_current(self, slot) -> bool:
+        """True while `slot` has not been recycled by the writer."""
+        return self._seq[slot.index] == slot.seq
+
+    def _latest_locked(self):
+        idx = self._head
+        if idx < 0:
+            return None
+        return FrameSlot(idx, self._seq[idx], self._ts[idx], self._views[idx])
+
+
+class CaptureThread(threading.Thread):
+    """
+    Reads the camera on a dedicated thread straight into a FrameRing.
+    The ring is sized from the first frame the driver actually delivers,
+    since many UVC cameras ignore the requested resolution.
+    """
+    def __init__(self, width: int = 960, height: int = 540,
+                 slots: int = 4, devices=(0, 1)):
+        super().__init__(name="capture", daemon=True)
+        self.slots = slots
+        self.ring = None
+        self.ready = threading.Event()
+        self.fps = 0.0
+        self.failures = 0
+        self._running = False
+
+        self.cap = None
+        for i, dev in enumerate(devices):
+            cap = cv2.VideoCapture(dev)
+            if cap.isOpened():
+                self.cap = cap
+                break
+            cap.release()
+            if i + 1 < len(devices):
+                print(f"Error: Could not open camera at index {dev}. "
+                      f"Trying index {devices[i + 1]}...")
+        if self.cap is None:
+            print("Error: No camera available.")
+            return
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+
+    def isOpened(self) -> bool:
+        return self.cap is not None
+
+    def start(self):
+        if not self.isOpened():
+            return
+        self._running = True
+        super().start()
+
+    def latest(self):
+        return self.ring.latest() if self.ring is not None else None
+
+    def wait(self, after_seq: int = 0, timeout=None):
+        """Block until a frame newer than `after_seq` exists (or timeout)."""
+        if self.ring is None and not self.ready.wait(timeout):
+            return None
+        return self.ring.wait(after_seq, timeout)
+
+    def run(self):
+        try:
+            self._run()
+        finally:
+            self.cap.release()
+
+    def _run(self):
+        frame = None
+        while self._running and frame is None:
+            ok, frame = self.cap.read()
+            if not ok:
+                frame = None
+                self._fail()
+        if frame is None:
+            return
+
+        self.ring = FrameRing(frame.shape, self.slots, frame.dtype)
+        idx, buf = self.ring.write_buffer()
+        np.copyto(buf, frame)
+        self.ring.commit(idx, time.monotonic())
+        self.ready.set()
+
+        h, w = frame.shape[:2]
+        last = time.monotonic()
+        while self._running:
+            idx, buf = self.ring.write_buffer()
+            ok, out = self.cap.read(buf)
+            if not ok:
+                self._fail()
+                continue
+            if not np.shares_memory(out, buf):
+                # driver handed back its own buffer (format/size change)
+                if out.shape == buf.shape:
+                    np.copyto(buf, out)
+                else:
+                    cv2.resize(out, (w, h), dst=buf)
+            now = time.monotonic()
+            self.ring.commit(idx, now)
+            self.fps += 0.1 * (1.0 / max(now - last, 1e-3) - self.fps)
+            last = now
+
+    def _fail(self):
+        if self.failures == 0:
+            print("Error: Failed to capture frame.")
+        self.failures += 1
+        time.sleep(0.01)
+
+    def stop(self):
+        self._running = False
+        if self.is_alive():
+            self.join(timeout=1.0)
+        elif self.cap is not None:
+            self.cap.release()
@@ -6,13 +6,19 @@ import time
 from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 from PyQt5.QtGui import QPixmap
 
+import inference_scheduler
+
 class ContextualAssistant(QObject):
     # emits every time we want to overlay a new camera frame
     frameOverlay = pyqtSignal(QPixmap)
+    # emits the raw FrameSlot (read-only BGR numpy view) for new frames
+    frameReady = pyqtSignal(object)
     # emits text suggestions / notifications
     suggestionReady = pyqtSignal(str)
     # emits (command, response) when voice is processed
     voiceCommandProcessed = pyqtSignal(str, str)
+    # emits the running hypothesis while the user is still speaking
+    voicePartial = pyqtSignal(str)
 
     def __init__(self, camera_widget):
         """
@@ -20,37 +26,74 @@ class ContextualAssistant(QObject):
         """
         super().__init__()
         self.camera = camera_widget
+        self._last_seq = 0
+        self._running = False
+        self.voice = None      # VoiceManager, loaded on the first mic press
 
-        # fire a timer to grab whatever pixmap the camera is currently showing
-        self._timer = QTimer(self)
-        self._timer.setInterval(100)   # 10fps
-        self._timer.timeout.connect(self._grab_and_emit)
-        # note: .start() is called in main.py
+        # offered every camera frame; the inference scheduler decides how many
+        # get relayed (10 fps when there is headroom, fewer under load)
+        self.sched = inference_scheduler.get()
+        self.sched.declare("assistant", rate_hz=10, priority=2)
+        self.camera.frameArrived.connect(self._grab_and_emit)
+        # note: .start() is called in vision_aries_ui.py
 
-    def _grab_and_emit(self):
-        """Pull the current QPixmap from the camera widget and re-emit it."""
+    def _grab_and_emit(self, _seq=None):
+        """Relay the newest camera frame, skipping frames the scheduler doesn't want."""
+        if not self._running or not self.sched.due("assistant"):
+            return
         try:
-            pix = self.camera.pixmap()
-            if isinstance(pix, QPixmap) and not pix.isNull():
-                self.frameOverlay.emit(pix)
+            slot = self.camera.latest()
+            if slot is None or slot.seq == self._last_seq:
+                return
+            self._last_seq = slot.seq
+            # frameReady slots run synchronously, so this times the consumers too
+            t0 = time.perf_counter()
+            self.frameReady.emit(slot)
+            # only build a QPixmap when someone still listens for one
+            if self.receivers(self.frameOverlay) > 0:
+                pix = self.camera.pixmap()
+                if isinstance(pix, QPixmap) and not pix.isNull():
+                    self.frameOverlay.emit(pix)
+            self.sched.report("assistant", (time.perf_counter() - t0) * 1000.0)
         except Exception:
-            # camera widget may not have .pixmap() yet
+            # camera widget may not have a frame yet
             pass
 
     def start(self):
         """Begin relaying frames."""
-        self._timer.start()
+        self._running = True
 
     def stop(self):
-        """Stop relaying frames."""
-        self._timer.stop()
+        """Stop relaying frames (and any utterance in progress)."""
+        self._running = False
+        if self.voice:
+            self.voice.stop()
 
     def process_voice_command(self):
         """
-        Stub for voice-command processing.
-        You can replace this with actual Vosk/TTS calls later.
+        Listen for one utterance with Vosk (partials stream out as
+        voicePartial). Falls back to a canned response when no model or
+        mic is available.
         """
-        # for now, immediately echo back a canned response
+        if self.voice is None:
+            try:
+                from voice_manager import VoiceManager
+                vm = VoiceManager()
+            except Exception as e:
+                print(f"⚠️ voice unavailable: {e}")
+                vm = None
+            if vm is not None and vm.rec is not None:
+                vm.partialResult.connect(self.voicePartial)
+                vm.commandRecognized.connect(
+                    lambda text: self.voiceCommandProcessed.emit(text, ""))
+                self.voice = vm
+            else:
+                self.voice = False
+        if self.voice:
+            self.voice.start_listening()
+            return
+
+        # no recogniser: immediately echo back a canned response
         cmd = "Aries, hello"
         resp = "Hello, visionary."
         # emit exactly after a brief pause to simulate work
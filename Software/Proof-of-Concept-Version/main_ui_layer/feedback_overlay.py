@@ -2,10 +2,17 @@ from PyQt5.QtCore import QObject, pyqtSignal
 
 class FeedbackOverlay(QObject):
     suggestionReady = pyqtSignal(str)
-    def __init__(self, ctx_assistant, parent=None):
+    def __init__(self, ctx_assistant, parent=None, tracker=None):
         super().__init__(parent)
+        # one suggestion per tracked object (by track id), not per frame
+        if tracker is not None:
+            tracker.trackAppeared.connect(self._on_track)
         # on objectDetected, emit suggestion
-        ctx_assistant.objectDetected.connect(self._suggest)
+        if hasattr(ctx_assistant, "objectDetected"):
+            ctx_assistant.objectDetected.connect(self._suggest)
+
+    def _on_track(self, track_id, label):
+        self._suggest(label)
 
     def _suggest(self, label):
         # basic feedback
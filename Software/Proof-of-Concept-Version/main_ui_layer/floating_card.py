@@ -2,6 +2,8 @@ from PyQt5.QtWidgets import QWidget, QLabel, QGraphicsDropShadowEffect, QGraphic
 from PyQt5.QtGui import QPainter, QColor, QFont
 from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve, QTimer
 
+from frame_scheduler import track
+
 class FloatingCard(QWidget):
     """
     A translucent, frosted notification card with drop shadow,
@@ -70,6 +72,7 @@ class FloatingCard(QWidget):
         fade_in.setStartValue(0.0)
         fade_in.setEndValue(1.0)
         fade_in.setEasingCurve(QEasingCurve.OutCubic)
+        track(fade_in, self)
         fade_in.start()
 
         # Schedule fade out
@@ -81,5 +84,6 @@ class FloatingCard(QWidget):
         fade_out.setStartValue(1.0)
         fade_out.setEndValue(0.0)
         fade_out.setEasingCurve(QEasingCurve.InCubic)
+        track(fade_out, self)
         fade_out.start()
         fade_out.finished.connect(self.hide)
@@ -0,0 +1,175 @@
+# frame_bus.py
+
+import threading
+import time
+from collections import namedtuple
+
+import cv2
+import numpy as np
+
+BGR, RGB, GRAY = "bgr", "rgb", "gray"
+
+_CONVERT = {
+    RGB: cv2.COLOR_BGR2RGB,
+    GRAY: cv2.COLOR_BGR2GRAY,
+}
+
+# One converted frame handed to a subscriber. `frame` is a shared read-only
+# view; copy it if you need to keep it for longer than a frame or two.
+BusFrame = namedtuple("BusFrame", "seq ts frame")
+
+
+class _Entry:
+    """Cached conversion for one (format, size) key, double-buffered."""
+    __slots__ = ("seq", "ts", "bufs", "views", "flip")
+
+    def __init__(self):
+        self.seq = 0
+        self.ts = 0.0
+        self.bufs = None
+        self.views = None
+        self.flip = 0
+
+
+class Subscription:
+    """
+    A consumer's view of the bus: fixed format/size plus a rate cap.
+    poll() is non-blocking (for QTimer consumers), wait() is for threads.
+    """
+    def __init__(self, bus, fmt, size, max_fps):
+        self.bus = bus
+        self.key = (fmt, tuple(size) if size else None)
+        self.min_interval = 1.0 / max_fps if max_fps else 0.0
+        self.last_seq = 0
+        self._last_ts = 0.0
+
+    def poll(self):
+        """Return a new BusFrame, or None if nothing new / rate-limited."""
+        now = time.monotonic()
+        if now - self._last_ts < self.min_interval:
+            return None
+        frame = self.bus.get(*self.key)
+        if frame is None or frame.seq == self.last_seq:
+            return None
+        self.last_seq = frame.seq
+        self._last_ts = now
+        return frame
+
+    def wait(self, timeout: float = 1.0):
+        """Block (off the GUI thread) until poll() has something, or timeout."""
+        deadline = time.monotonic() + timeout
+        while True:
+            frame = self.poll()
+            if frame is not None:
+                return frame
+            left = deadline - time.monotonic()
+            if left <= 0:
+                return None
+            pause = self.min_interval - (time.monotonic() - self._last_ts)
+            if pause > 0:
+                time.sleep(min(pause, left))
+            else:
+                self.bus.wait(self.last_seq, left)
+
+    def close(self):
+        self.bus.unsubscribe(self)
+
+
+class FrameBus:
+    """
+    Shares camera frames between consumers.
+
+    Each (format, size) key is converted at most once per camera frame and
+    cached until the next sequence number, so five subscribers asking for
+    the same thing cost one cvtColor/resize instead of five.
+
+    source: anything with latest() -> FrameSlot(index, seq, ts, BGR frame),
+            e.g. CameraFeed or CaptureThread. An optional wait(after_seq,
+            timeout) lets threaded consumers sleep instead of spinning.
+    """
+    def __init__(self, source):
+        self.source = source
+        self.subscribers = []
+        self.conversions = 0
+        self.hits = 0
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, fmt: str = BGR, size=None, max_fps=None) -> Subscription:
+        if fmt not in (BGR, RGB, GRAY):
+            raise ValueError(f"unknown frame format: {fmt}")
+        sub = Subscription(self, fmt, size, max_fps)
+        with self._lock:
+            self.subscribers.append(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription):
+        with self._lock:
+            if sub in self.subscribers:
+                self.subscribers.remove(sub)
+
+    def wait(self, after_seq: int, timeout: float):
+        waiter = getattr(self.source, "wait", None)
+        if waiter is not None:
+            waiter(after_seq, timeout)
+        else:
+            time.sleep(min(timeout, 0.01))
+
+    def get(self, fmt: str = BGR, size=None):
+        """Newest frame in the requested format/size as a BusFrame, or None."""
+        slot = self.source.latest()
+        if slot is None:
+            return None
+        with self._lock:
+            return self._get(slot, fmt, tuple(size) if size else None)
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": len(self.subscribers),
+            "keys": len(self._cache),
+            "conversions": self.conversions,
+            "hits": self.hits,
+        }
+
+    def _get(self, slot, fmt, size):
+        src = slot.frame
+        if size == src.shape[1::-1]:
+            size = None
+        if fmt == BGR and size is None:
+            # native camera format: hand out the ring view itself
+            return BusFrame(slot.seq, slot.ts, src)
+
+        key = (fmt, size)
+        entry = self._cache.get(key)
+        if entry is None:
+            entry = self._cache[key] = _Entry()
+        if entry.seq == slot.seq:
+            self.hits += 1
+            return BusFrame(entry.seq, entry.ts, entry.views[entry.flip])
+
+        if size is not None and fmt != BGR:
+            # colour-convert from the cached resize so sizes are shared too
+            src = self._get(slot, BGR, size).frame
+
+        w, h = size if size is not None else src.shape[1::-1]
+        shape = (h, w) if fmt == GRAY else (h, w, 3)
+        if entry.bufs is None or entry.bufs[0].shape != shape:
+            entry.bufs = [np.empty(shape, np.uint8) for _ in range(2)]
+            entry.views = []
+            for buf in entry.bufs:
+                view = buf.view()
+                view.flags.writeable = False
+                entry.views.append(view)
+
+        # write into the buffer readers are not currently looking at
+        flip = entry.flip ^ 1
+        dst = entry.bufs[flip]
+        if fmt == BGR:
+            cv2.resize(src, (w, h), dst=dst, interpolation=cv2.INTER_AREA)
+        else:
+            cv2.cvtColor(src, _CONVERT[fmt], dst=dst)
+        entry.flip = flip
+        entry.seq = slot.seq
+        entry.ts = slot.ts
+        self.conversions += 1
+        return BusFrame(entry.seq, entry.ts, entry.views[flip])
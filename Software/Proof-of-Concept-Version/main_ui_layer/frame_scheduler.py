@@ -0,0 +1,164 @@
+# frame_scheduler.py
+
+import math
+import time
+
+from PyQt5.QtCore import QObject, QTimer, QEvent, Qt
+from PyQt5.QtGui import QRegion
+
+
+class FrameScheduler(QObject):
+    """
+    Render-on-change replacement for a fixed repaint timer.
+
+    Widgets report what changed with invalidate(widget, rect). The scheduler
+    wakes on the next vsync-aligned tick, hands all dirty regions to Qt in
+    one batch (so they land in a single window update) and stops ticking as
+    soon as nothing is dirty and no tracked animation is running.
+
+        SCHED = install(window)
+        invalidate(camera, camera.rect())
+        track(QPropertyAnimation(card, b"windowOpacity"), card)
+    """
+    def __init__(self, window, hz=60):
+        super().__init__(window)
+        self.window = window
+        self.period = 1.0 / hz
+        self._t0 = time.perf_counter()
+        self._dirty = {}              # widget -> QRegion, or None for all
+        self._anims = set()
+        self._last_tick = None
+        self._in_paint = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+
+        # stats
+        self.frames = 0
+        self.skipped = 0
+        self._paint_s = 0.0
+        self._paint_max = 0.0
+        self._paints = 0
+
+        window.installEventFilter(self)
+
+    # ----- producers ----------------------------------------------------------
+
+    def invalidate(self, widget, rect=None):
+        """Mark `rect` of `widget` (or all of it) for the next frame."""
+        if widget in self._dirty:
+            region = self._dirty[widget]
+            if region is not None and rect is not None:
+                self._dirty[widget] = region.united(QRegion(rect))
+            else:
+                self._dirty[widget] = None
+        else:
+            self._dirty[widget] = QRegion(rect) if rect is not None else None
+        self._arm()
+
+    def track(self, anim, widget):
+        """Keep frames coming while `anim` runs; each step dirties `widget`."""
+        anim.valueChanged.connect(lambda _v: self.invalidate(widget))
+        anim.stateChanged.connect(
+            lambda new, _old: self._set_animating(anim, new == anim.Running))
+        if anim.state() == anim.Running:
+            self._set_animating(anim, True)
+        return anim
+
+    def _set_animating(self, anim, running):
+        if running:
+            self._anims.add(anim)
+            self._arm()
+        else:
+            self._anims.discard(anim)
+
+    # ----- pacing -------------------------------------------------------------
+
+    def _arm(self):
+        if self._timer.isActive() or not (self._dirty or self._anims):
+            return
+        now = time.perf_counter()
+        # next vsync boundary on a fixed grid, so frames never drift
+        k = math.floor((now - self._t0) / self.period) + 1
+        delay = self._t0 + k * self.period - now
+        self._timer.start(max(0, int(delay * 1000)))
+
+    def _tick(self):
+        now = time.perf_counter()
+        if self._last_tick is not None:
+            missed = round((now - self._last_tick) / self.period) - 1
+            self.skipped += max(0, missed)
+        self._last_tick = now
+
+        dirty, self._dirty = self._dirty, {}
+        composed = False
+        for widget, region in dirty.items():
+            if not widget.isVisible():
+                continue
+            if region is None:
+                widget.update()
+            else:
+                widget.update(region)
+            composed = True
+        if composed:
+            self.frames += 1
+        else:
+            self.skipped += 1
+        self._arm()
+
+    # ----- frame timing -------------------------------------------------------
+
+    def eventFilter(self, obj, ev):
+        # Qt paints every dirty child of the window inside one UpdateRequest,
+        # so timing that event gives the cost of composing the frame.
+        if obj is self.window and ev.type() == QEvent.UpdateRequest \
+                and not self._in_paint:
+            self._in_paint = True
+            t = time.perf_counter()
+            try:
+                obj.event(ev)
+            finally:
+                self._in_paint = False
+            dt = time.perf_counter() - t
+            self._paints += 1
+            self._paint_s += dt
+            self._paint_max = max(self._paint_max, dt)
+            return True
+        return False
+
+    def stats(self):
+        total = self.frames + self.skipped
+        return {
+            "frames": self.frames,
+            "skipped": self.skipped,
+            "idle_pct": 100.0 * self.skipped / total if total else 0.0,
+            "paint_avg_ms": 1e3 * self._paint_s / self._paints if self._paints else 0.0,
+            "paint_max_ms": 1e3 * self._paint_max,
+            "animations": len(self._anims),
+        }
+
+
+# Process-wide scheduler; widgets fall back to a plain update() before
+# install() runs (e.g. panes used outside VisionAriesUI).
+SCHED = None
+
+
+def install(window, hz=60):
+    global SCHED
+    SCHED = FrameScheduler(window, hz)
+    return SCHED
+
+
+def invalidate(widget, rect=None):
+    if SCHED is not None:
+        SCHED.invalidate(widget, rect)
+    elif rect is not None:
+        widget.update(rect)
+    else:
+        widget.update()
+
+
+def track(anim, widget):
+    return SCHED.track(anim, widget) if SCHED is not None else anim
@@ -0,0 +1,142 @@
+# hud_text.py
+
+import re
+from collections import OrderedDict
+
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtGui import QStaticText, QPainter, QColor, QFont, QTransform
+from PyQt5.QtCore import Qt, QPointF, QSize
+
+SEP = " · "
+
+
+class TextLayoutCache:
+    """
+    Laid-out text (QStaticText) keyed by (text, font, max_width), evicted
+    LRU by an estimate of its glyph-run memory. Shared by every HudLabel.
+    """
+    def __init__(self, max_bytes=512 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text, font, max_width=-1):
+        key = (text, font.key(), max_width)
+        item = self._items.get(key)
+        if item is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+        self.misses += 1
+        st = QStaticText(text)
+        st.setTextFormat(Qt.PlainText)
+        st.setPerformanceHint(QStaticText.AggressiveCaching)
+        if max_width > 0:
+            st.setTextWidth(max_width)
+        st.prepare(QTransform(), font)
+        cost = 64 + 48 * len(text)   # glyph indices + positions per char
+        self._items[key] = (st, cost)
+        self.bytes += cost
+        while self.bytes > self.max_bytes and len(self._items) > 1:
+            _k, (_st, c) = self._items.popitem(last=False)
+            self.bytes -= c
+        return st
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(self._items),
+            "bytes": self.bytes,
+        }
+
+
+CACHE = TextLayoutCache()
+
+
+def css_color(value):
+    """QColor from 'rgba(r,g,b,a)' (a in 0..1) or any name QColor accepts."""
+    m = re.match(r"rgba?\(([^)]*)\)", value.replace(" ", ""))
+    if not m:
+        return QColor(value)
+    parts = [float(p) for p in m.group(1).split(",")]
+    a = int(parts[3] * 255) if len(parts) > 3 else 255
+    return QColor(int(parts[0]), int(parts[1]), int(parts[2]), a)
+
+
+class HudLabel(QWidget):
+    """
+    Lightweight stand-in for the HUD's QLabels. Each line is split into
+    " · " separated segments and every segment is a cached QStaticText, so
+    when only the clock or a CPU figure changes, only that segment is laid
+    out again; the rest is drawn from CACHE.
+    """
+    def __init__(self, parent=None, font=None, color=Qt.white,
+                 bg=None, padding=(0, 0), radius=0):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self._font = font or QFont("Arial", 10)
+        self._color = QColor(color)
+        self._bg = bg
+        self._pad = padding
+        self._radius = radius
+        self._text = ""
+        self._runs = []            # (QPointF, QStaticText)
+        self._size = QSize(0, 0)
+
+    def text(self):
+        return self._text
+
+    def setFont(self, font):
+        self._font = font
+        self._relayout()
+
+    def setText(self, text):
+        if text == self._text:
+            return
+        self._text = text
+        self._relayout()
+
+    def _relayout(self):
+        px, py = self._pad
+        runs, y, width = [], py, 0
+        sep = CACHE.get(SEP, self._font)
+        for line in self._text.split("\n"):
+            x, h = px, 0
+            for i, seg in enumerate(line.split(SEP)):
+                if i:
+                    runs.append((QPointF(x, y), sep))
+                    x += sep.size().width()
+                st = CACHE.get(seg, self._font)
+                runs.append((QPointF(x, y), st))
+                x += st.size().width()
+                h = max(h, st.size().height(), sep.size().height())
+            width = max(width, x)
+            y += h
+        self._runs = runs
+        self._size = QSize(int(width + px), int(y + py))
+        self.updateGeometry()
+        self.update()
+
+    def sizeHint(self):
+        return self._size
+
+    def adjustSize(self):
+        self.resize(self._size)
+
+    def paintEvent(self, ev):
+        p = QPainter(self)
+        if self._bg is not None:
+            p.setRenderHint(QPainter.Antialiasing)
+            p.setPen(Qt.NoPen)
+            p.setBrush(self._bg)
+            p.drawRoundedRect(self.rect(), self._radius, self._radius)
+        p.setFont(self._font)
+        p.setPen(self._color)
+        for pos, st in self._runs:
+            p.drawStaticText(pos, st)
+        p.end()
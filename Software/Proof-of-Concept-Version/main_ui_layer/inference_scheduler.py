@@ -0,0 +1,236 @@
+# inference_scheduler.py
+
+import os
+import time
+
+from PyQt5.QtCore import QObject, QTimer
+
+try:
+    import psutil
+except Exception:
+    psutil = None
+
+
+class _Budget:
+    __slots__ = ("name", "rate_hz", "priority", "owners", "scale", "credit",
+                 "last", "suspended", "proc", "cost_ms", "cpu", "hz",
+                 "ran", "done", "skipped", "_ran_mark", "_done_mark")
+
+    def __init__(self, name, rate_hz, priority):
+        self.name = name
+        self.rate_hz = rate_hz
+        self.priority = priority
+        self.owners = []
+        self.scale = 1.0           # effective rate = rate_hz * scale
+        self.credit = 1.0          # frames this model may start now
+        self.last = None
+        self.suspended = False
+        self.proc = None           # psutil.Process of a pool worker
+        self.cost_ms = 0.0         # smoothed run time per frame
+        self.cpu = 0.0             # cores used over the last period
+        self.hz = 0.0              # measured runs per second
+        self.ran = self.done = self.skipped = 0
+        self._ran_mark = self._done_mark = 0
+
+
+class InferenceScheduler(QObject):
+    """
+    Decides which frames each vision model actually runs on.
+
+    Models declare a target rate and a priority (0 = most important).
+    due(name) is the per-frame gate: it passes frames at the model's current
+    effective rate and skips the rest, so callers can offer every camera
+    frame and never hard-code an interval.
+
+    Every `period_ms` the scheduler measures each model's CPU use (psutil
+    on the worker process for pool models, reported run time for in-process
+    ones) and shares out a global budget, `cpu_budget` of all cores, in
+    priority order. Each model gets what it needs at its target rate while
+    budget remains. Lower-priority models are slowed toward `min_scale` of
+    their target. When the whole machine is above `ceiling` (UI, capture,
+    other apps), the budget shrinks to the headroom that is left.
+
+    Models declared with an owner widget are suspended while none of their
+    owners are visible.
+
+    ready(name) answers the same question as due() without using up the
+    credit, so callers can skip fetching or converting a frame the gate
+    would refuse anyway.
+
+        sched = install(window)
+        sched.declare("hands", rate_hz=15, priority=1, owner=pane)
+        if sched.ready("hands"): frame = sub.poll() ...
+        if sched.due("hands"): ...
+        sched.report("hands", ms)      # in-process work; the pool reports its own
+    """
+    def __init__(self, parent=None, cpu_budget=0.5, ceiling=0.9,
+                 period_ms=500, min_scale=0.1):
+        super().__init__(parent)
+        self.cores = os.cpu_count() or 1
+        self.cpu_budget = cpu_budget
+        self.ceiling = ceiling
+        self.min_scale = min_scale
+        self._models = {}
+        self._last_adapt = time.monotonic()
+        self.system_cpu = None
+        self.available = cpu_budget * self.cores
+        if psutil is not None:
+            psutil.cpu_percent(None)        # prime the interval counter
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._adapt)
+        self._timer.start(period_ms)
+
+    def declare(self, name, rate_hz, priority=1, owner=None):
+        """
+        Add a model or another owner of it. Shared models keep the highest
+        requested rate and the most important priority.
+        """
+        b = self._models.get(name)
+        if b is None:
+            b = self._models[name] = _Budget(name, rate_hz, priority)
+        else:
+            b.rate_hz = max(b.rate_hz, rate_hz)
+            b.priority = min(b.priority, priority)
+        if owner is not None and owner not in b.owners:
+            b.owners.append(owner)
+            b.suspended = not self._visible(b)
+
+    def _credit(self, b, now):
+        if b.last is None:
+            return b.credit
+        # credit accrues at the effective rate; capped so a stall can't
+        # release a burst of back-to-back frames afterwards
+        return min(1.5, b.credit + (now - b.last) * b.rate_hz * b.scale)
+
+    def ready(self, name, now=None):
+        """True if due(name) would pass right now. Changes nothing."""
+        b = self._models.get(name)
+        if b is None:
+            return True
+        if b.suspended:
+            return False
+        now = time.monotonic() if now is None else now
+        return self._credit(b, now) >= 1.0
+
+    def due(self, name, now=None):
+        """True if `name` should run on the frame at hand; otherwise the frame is skipped."""
+        b = self._models.get(name)
+        if b is None:
+            return True
+        if b.suspended:
+            b.skipped += 1
+            return False
+        now = time.monotonic() if now is None else now
+        b.credit = self._credit(b, now)
+        b.last = now
+        if b.credit < 1.0:
+            b.skipped += 1
+            return False
+        b.credit -= 1.0
+        b.ran += 1
+        return True
+
+    def report(self, name, ms):
+        """Run time of one frame of `name`, in milliseconds."""
+        b = self._models.get(name)
+        if b is not None:
+            b.done += 1
+            b.cost_ms += (ms - b.cost_ms) * 0.2
+
+    def attach_process(self, name, pid):
+        """Measure `name`'s CPU on its worker process instead of from reported times."""
+        b = self._models.get(name)
+        if b is None or psutil is None:
+            return
+        try:
+            b.proc = psutil.Process(pid)
+            b.proc.cpu_percent(None)
+        except psutil.Error:
+            b.proc = None
+
+    def is_suspended(self, name):
+        b = self._models.get(name)
+        return b is not None and b.suspended
+
+    def _visible(self, b):
+        if not b.owners:
+            return True
+        alive = []
+        for w in b.owners:
+            try:
+                if w.isVisible():
+                    return True
+                alive.append(w)
+            except RuntimeError:      # owner widget was deleted
+                pass
+        b.owners = alive
+        return False
+
+    def _adapt(self):
+        now = time.monotonic()
+        dt = max(1e-3, now - self._last_adapt)
+        self._last_adapt = now
+
+        ours = 0.0
+        for b in self._models.values():
+            b.suspended = not self._visible(b)
+            runs, b._ran_mark = b.ran - b._ran_mark, b.ran
+            done, b._done_mark = b.done - b._done_mark, b.done
+            b.hz = (done or runs) / dt
+            b.cpu = b.cost_ms / 1000.0 * b.hz
+            if b.proc is not None:
+                try:
+                    b.cpu = b.proc.cpu_percent(None) / 100.0
+                except psutil.Error:
+                    b.proc = None
+            ours += b.cpu
+
+        avail = self.cpu_budget * self.cores
+        if psutil is not None:
+            self.system_cpu = psutil.cpu_percent(None) / 100.0 * self.cores
+            others = max(0.0, self.system_cpu - ours)
+            avail = min(avail, max(0.0, self.ceiling * self.cores - others))
+        self.available = avail
+
+        active = sorted((b for b in self._models.values() if not b.suspended),
+                        key=lambda b: b.priority)
+        for b in active:
+            # cores per run, from what the model cost over the last period
+            per_run = b.cpu / b.hz if b.hz > 0.5 else b.cost_ms / 1000.0
+            need = per_run * b.rate_hz
+            scale = 1.0 if need <= 0 else max(self.min_scale, min(1.0, avail / need))
+            avail = max(0.0, avail - need * scale)
+            # back off quickly, recover gently, so rates don't oscillate
+            gain = 0.6 if scale < b.scale else 0.2
+            b.scale += (scale - b.scale) * gain
+
+    def stats(self):
+        return {
+            "cores": self.cores,
+            "system_cpu": self.system_cpu,
+            "available": self.available,
+            "models": {
+                b.name: {"target_hz": b.rate_hz, "hz": b.hz,
+                         "effective_hz": b.rate_hz * b.scale,
+                         "priority": b.priority, "cpu": b.cpu,
+                         "cost_ms": b.cost_ms, "ran": b.ran,
+                         "skipped": b.skipped, "suspended": b.suspended}
+                for b in self._models.values()
+            },
+        }
+
+
+SCHEDULER = None
+
+
+def install(parent=None, **kw):
+    global SCHEDULER
+    SCHEDULER = InferenceScheduler(parent, **kw)
+    return SCHEDULER
+
+
+def get():
+    if SCHEDULER is None:
+        install()
+    return SCHEDULER
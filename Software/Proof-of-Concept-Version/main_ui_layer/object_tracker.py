@@ -0,0 +1,349 @@
+# object_tracker.py
+
+import re
+import time
+from collections import namedtuple
+
+import cv2
+import numpy as np
+from PyQt5.QtCore import QObject, pyqtSignal
+
+import inference_scheduler
+import vision_pool
+
+try:
+    from scipy.optimize import linear_sum_assignment
+except Exception:
+    linear_sum_assignment = None
+
+LABELS_PATH = "models/coco_labels.txt"
+
+# One confirmed track as handed to overlays. `box` is (x0, y0, x1, y1)
+# normalised to the frame, so each consumer scales it to its own size.
+TrackedObject = namedtuple("TrackedObject", "track_id label score box")
+
+
+def read_labels(path):
+    """{class_id: name} from "0 person" / "0: person" lines, or one name per line."""
+    labels = {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            for i, line in enumerate(f):
+                line = line.strip()
+                if not line:
+                    continue
+                m = re.match(r"^(\d+)[:\s]+(.+)$", line)
+                if m:
+                    labels[int(m.group(1))] = m.group(2).strip()
+                else:
+                    labels[i] = line
+    except OSError:
+        pass
+    return labels
+
+
+def iou_matrix(a, b):
+    """Pairwise IoU of (N, 4) and (M, 4) x0,y0,x1,y1 boxes."""
+    a = np.asarray(a, float).reshape(-1, 4)
+    b = np.asarray(b, float).reshape(-1, 4)
+    x0 = np.maximum(a[:, None, 0], b[None, :, 0])
+    y0 = np.maximum(a[:, None, 1], b[None, :, 1])
+    x1 = np.minimum(a[:, None, 2], b[None, :, 2])
+    y1 = np.minimum(a[:, None, 3], b[None, :, 3])
+    inter = np.clip(x1 - x0, 0, None) * np.clip(y1 - y0, 0, None)
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    return inter / np.maximum(area_a[:, None] + area_b[None, :] - inter, 1e-9)
+
+
+def _assign(cost):
+    """(rows, cols) minimising cost; Hungarian when scipy is there, else greedy."""
+    if linear_sum_assignment is not None:
+        return linear_sum_assignment(cost)
+    rows, cols = [], []
+    used_r, used_c = set(), set()
+    for flat in np.argsort(cost, axis=None):
+        r, c = divmod(int(flat), cost.shape[1])
+        if r not in used_r and c not in used_c:
+            used_r.add(r); used_c.add(c)
+            rows.append(r); cols.append(c)
+    return np.array(rows, int), np.array(cols, int)
+
+
+class KalmanBox:
+    """
+    Constant-velocity Kalman filter on (cx, cy, w, h). Process and
+    measurement noise are proportional to the box size, so one tuning works
+    for near and far objects and for normalised coordinates.
+    """
+    STD_POS = 1 / 20
+    STD_VEL = 1 / 160
+    F = np.eye(8)
+    F[:4, 4:] = np.eye(4)
+    H = np.eye(4, 8)
+
+    def __init__(self, box):
+        z = self._z(box)
+        self.x = np.r_[z, np.zeros(4)]
+        s = self._scale(z)
+        self.P = np.diag(np.r_[2 * self.STD_POS * s, 10 * self.STD_VEL * s] ** 2)
+
+    @staticmethod
+    def _z(box):
+        x0, y0, x1, y1 = box[:4]
+        return np.array([(x0 + x1) / 2, (y0 + y1) / 2, x1 - x0, y1 - y0], float)
+
+    @staticmethod
+    def _scale(z):
+        return np.array([z[2], z[3], z[2], z[3]])
+
+    def predict(self):
+        s = self._scale(self.x)
+        Q = np.diag(np.r_[self.STD_POS * s, self.STD_VEL * s] ** 2)
+        self.x = self.F @ self.x
+        self.x[2:4] = np.maximum(self.x[2:4], 1e-4)
+        self.P = self.F @ self.P @ self.F.T + Q
+
+    def update(self, box, noise=1.0):
+        """Fold in a measured box; noise > 1 trusts it less (e.g. optical flow)."""
+        R = np.diag((noise * self.STD_POS * self._scale(self.x)) ** 2)
+        S = self.H @ self.P @ self.H.T + R
+        K = self.P @ self.H.T @ np.linalg.inv(S)
+        self.x = self.x + K @ (self._z(box) - self.H @ self.x)
+        self.P = (np.eye(8) - K @ self.H) @ self.P
+
+    @property
+    def box(self):
+        cx, cy, w, h = self.x[:4]
+        return (cx - w / 2, cy - h / 2, cx + w / 2, cy + h / 2)
+
+
+class Track:
+    __slots__ = ("track_id", "kf", "class_id", "score", "hits", "missed", "confirmed")
+
+    def __init__(self, track_id, det):
+        self.track_id = track_id
+        self.kf = KalmanBox(det)
+        self.class_id, self.score = det[4], det[5]
+        self.hits = 1
+        self.missed = 0          # detection rounds in a row without a match
+        self.confirmed = False
+
+
+class SortTracker:
+    """
+    SORT-style multi-object tracker with stable IDs, in normalised coordinates.
+
+    predict() once per frame, then either update(detections) on frames the
+    detector saw, or propagate(prev_gray, gray) in between, which moves each
+    box by the median Lucas-Kanade flow of a point grid inside it and feeds
+    that to the Kalman filter as a low-confidence measurement.
+    """
+    GRID = 4                     # GRID x GRID flow points per box
+    MIN_FLOW_PX = 8              # smaller boxes ride on the Kalman prediction alone
+
+    def __init__(self, iou_threshold=0.3, min_hits=2, max_missed=2):
+        self.iou_threshold = iou_threshold
+        self.min_hits = min_hits
+        self.max_missed = max_missed
+        self.tracks = []
+        self._next_id = 1
+
+    def predict(self):
+        for t in self.tracks:
+            t.kf.predict()
+
+    def update(self, detections):
+        """
+        detections: [(x0, y0, x1, y1, class_id, score)] normalised.
+        Returns (tracks confirmed by this round, ids of tracks dropped).
+        """
+        matched_t, matched_d = set(), set()
+        if self.tracks and detections:
+            iou = iou_matrix([t.kf.box for t in self.tracks], [d[:4] for d in detections])
+            # a box never jumps class: mismatched labels can't pair up
+            for i, t in enumerate(self.tracks):
+                for j, d in enumerate(detections):
+                    if d[4] != t.class_id:
+                        iou[i, j] = 0.0
+            for i, j in zip(*_assign(1.0 - iou)):
+                if iou[i, j] >= self.iou_threshold:
+                    matched_t.add(i); matched_d.add(j)
+                    t, d = self.tracks[i], detections[j]
+                    t.kf.update(d)
+                    t.score = d[5]
+                    t.hits += 1
+                    t.missed = 0
+
+        confirmed, kept, dropped = [], [], []
+        for i, t in enumerate(self.tracks):
+            if i not in matched_t:
+                t.missed += 1
+            if t.missed > self.max_missed:
+                dropped.append(t.track_id)
+                continue
+            if not t.confirmed and t.hits >= self.min_hits:
+                t.confirmed = True
+                confirmed.append(t)
+            kept.append(t)
+        for j, d in enumerate(detections):
+            if j not in matched_d:
+                kept.append(Track(self._next_id, d))
+                self._next_id += 1
+        self.tracks = kept
+        return confirmed, dropped
+
+    def propagate(self, prev, cur):
+        """
+        Optical-flow update between detections. Returns how many tracks lost
+        their flow. Boxes too small to hold a point grid are not tracked by
+        flow and don't count as lost: the Kalman prediction carries them.
+        """
+        h, w = cur.shape[:2]
+        pts, spans = [], []
+        for t in self.tracks:
+            x0, y0, x1, y1 = np.clip(t.kf.box, 0.0, 1.0) * (w, h, w, h)
+            start = len(pts)
+            if x1 - x0 >= self.MIN_FLOW_PX and y1 - y0 >= self.MIN_FLOW_PX:
+                gx = np.linspace(x0, x1, self.GRID + 2)[1:-1]
+                gy = np.linspace(y0, y1, self.GRID + 2)[1:-1]
+                pts.extend((x, y) for y in gy for x in gx)
+            spans.append((start, len(pts)))
+        if not pts:
+            return 0
+
+        p0 = np.float32(pts).reshape(-1, 1, 2)
+        p1, st, _ = cv2.calcOpticalFlowPyrLK(prev, cur, p0, None,
+                                             winSize=(15, 15), maxLevel=2)
+        p0, p1, st = p0.reshape(-1, 2), p1.reshape(-1, 2), st.reshape(-1).astype(bool)
+        lost = 0
+        for t, (a, b) in zip(self.tracks, spans):
+            if a == b:
+                continue             # too small for flow
+            good = st[a:b]
+            if good.sum() < 4:
+                lost += 1
+                continue
+            q0, q1 = p0[a:b][good], p1[a:b][good]
+            shift = np.median(q1 - q0, axis=0)
+            c0, c1 = q0.mean(axis=0), q1.mean(axis=0)
+            d0 = np.linalg.norm(q0 - c0, axis=1)
+            d1 = np.linalg.norm(q1 - c1, axis=1)
+            ok = d0 > 1e-3
+            scale = float(np.clip(np.median(d1[ok] / d0[ok]), 0.8, 1.25)) if ok.any() else 1.0
+            cx, cy, bw, bh = t.kf.x[:4]
+            cx, cy = cx + shift[0] / w, cy + shift[1] / h
+            bw, bh = bw * scale, bh * scale
+            t.kf.update((cx - bw / 2, cy - bh / 2, cx + bw / 2, cy + bh / 2), noise=2.0)
+        return lost
+
+    def objects(self, labels=None):
+        labels = labels or {}
+        return [TrackedObject(t.track_id, labels.get(t.class_id, str(t.class_id)),
+                              t.score, tuple(float(v) for v in np.clip(t.kf.box, 0.0, 1.0)))
+                for t in self.tracks if t.confirmed]
+
+
+class ObjectTracker(QObject):
+    """
+    Runs TPUDetector (in the vision pool) on every `detect_every`-th camera
+    frame and keeps SORT tracks moving with optical flow in between, so
+    overlays get smooth boxes with stable IDs for a fraction of the
+    detector calls. A detection round is requested early when tracks lose
+    their flow, but no sooner than `detect_every // 2` frames after the
+    last one, so a track that keeps losing it can't force a detection on
+    every frame.
+
+    tracksUpdated(list[TrackedObject]) fires after every tracked frame;
+    trackAppeared(id, label) once when a track is confirmed, and
+    trackLost(id) when it is dropped.
+    """
+    tracksUpdated = pyqtSignal(list)
+    trackAppeared = pyqtSignal(int, str)
+    trackLost = pyqtSignal(int)
+
+    def __init__(self, camera_feed, parent=None, detect_every=4,
+                 labels_path=LABELS_PATH, flow_size=(480, 270)):
+        super().__init__(parent)
+        self.camera = camera_feed
+        self.detect_every = detect_every
+        self.labels = read_labels(labels_path)
+        self.sort = SortTracker()
+        self.gray = self.camera.frames.subscribe("gray", size=flow_size)
+        self.bgr = self.camera.frames.subscribe("bgr")
+        self._prev = None
+        self._since = detect_every       # detect on the first frame
+        self._det_size = {}              # seq -> (w, h) of frames sent to the detector
+        self._det_seq = 0
+        self._running = False
+        self.frames = self.detections = 0
+
+        self.vision = vision_pool.get()
+        self.vision.register("detector")
+        self.vision.resultReady.connect(self._on_detections)
+        self.sched = inference_scheduler.get()
+        self.sched.declare("tracker", rate_hz=30, priority=1)
+        self.camera.frameArrived.connect(self._on_frame)
+
+    def start(self):
+        self._running = True
+
+    def stop(self):
+        self._running = False
+
+    def objects(self):
+        return self.sort.objects(self.labels)
+
+    def _on_frame(self, _seq=None):
+        if not self._running or not self.sched.due("tracker"):
+            return
+        g = self.gray.poll()
+        if g is None:
+            return
+        t0 = time.perf_counter()
+        self.sort.predict()
+        lost = 0
+        if self._prev is not None and self.sort.tracks:
+            lost = self.sort.propagate(self._prev, g.frame)
+        if self._prev is None or self._prev.shape != g.frame.shape:
+            self._prev = np.empty_like(g.frame)
+        np.copyto(self._prev, g.frame)      # the bus recycles its buffers
+        self.frames += 1
+
+        self._since += 1
+        early = lost and self._since >= max(1, self.detect_every // 2)
+        if self._since >= self.detect_every or early:
+            f = self.bgr.poll()
+            if f is not None:
+                fut = self.vision.submit("detector", f.frame, f.seq)
+                if not fut.cancelled():
+                    self._since = 0
+                    self._det_size[f.seq] = f.frame.shape[1::-1]
+
+        self.tracksUpdated.emit(self.objects())
+        self.sched.report("tracker", (time.perf_counter() - t0) * 1000.0)
+
+    def _on_detections(self, model, seq, dets):
+        if model != "detector" or seq <= self._det_seq:
+            return
+        self._det_seq = seq
+        size = self._det_size.pop(seq, None)
+        for old in [s for s in self._det_size if s < seq]:
+            del self._det_size[old]
+        if size is None:
+            return
+        w, h = size
+        self.detections += 1
+        norm = [(x0 / w, y0 / h, x1 / w, y1 / h, cid, score)
+                for x0, y0, x1, y1, cid, score in dets]
+        confirmed, dropped = self.sort.update(norm)
+        for t in confirmed:
+            self.trackAppeared.emit(t.track_id, self.labels.get(t.class_id, str(t.class_id)))
+        for tid in dropped:
+            self.trackLost.emit(tid)
+        self.tracksUpdated.emit(self.objects())
+
+    def stats(self):
+        return {"frames": self.frames, "detections": self.detections,
+                "tracks": len(self.sort.tracks),
+                "frames_per_detection": self.frames / max(1, self.detections)}
@@ -0,0 +1,128 @@
+# pane_registry.py
+
+import json
+import os
+import time
+
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel
+from PyQt5.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+import apps
+from boot_timeline import BOOT
+
+PANE_USAGE_PATH = "pane_usage.json"
+
+
+class LazyPaneSlot(QWidget):
+    """
+    Placeholder that holds a CoverFlow/stack slot until the real pane is
+    built. The pane is added as the slot's only child, so stack indices
+    never shift when panes load (or fail to).
+    """
+    def __init__(self, name, parent=None):
+        super().__init__(parent)
+        self.name = name
+        self.pane = None
+        self.failed = False
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    def attach(self, pane):
+        self.pane = pane
+        self.layout().addWidget(pane)
+
+    def show_error(self, msg):
+        self.failed = True
+        lbl = QLabel(msg, alignment=Qt.AlignCenter)
+        lbl.setStyleSheet("color:white; font:14px;")
+        self.layout().addWidget(lbl)
+
+
+class PaneRegistry(QObject):
+    """
+    Builds panes on first launch instead of at boot.
+
+    names:   pane class names exported by the `apps` package, one per slot
+    factory: callable(cls) -> pane instance (wires camera/ctx/parent args)
+
+    Launch counts are persisted so the optional prewarm queue can build the
+    most-used panes while the UI is idle.
+    """
+    paneLoaded = pyqtSignal(int, str, float)   # slot, class name, seconds
+
+    def __init__(self, names, factory, usage_path=PANE_USAGE_PATH, parent=None):
+        super().__init__(parent)
+        self.factory = factory
+        self.usage_path = usage_path
+        self.slots = [LazyPaneSlot(n) for n in names]
+        self.usage = self._load_usage()
+        self._queue = []
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._prewarm_next)
+
+    def ensure(self, idx):
+        """Import and construct the pane for slot `idx` if not done yet."""
+        if not 0 <= idx < len(self.slots):
+            return None
+        slot = self.slots[idx]
+        if slot.pane is None and not slot.failed:
+            t0 = time.perf_counter()
+            try:
+                with BOOT.phase(f"pane.{slot.name}", cat="pane"):
+                    with BOOT.phase(f"import.{slot.name}", cat="pane"):
+                        cls = getattr(apps, slot.name)
+                    slot.attach(self.factory(cls))
+            except Exception as e:
+                print(f"⚠️ failed to instantiate {slot.name}: {e}")
+                slot.show_error(f"{slot.name} unavailable\n({e})")
+                return slot
+            self.paneLoaded.emit(idx, slot.name, time.perf_counter() - t0)
+        return slot
+
+    def is_loaded(self, idx):
+        return self.slots[idx].pane is not None
+
+    # ----- launch frequency ---------------------------------------------------
+
+    def record_launch(self, idx):
+        name = self.slots[idx].name
+        self.usage[name] = self.usage.get(name, 0) + 1
+        try:
+            with open(self.usage_path, "w") as f:
+                json.dump(self.usage, f)
+        except OSError:
+            pass
+
+    def _load_usage(self):
+        if not os.path.exists(self.usage_path):
+            return {}
+        try:
+            with open(self.usage_path) as f:
+                return {k: int(v) for k, v in json.load(f).items()}
+        except Exception:
+            return {}
+
+    # ----- idle prewarm -------------------------------------------------------
+
+    def start_prewarm(self, limit=3, interval_ms=250):
+        """
+        Build up to `limit` of the most-launched panes, one per idle tick,
+        so a burst of constructors never lands on a single frame.
+        """
+        order = sorted(range(len(self.slots)),
+                       key=lambda i: (-self.usage.get(self.slots[i].name, 0), i))
+        self._queue = [i for i in order
+                       if self.usage.get(self.slots[i].name, 0) > 0][:limit]
+        self._interval = interval_ms
+        if self._queue:
+            self._timer.start(interval_ms)
+
+    def _prewarm_next(self):
+        while self._queue:
+            idx = self._queue.pop(0)
+            if not self.is_loaded(idx):
+                self.ensure(idx)
+                break
+        if self._queue:
+            self._timer.start(self._interval)
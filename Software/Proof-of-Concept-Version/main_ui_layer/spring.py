@@ -0,0 +1,62 @@
+# spring.py
+
+import numpy as np
+
+
+class SpringArray:
+    """
+    A block of critically damped springs advanced together with numpy.
+
+    Each element eases towards its target without overshoot. step() uses the
+    closed-form solution, so it stays stable for any dt (a dropped frame just
+    lands further along the same curve). Retargeting keeps the current
+    velocity, so a burst of encoder clicks accelerates the motion smoothly
+    instead of restarting it. Once every element is within the settle
+    thresholds it snaps to its target and step() returns False, which tells
+    the caller it can stop ticking.
+
+        s = SpringArray(len(items), omega=40.0)
+        s.snap(xs)
+        s.set_target(new_xs)
+        while s.step(dt): ...
+    """
+    def __init__(self, shape, omega=20.0, settle_pos=1e-3, settle_vel=1e-2, value=0.0):
+        self.omega = float(omega)
+        self.settle_pos = settle_pos
+        self.settle_vel = settle_vel
+        self.x = np.full(shape, value, dtype=np.float64)
+        self.v = np.zeros(shape, dtype=np.float64)
+        self.target = self.x.copy()
+        self.at_rest = True
+
+    def set_target(self, target, index=None):
+        """Move the target (all of it, or self.target[index]); velocity carries over."""
+        if index is None:
+            self.target[...] = target
+        else:
+            self.target[index] = target
+        self.at_rest = False
+
+    def snap(self, value=None):
+        """Jump straight to `value` (or the current target) and stop."""
+        if value is not None:
+            self.target[...] = value
+        self.x[...] = self.target
+        self.v[...] = 0.0
+        self.at_rest = True
+
+    def step(self, dt):
+        """Advance by dt seconds; returns True while anything is still moving."""
+        if self.at_rest:
+            return False
+        w = self.omega
+        d = self.x - self.target
+        c = self.v + w * d
+        e = np.exp(-w * dt)
+        self.x = self.target + (d + c * dt) * e
+        self.v = (self.v - c * w * dt) * e
+        if (np.abs(self.x - self.target).max() < self.settle_pos
+                and np.abs(self.v).max() < self.settle_vel):
+            self.snap()
+            return False
+        return True
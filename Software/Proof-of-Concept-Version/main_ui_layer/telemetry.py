@@ -0,0 +1,167 @@
+# telemetry.py
+
+import json
+import threading
+import time
+from dataclasses import dataclass, replace
+
+try:
+    import psutil
+except Exception:
+    psutil = None
+try:
+    import requests
+except Exception:
+    requests = None
+
+WEATHER_URL = (
+    "https://api.open-meteo.com/v1/forecast"
+    "?latitude={lat}&longitude={lon}&current_weather=true&timezone=auto"
+)
+WEATHER_CACHE_PATH = "weather_cache.json"
+
+
+@dataclass(frozen=True)
+class TelemetrySnapshot:
+    """One immutable reading. Status bars just format the fields."""
+    ts: float = 0.0
+    battery: float = None        # percent, None if no battery
+    cpu: float = None            # percent
+    ram: float = None            # percent
+    weather: str = "–°F"
+    weather_ts: float = 0.0      # wall clock of the last successful fetch
+    weather_stale: bool = True
+
+    @property
+    def batt_str(self):
+        return f"{int(self.battery)}%" if self.battery is not None else "–%"
+
+    @property
+    def cpu_str(self):
+        return f"{self.cpu:.0f}%" if self.cpu is not None else "–%"
+
+    @property
+    def ram_str(self):
+        return f"{self.ram:.0f}%" if self.ram is not None else "–%"
+
+
+class Telemetry(threading.Thread):
+    """
+    Samples system metrics on a worker thread and publishes immutable
+    TelemetrySnapshots. Readers take `telemetry.snapshot` (a single
+    attribute read), so rendering never waits on /proc or the network.
+
+    Weather is cached with a TTL and served stale-while-revalidate: the last
+    value stays on screen while a refresh runs on its own thread, and a
+    failed refresh keeps the old value and retries after `retry_s`.
+    """
+    def __init__(self, lat=37.7749, lon=-122.4194,
+                 cpu_period=1.0, mem_period=2.0, battery_period=30.0,
+                 weather_ttl=900.0, retry_s=60.0, timeout=2.0,
+                 cache_path=WEATHER_CACHE_PATH):
+        super().__init__(name="telemetry", daemon=True)
+        self.lat, self.lon = lat, lon
+        self.periods = {
+            "cpu": cpu_period,
+            "ram": mem_period,
+            "battery": battery_period,
+        }
+        self.weather_ttl = weather_ttl
+        self.retry_s = retry_s
+        self.timeout = timeout
+        self.cache_path = cache_path
+        self.snapshot = TelemetrySnapshot()
+        self._due = {k: 0.0 for k in self.periods}
+        self._weather_next = 0.0
+        self._fetching = False
+        self._lock = threading.Lock()
+        self._halt = threading.Event()
+        self._load_weather_cache()
+
+    # ----- publishing -----------------------------------------------------
+
+    def _publish(self, **changes):
+        with self._lock:
+            old = self.snapshot
+            new = replace(old, ts=time.time(), **changes)
+            if new != replace(old, ts=new.ts):
+                self.snapshot = new
+
+    # ----- samplers -------------------------------------------------------
+
+    def _sample(self, key):
+        if psutil is None:
+            return None
+        try:
+            if key == "cpu":
+                return psutil.cpu_percent()
+            if key == "ram":
+                return psutil.virtual_memory().percent
+            if key == "battery":
+                b = psutil.sensors_battery() if hasattr(psutil, "sensors_battery") else None
+                return b.percent if b else None
+        except Exception:
+            return None
+
+    # ----- weather (stale-while-revalidate) -------------------------------
+
+    def _load_weather_cache(self):
+        try:
+            with open(self.cache_path) as f:
+                c = json.load(f)
+            age = time.time() - c["ts"]
+            self.snapshot = replace(self.snapshot, weather=c["weather"],
+                                    weather_ts=c["ts"],
+                                    weather_stale=age > self.weather_ttl)
+            if age <= self.weather_ttl:
+                self._weather_next = time.monotonic() + self.weather_ttl - age
+        except Exception:
+            pass
+
+    def _revalidate_weather(self):
+        if self._fetching or requests is None:
+            return
+        self._fetching = True
+        self._publish(weather_stale=True)
+        threading.Thread(target=self._fetch_weather, name="weather",
+                         daemon=True).start()
+
+    def _fetch_weather(self):
+        try:
+            url = WEATHER_URL.format(lat=self.lat, lon=self.lon)
+            j = requests.get(url, timeout=self.timeout).json()["current_weather"]
+            ft = round(j["temperature"] * 9 / 5 + 32)
+            icon = "☀️" if j["weathercode"] < 3 else "☁️"
+            txt, now = f"{ft}°F {icon}", time.time()
+            self._publish(weather=txt, weather_ts=now, weather_stale=False)
+            self._weather_next = time.monotonic() + self.weather_ttl
+            try:
+                with open(self.cache_path, "w") as f:
+                    json.dump({"weather": txt, "ts": now}, f)
+            except OSError:
+                pass
+        except Exception:
+            # keep serving the last value; try again later
+            self._weather_next = time.monotonic() + self.retry_s
+        finally:
+            self._fetching = False
+
+    # ----- loop -------------------------------------------------------------
+
+    def run(self):
+        while not self._halt.is_set():
+            now = time.monotonic()
+            changes = {}
+            for key, period in self.periods.items():
+                if now >= self._due[key]:
+                    changes[key] = self._sample(key)
+                    self._due[key] = now + period
+            if changes:
+                self._publish(**changes)
+            if now >= self._weather_next:
+                self._revalidate_weather()
+            wake = min(min(self._due.values()), max(self._weather_next, now + 1.0))
+            self._halt.wait(max(0.05, wake - time.monotonic()))
+
+    def stop(self):
+        self._halt.set()
@@ -1,5 +1,6 @@
 # tpu_detector.py
 
+import cv2
 import numpy as np
 try:
     from pycoral.utils.edgetpu import make_interpreter
@@ -37,13 +38,16 @@ class TPUDetector:
         if not self.use_tpu:
             return []
 
-        # Resize & feed input
-        common.set_resized_input(
-            self.interpreter, frame, self.resolution, keep_aspect_ratio=True)
+        # Resize & feed input (the model wants RGB); keep the scale so boxes
+        # come back in frame pixels rather than model-input pixels
+        h, w = frame.shape[:2]
+        _, scale = common.set_resized_input(
+            self.interpreter, (w, h),
+            lambda size: cv2.cvtColor(cv2.resize(frame, size), cv2.COLOR_BGR2RGB))
         self.interpreter.invoke()
 
         # Parse detections
-        objs = detect.get_objects(self.interpreter, self.threshold)
+        objs = detect.get_objects(self.interpreter, self.threshold, scale)
         results = []
         for o in objs:
             bbox = o.bbox
@@ -0,0 +1,154 @@
+# tween.py
+
+import time
+
+from PyQt5.QtCore import QObject, QTimer, Qt, QEasingCurve, QPointF, QRectF, QRect
+
+
+class _Tween:
+    __slots__ = ("target", "prop", "start", "end", "t0", "dur", "curve", "on_done")
+
+
+def _lerp(a, b, t):
+    if isinstance(a, QPointF):
+        return QPointF(a.x() + (b.x() - a.x()) * t, a.y() + (b.y() - a.y()) * t)
+    if isinstance(a, (QRectF, QRect)):
+        r = QRectF(a.x() + (b.x() - a.x()) * t, a.y() + (b.y() - a.y()) * t,
+                   a.width() + (b.width() - a.width()) * t,
+                   a.height() + (b.height() - a.height()) * t)
+        return r.toRect() if isinstance(a, QRect) else r
+    return a + (b - a) * t
+
+
+class TweenDriver(QObject):
+    """
+    One timer for every property animation in the UI.
+
+    Each running tween is a pooled _Tween in a flat list; a tick advances
+    all of them and writes the eased value with setProperty(). Starting a
+    tween on a (target, property) that is already animating retargets it
+    from its current value instead of stacking a second animation, and
+    finished tweens go back to the pool, so holding an arrow key allocates
+    nothing after the first few presses.
+
+        DRIVER = install(window)
+        animate(item, "pos", QPointF(x, y), 80)
+        animate(item, "shine", 0.0, 150, start=0.8, easing=QEasingCurve.Linear)
+    """
+    def __init__(self, parent=None, hz=60):
+        super().__init__(parent)
+        self._active = []             # running _Tween objects
+        self._by_key = {}             # (id(target), prop) -> _Tween
+        self._pool = []
+        self._curves = {}             # QEasingCurve.Type -> QEasingCurve
+
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(max(1, int(1000 / hz)))
+        self._timer.timeout.connect(self._tick)
+
+        # stats
+        self.allocated = 0
+        self.retargets = 0
+        self.finished = 0
+
+    def animate(self, target, prop, end, duration_ms,
+                easing=QEasingCurve.InOutCubic, start=None, on_done=None):
+        """Tween target.<prop> to `end`; retargets a running tween on the same property."""
+        if isinstance(prop, bytes):
+            prop = prop.decode()
+        key = (id(target), prop)
+        tw = self._by_key.get(key)
+        if tw is not None:
+            self.retargets += 1
+        else:
+            if self._pool:
+                tw = self._pool.pop()
+            else:
+                tw = _Tween()
+                self.allocated += 1
+            tw.target, tw.prop = target, prop
+            self._by_key[key] = tw
+            self._active.append(tw)
+        tw.start = target.property(prop) if start is None else start
+        tw.end = end
+        tw.t0 = time.perf_counter()
+        tw.dur = max(1e-3, duration_ms / 1000.0)
+        tw.curve = self._curve(easing)
+        tw.on_done = on_done
+        if start is not None:
+            target.setProperty(prop, start)
+        if not self._timer.isActive():
+            self._timer.start()
+        return tw
+
+    def stop(self, target, prop=None):
+        """Drop running tweens on `target` (one property or all) where they are."""
+        for tw in [t for t in self._active if t.target is target
+                   and (prop is None or t.prop == prop)]:
+            self._finish(tw)
+
+    def is_running(self):
+        return bool(self._active)
+
+    def _curve(self, easing):
+        c = self._curves.get(easing)
+        if c is None:
+            c = self._curves[easing] = QEasingCurve(easing)
+        return c
+
+    def _tick(self):
+        now = time.perf_counter()
+        done = []
+        for tw in self._active:
+            p = min(1.0, (now - tw.t0) / tw.dur)
+            try:
+                tw.target.setProperty(tw.prop, _lerp(tw.start, tw.end, tw.curve.valueForProgress(p)))
+            except RuntimeError:   # wrapped C++ object already deleted
+                p = 1.0
+            if p >= 1.0:
+                done.append(tw)
+        for tw in done:
+            cb = tw.on_done
+            self._finish(tw)
+            self.finished += 1
+            if cb is not None:
+                cb()
+        if not self._active:
+            self._timer.stop()
+
+    def _finish(self, tw):
+        self._active.remove(tw)
+        self._by_key.pop((id(tw.target), tw.prop), None)
+        tw.target = tw.start = tw.end = tw.on_done = None
+        self._pool.append(tw)
+
+    def stats(self):
+        return {
+            "active": len(self._active),
+            "pooled": len(self._pool),
+            "allocated": self.allocated,
+            "retargets": self.retargets,
+            "finished": self.finished,
+        }
+
+
+# Process-wide driver, created on first use if install() was never called.
+DRIVER = None
+
+
+def install(parent=None, hz=60):
+    global DRIVER
+    DRIVER = TweenDriver(parent, hz)
+    return DRIVER
+
+
+def animate(target, prop, end, duration_ms, **kw):
+    if DRIVER is None:
+        install()
+    return DRIVER.animate(target, prop, end, duration_ms, **kw)
+
+
+def stop(target, prop=None):
+    if DRIVER is not None:
+        DRIVER.stop(target, prop)
@@ -0,0 +1,565 @@
+# vision_aries_ui.py
+# The Aries window. Started from main.py; kept out of it so that spawned
+# vision_pool workers, which re-run main.py as __mp_main__, import no Qt.
+# boot timeline first, so the boot clock and import accounting start here
+from boot_timeline import BOOT
+
+with BOOT.phase("import.stdlib"):
+    import sys
+    import os
+    import time
+    import inspect
+    from datetime import datetime
+
+with BOOT.phase("import.numpy"):
+    import numpy as np
+
+with BOOT.phase("import.qt"):
+    from PyQt5.QtWidgets import (
+        QApplication, QMainWindow, QSplashScreen, QWidget, QStackedWidget,
+        QGraphicsView, QGraphicsScene, QGraphicsBlurEffect, QLabel, QVBoxLayout
+    )
+    from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+    from PyQt5.QtGui import QPixmap, QPainter, QColor, QPainterPath, QFont
+    from PyQt5.QtWidgets import QGraphicsObject
+    from PyQt5.QtCore import QPointF, QRectF, pyqtProperty, QEasingCurve
+
+with BOOT.phase("import.core"):
+    # core modules
+    from camera import CameraFeed
+    from telemetry import Telemetry
+    import frame_scheduler
+    import tween
+    import vision_pool
+    import inference_scheduler
+    from spring import SpringArray
+    from hud_text import HudLabel, css_color
+    from floating_card import FloatingCard
+    from assistant_pill import AssistantPillIcon
+
+    # panepackage (panes are imported lazily, see pane_registry.py)
+    from pane_registry import PaneRegistry
+
+    # AR & AI
+    from contextual_assistant import ContextualAssistant
+    from ar_overlay import AROverlayManager
+    from object_tracker import ObjectTracker
+    from feedback_overlay import FeedbackOverlay
+
+    # system notifications
+    from notification_center import NotificationCenter
+
+# ------------------------------------------------------------------
+# Monkey-patch FloatingCard to add setText()
+# ------------------------------------------------------------------
+if not hasattr(FloatingCard, "setText"):
+    def _fc_setText(self, txt):
+        if hasattr(self, "label"):
+            self.label.setText(txt)
+        else:
+            self._text = txt
+    FloatingCard.setText = _fc_setText
+
+# ------------------------------------------------------------------
+# IconItem + CoverFlowLauncher (with labels)
+# ------------------------------------------------------------------
+def _blurred_glow(size, radius, blur, color):
+    """Rounded-rect halo blurred once offscreen; shared by every IconItem."""
+    src = QPixmap(size + 2 * blur, size + 2 * blur)
+    src.fill(Qt.transparent)
+    p = QPainter(src)
+    p.setRenderHint(QPainter.Antialiasing)
+    p.setPen(Qt.NoPen)
+    p.setBrush(color)
+    p.drawRoundedRect(QRectF(blur, blur, size, size), radius, radius)
+    p.end()
+
+    scene = QGraphicsScene()
+    fx = QGraphicsBlurEffect()
+    fx.setBlurRadius(blur)
+    scene.addPixmap(src).setGraphicsEffect(fx)
+    out = QPixmap(src.size())
+    out.fill(Qt.transparent)
+    p = QPainter(out)
+    scene.render(p, QRectF(out.rect()), QRectF(src.rect()))
+    p.end()
+    return out
+
+
+class IconItem(QGraphicsObject):
+    SIZE = 128
+    GLOW_BLUR = 40
+    MAX_SCALE = 1.4
+    _glow_tex = None          # one pre-blurred glow for all icons
+
+    def __init__(self, image_path, label, index):
+        super().__init__()
+        self.index = index
+        self.label = label
+        self._scale = 1.0
+        self._shine = 0.0
+        self._glow = 0.0
+        self.radius = 32
+
+        pix = QPixmap(image_path)
+        if pix.isNull():
+            print(f"⚠️ Missing icon: {image_path}")
+            pix = QPixmap(128, 128)
+            pix.fill(Qt.transparent)
+        base = pix.scaled(128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+        w = h = 128
+        self._pixmap = QPixmap(w, h)
+        self._pixmap.fill(Qt.transparent)
+        p = QPainter(self._pixmap)
+        p.setRenderHint(QPainter.Antialiasing)
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(0, 0, w, h), self.radius, self.radius)
+        p.setClipPath(path)
+        p.drawPixmap(0, 0, base)
+        p.end()
+
+        # the glow is composited in paint() with an opacity instead of a
+        # per-item QGraphicsDropShadowEffect (an offscreen blur every frame)
+        if IconItem._glow_tex is None:
+            IconItem._glow_tex = _blurred_glow(
+                w, self.radius, self.GLOW_BLUR, QColor(255, 255, 255, 200))
+
+        self.setAcceptHoverEvents(True)
+        self.setCursor(Qt.PointingHandCursor)
+
+    def boundingRect(self):
+        # large enough for the selected scale plus the glow halo
+        half = self.SIZE / 2
+        ext = (half + self.GLOW_BLUR) * self.MAX_SCALE
+        return QRectF(half - ext, half - ext, 2 * ext, 2 * ext)
+
+    def paint(self, painter, *_):
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.save()
+        painter.translate(64, 64)
+        painter.scale(self._scale, self._scale)
+        painter.translate(-64, -64)
+        if self._glow > 0:
+            painter.setOpacity(self._glow)
+            painter.drawPixmap(-self.GLOW_BLUR, -self.GLOW_BLUR, IconItem._glow_tex)
+            painter.setOpacity(1.0)
+        painter.drawPixmap(0, 0, self._pixmap)
+        painter.restore()
+        if self._shine > 0:
+            painter.setOpacity(self._shine)
+            painter.fillRect(0, 0, 128, 128, QColor(255, 255, 255, 120))
+
+    def getScale(self):
+        return self._scale
+
+    def setScale(self, v):
+        self._scale = v
+        self.update()
+
+    scale = pyqtProperty(float, fget=getScale, fset=setScale)
+
+    def getShine(self):
+        return self._shine
+
+    def setShine(self, v):
+        self._shine = v
+        self.update()
+
+    shine = pyqtProperty(float, fget=getShine, fset=setShine)
+
+    def getGlow(self):
+        return self._glow
+
+    def setGlow(self, v):
+        if v != self._glow:
+            self._glow = v
+            self.update()
+
+    glow = pyqtProperty(float, fget=getGlow, fset=setGlow)
+
+    def hoverEnterEvent(self, ev):
+        self.setScale(1.1)
+
+    def hoverLeaveEvent(self, ev):
+        self.setScale(1.0)
+
+    def mousePressEvent(self, ev):
+        # launch the app
+        self.scene().views()[0].parent().launch_app(self.index)
+
+
+class CoverFlowLauncher(QGraphicsView):
+    SPACING = 200
+    OMEGA = 40.0          # spring stiffness; ~150 ms to settle
+
+    def __init__(self, icons, parent=None):
+        super().__init__(parent)
+        self.setStyleSheet("background:transparent;")
+        self.setAlignment(Qt.AlignCenter)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+        self.scene = QGraphicsScene(self)
+        self.setScene(self.scene)
+        self.items = []
+        self.index = 0
+
+        for i, (path, name) in enumerate(icons):
+            it = IconItem(path, name, i)
+            self.scene.addItem(it)
+            self.items.append(it)
+
+        # row 0: x of every icon, row 1: its scale; one spring block for all
+        self.springs = SpringArray((2, len(self.items)), omega=self.OMEGA,
+                                   settle_pos=0.05, settle_vel=0.5)
+        self._mid_y = 0.0
+        self._last = 0.0
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(16)
+        self._timer.timeout.connect(self._tick)
+
+        self.update_icons(animated=False)
+
+    def keyPressEvent(self, ev):
+        if ev.key() == Qt.Key_Right:
+            self.index = (self.index + 1) % len(self.items)
+            self.update_icons(animated=True)
+        elif ev.key() == Qt.Key_Left:
+            self.index = (self.index - 1) % len(self.items)
+            self.update_icons(animated=True)
+
+    def resizeEvent(self, ev):
+        super().resizeEvent(ev)
+        self.update_icons(animated=False)
+
+    def update_icons(self, animated):
+        mid_x = self.width() / 2 - 64
+        self._mid_y = self.height() / 2 - 64
+        n = len(self.items)
+        idx = np.arange(n)
+        xs = (idx - self.index) * self.SPACING + mid_x
+        scales = np.where(idx == self.index, 1.4, 1.0)
+
+        for i, it in enumerate(self.items):
+            sel = (i == self.index)
+            it.setGlow(1.0 if sel else 0.0)
+            if sel and animated:
+                # flash to 0.8 and fade out over the first half of 300 ms
+                tween.animate(it, "shine", 0.0, 150, start=0.8,
+                              easing=QEasingCurve.Linear)
+
+        if animated:
+            # retarget: held keys keep the velocity they have built up
+            self.springs.set_target(np.stack((xs, scales)))
+            if not self._timer.isActive():
+                self._last = time.perf_counter()
+                self._timer.start()
+        else:
+            self._timer.stop()
+            self.springs.snap(np.stack((xs, scales)))
+            self._apply()
+
+    def _tick(self):
+        now = time.perf_counter()
+        moving = self.springs.step(min(now - self._last, 0.1))
+        self._last = now
+        self._apply()
+        if not moving:
+            self._timer.stop()
+
+    def _apply(self):
+        xs, scales = self.springs.x
+        for it, x, sc in zip(self.items, xs, scales):
+            it.setPos(QPointF(x, self._mid_y))
+            it.setScale(float(sc))
+
+# ------------------------------------------------------------------
+# StatusBar: time · batt · weather · CPU · RAM · build · console log
+# ------------------------------------------------------------------
+class StatusBar(QWidget):
+    LAT, LON = 37.7749, -122.4194
+    BUILD = "Aries OS 1.0 α·Bld1 · May 21 2025"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setFixedHeight(48)
+
+        # segments are cached layouts, so a new clock/CPU value only
+        # re-lays out the segment that changed
+        self.lbl = HudLabel(self, QFont("Arial", 10), Qt.white)
+        self.lbl.setGeometry(8, 0, parent.width() - 16, 48)
+
+        # psutil + weather are sampled on a worker thread; _update only
+        # formats the latest snapshot, so it is cheap enough to run each second
+        self.telemetry = Telemetry(self.LAT, self.LON)
+        self.telemetry.start()
+
+        self._console = []
+        self._text = None
+        self._update()
+        t = QTimer(self)
+        t.timeout.connect(self._update)
+        t.start(1000)
+
+    def append(self, line):
+        self._console.append(line)
+        if len(self._console) > 3:
+            self._console.pop(0)
+        self._update()
+
+    def _update(self):
+        snap = self.telemetry.snapshot
+        now = datetime.now().strftime("%-I:%M %p")
+
+        lines = "\n".join(self._console)
+        txt = (
+            f"{now} · {snap.batt_str} · {snap.weather} · "
+            f"CPU {snap.cpu_str} · RAM {snap.ram_str}\n"
+            f"{self.BUILD}"
+        )
+        if lines:
+            txt += "\n" + lines
+
+        # skip the relayout when nothing visible changed
+        if txt != self._text:
+            self._text = txt
+            self.lbl.setText(txt)
+
+    def stop(self):
+        self.telemetry.stop()
+
+# ------------------------------------------------------------------
+# Transient overlay for speech & object labels
+# ------------------------------------------------------------------
+class OverlayLabel(HudLabel):
+    def __init__(self, parent=None, font_size=14, bg="rgba(0,0,0,0.6)"):
+        f = QFont("Helvetica Neue", font_size)
+        if not f.exactMatch():
+            f = QFont("Arial", font_size)
+        super().__init__(parent, f, Qt.white, bg=css_color(bg),
+                         padding=(8, 4), radius=6)
+        self.hide()
+
+    def show_timed(self, text, timeout=2000):
+        self.setText(text)
+        self.adjustSize()
+        self.show()
+        QTimer.singleShot(timeout, self.hide)
+
+# ------------------------------------------------------------------
+# Main Window
+# ------------------------------------------------------------------
+class VisionAriesUI(QMainWindow):
+    PANE_NAMES = [
+        "SettingsPane", "MapsPane", "AssistantPane", "BluetoothPane",
+        "PhotoPane", "VideoPane", "TranslatorPane", "NavPane",
+        "MusicPane", "CallPane",
+        "DrawingPane", "PersonTrackerPane", "GestureCanvasPane",
+        "LLMPane", "ThemeManager", "SharedARPane",
+        "SpatialAudioManager", "LiveStreamPane"
+    ]
+
+    def __init__(self, icons, prewarm=True):
+        super().__init__()
+        self.setWindowTitle("Vision Aries OS")
+        self.setGeometry(50, 50, 960, 540)
+
+        # Splash
+        with BOOT.phase("splash"):
+            logo = QPixmap("VisionAriesAssets/VisionAriesLogo.png")
+            if logo.isNull():
+                logo = QPixmap(960, 540)
+                logo.fill(Qt.black)
+            sp = QSplashScreen(logo)
+            sp.showMessage("Empowering Visionaries",
+                           Qt.AlignBottom | Qt.AlignCenter, Qt.white)
+            sp.show(); QApplication.processEvents()
+            time.sleep(0.5)
+            sp.close()
+
+        # Central Camera
+        with BOOT.phase("camera.open"):
+            self.camera = CameraFeed()
+            self.setCentralWidget(self.camera)
+
+        # Vision models run in worker processes, started on first use, at
+        # rates the scheduler fits into a shared CPU budget
+        self.infer = inference_scheduler.install(self, cpu_budget=0.5)
+        self.vision = vision_pool.install(self, scheduler=self.infer)
+
+        # Contextual AI
+        with BOOT.phase("assistant.start"):
+            self.ctx = ContextualAssistant(self.camera)
+            self.ctx.suggestionReady.connect(lambda m: self.notif.showMessage(m, 3000))
+            self.ctx.start()
+
+        # Speech / object overlay
+        self.speech_ol = OverlayLabel(self, font_size=12, bg="rgba(0,0,0,0.7)")
+        self.ctx.voiceCommandProcessed.connect(
+            lambda cmd, resp: self.speech_ol.show_timed(f"> {cmd}\n{resp}", 3000)
+        )
+        self.ctx.voicePartial.connect(
+            lambda text: self.speech_ol.show_timed(f"> {text}…", 1500)
+        )
+
+        # Object tracking: detector every few frames, optical flow between
+        self.tracker = ObjectTracker(self.camera, self, detect_every=4)
+        self.tracker.start()
+
+        # Cover-flow launcher
+        with BOOT.phase("launcher"):
+            self.launcher = CoverFlowLauncher(icons, self)
+            self.launcher.setGeometry(self.rect())
+            self.launcher.raise_()
+
+        # Stacked panes: each slot is a placeholder until first launch
+        self.pages = QStackedWidget(self)
+        self.panes = PaneRegistry(self.PANE_NAMES, self._build_pane, parent=self)
+        self.panes.paneLoaded.connect(self._on_pane_loaded)
+        for slot in self.panes.slots:
+            self.pages.addWidget(slot)
+        with BOOT.phase("panes.home"):
+            self.panes.ensure(0)
+        self._prewarm = prewarm
+        self.camera.firstFrame.connect(self._on_first_frame)
+
+        self.pages.setGeometry(self.rect())
+        self.pages.lower()
+
+        # AR Overlay
+        self.ar = AROverlayManager(self.camera, self.ctx, self, tracker=self.tracker)
+        self.ar.overlayUpdated.connect(self.update_camera_feed)
+        self.feedback = FeedbackOverlay(self.ctx, self, tracker=self.tracker)
+        self.feedback.suggestionReady.connect(lambda m: self.notif.showMessage(m, 3000))
+
+        # System notifications
+        with BOOT.phase("notifications.start"):
+            self.notif = FloatingCard(parent=self, blur_behind=True)
+            self.notif.raise_()
+            self.sys_notif = NotificationCenter(self)
+            self.sys_notif.notificationReceived.connect(
+                lambda m: self.notif.showMessage(m, 5000))
+            self.sys_notif.start()
+
+        # Status bar
+        with BOOT.phase("statusbar"):
+            self.status = StatusBar(self)
+            self.status.raise_()
+
+        # Mic pill
+        self.pill_bg = QWidget(self)
+        self.pill_bg.setFixedSize(56, 56)
+        self.pill_bg.setStyleSheet(
+            "background:rgba(255,255,255,0.2);border-radius:28px;")
+        self.pill = AssistantPillIcon("VisionAriesAssets/mic.png")
+        self.pill.setParent(self.pill_bg)
+        self.pill.move(12, 12)
+        self.pill.installEventFilter(self)
+        self.pill_bg.raise_()
+
+        # Render on change: widgets invalidate what they touched and frames
+        # are composed on a 60 Hz grid only while something is dirty
+        self.sched = frame_scheduler.install(self, hz=60)
+        self.tweens = tween.install(self, hz=60)
+
+        self.show()
+
+    def resizeEvent(self, ev):
+        super().resizeEvent(ev)
+        r = self.rect()
+        self.launcher.setGeometry(r)
+        self.pages.setGeometry(r)
+        self.status.move(8, self.height() - self.status.height() - 80)
+        self.pill_bg.move((self.width() - 56) // 2, self.height() - 72)
+        self.notif.move(self.width() - 320, self.height() - 88)
+        if self.speech_ol.isVisible():
+            self.speech_ol.move(
+                (self.width() - self.speech_ol.width()) // 2,
+                self.height() - 80 - self.speech_ol.height()
+            )
+
+    def _build_pane(self, cls):
+        """Construct a pane class, passing only the arguments it accepts."""
+        sig = inspect.signature(cls.__init__)
+        params = set(sig.parameters) - {"self"}
+        args, kwargs = [], {}
+        if "camera_feed" in params:
+            args.append(self.camera)
+        if "ctx_assistant" in params:
+            args.append(self.ctx)
+        if "tracker" in params:
+            kwargs["tracker"] = self.tracker
+        if "parent" in params:
+            kwargs["parent"] = self
+
+        page = cls(*args, **kwargs)
+
+        # wire up Home button
+        if hasattr(page, "goHomeRequested"):
+            page.goHomeRequested.connect(lambda _=None: self.launch_app(0))
+        return page
+
+    def _on_pane_loaded(self, idx, name, dt):
+        print(f"[panes] {name} ready in {dt * 1000:.0f} ms")
+        if BOOT.end is not None:
+            BOOT.save()   # keep late (prewarmed) pane constructors in the trace
+
+    def _on_first_frame(self, ts):
+        summary = BOOT.finish("first_frame")
+        print(f"[boot] {summary} → {BOOT.path}")
+        self.status.append(summary)
+        if self._prewarm:
+            self.panes.start_prewarm()
+
+    def launch_app(self, idx):
+        """Switch to page idx; hide icons on any pane, show on home."""
+        if self.panes.ensure(idx) is None:
+            return
+        if idx != 0:
+            self.panes.record_launch(idx)
+        self.pages.setCurrentIndex(idx)
+        if idx == 0:
+            self.launcher.show()
+        else:
+            self.launcher.hide()
+
+    def update_camera_feed(self, pix):
+        if pix and not pix.isNull():
+            self.camera.setPixmap(pix)
+
+    def eventFilter(self, obj, ev):
+        if obj is self.pill and ev.type() == ev.MouseButtonPress:
+            self.camera.setGraphicsEffect(QGraphicsBlurEffect())
+            self.ctx.process_voice_command()
+            QTimer.singleShot(200, lambda: self.camera.setGraphicsEffect(None))
+        return super().eventFilter(obj, ev)
+
+    def closeEvent(self, ev):
+        if BOOT.end is None:
+            # no camera frame ever arrived: still save the trace and unhook
+            print(f"[boot] {BOOT.finish('shutdown')} → {BOOT.path}")
+        self.ctx.stop()
+        self.tracker.stop()
+        self.camera.stop()
+        self.status.stop()
+        st = self.sched.stats()
+        print(f"[frames] {st['frames']} drawn · {st['skipped']} skipped "
+              f"({st['idle_pct']:.0f}% idle) · paint avg {st['paint_avg_ms']:.1f}ms "
+              f"max {st['paint_max_ms']:.1f}ms")
+        tw = self.tweens.stats()
+        print(f"[tweens] {tw['allocated']} allocated · {tw['retargets']} retargeted · "
+              f"{tw['finished']} finished")
+        for name, v in self.vision.stats().items():
+            print(f"[vision] {name}: {v['completed']}/{v['submitted']} frames · "
+                  f"{v['dropped']} dropped · infer {v['infer_ms']:.1f}ms")
+        tr = self.tracker.stats()
+        print(f"[tracker] {tr['detections']} detector calls for {tr['frames']} frames "
+              f"({tr['frames_per_detection']:.1f} frames each)")
+        for name, m in self.infer.stats()["models"].items():
+            print(f"[infer] {name}: {m['effective_hz']:.1f}/{m['target_hz']:.0f} Hz · "
+                  f"{m['skipped']} skipped · cpu {m['cpu'] * 100:.0f}%")
+        self.vision.shutdown()
+        super().closeEvent(ev)
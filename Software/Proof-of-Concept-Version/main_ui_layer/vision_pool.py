@@ -0,0 +1,313 @@
+# vision_pool.py
+
+import multiprocessing as mp
+import threading
+import time
+from concurrent.futures import Future
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait as wait_conns
+
+import numpy as np
+from PyQt5.QtCore import QObject, pyqtSignal
+
+import vision_workers
+
+
+class _Worker:
+    """Parent-side state for one model process."""
+    __slots__ = ("name", "kind", "kwargs", "proc", "conn", "shm", "slot_bytes",
+                 "retired", "busy", "pending", "failed", "dead_until",
+                 "restarts", "submitted", "completed", "dropped", "errors",
+                 "infer_ms", "latency_ms")
+
+    def __init__(self, name, kind, kwargs):
+        self.name, self.kind, self.kwargs = name, kind, kwargs
+        self.proc = self.conn = self.shm = None
+        self.slot_bytes = 0
+        self.retired = []          # segments still mapped by an in-flight job
+        self.busy = None           # (seq, slot, future, t_submit) being inferred
+        self.pending = None        # (seq, slot, shape, dtype, future, t_submit)
+        self.failed = None
+        self.dead_until = 0.0
+        self.restarts = 0
+        self.submitted = self.completed = self.dropped = self.errors = 0
+        self.infer_ms = self.latency_ms = 0.0
+
+
+class VisionPool(QObject):
+    """
+    Runs each vision model (detector, gesture, OCR, mediapipe hands) in its
+    own long-lived process, so inference never blocks the GUI thread.
+
+    submit() copies the frame into one of two shared-memory slots owned by
+    that model and sends only the slot handle over a pipe. Each model has at
+    most one frame in flight and one waiting: a newer frame replaces the
+    waiting one (its future is cancelled), so a slow model skips frames
+    instead of building a backlog. Results come back on a receiver thread
+    as futures, and as resultReady(model, seq, result) on the GUI thread.
+
+    With a `scheduler` (inference_scheduler.py), frames it doesn't mark due
+    are skipped before they are copied, and each worker's pid and per-frame
+    time are fed back to it.
+
+        pool = install(window)
+        pool.register("hands", min_detection_confidence=0.6)
+        pool.resultReady.connect(on_result)
+        if pool.wants("hands"):
+            pool.submit("hands", bus_frame.frame, bus_frame.seq)
+    """
+    resultReady = pyqtSignal(str, int, object)   # model name, frame seq, result
+
+    def __init__(self, parent=None, scheduler=None, start_method="spawn", max_backoff=30.0):
+        super().__init__(parent)
+        self.scheduler = scheduler
+        self._mp = mp.get_context(start_method)
+        self.max_backoff = max_backoff
+        self._workers = {}
+        self._lock = threading.RLock()    # future callbacks may submit() again
+        self._halt = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="vision-pool", daemon=True)
+        self._thread.start()
+
+    def register(self, name, kind=None, **kwargs):
+        """
+        Declare model `name` (a vision_workers.MODELS kind, default `name`).
+        The process starts on the first submit(); the first registration of
+        a name wins, so panes sharing a model share its process.
+        """
+        kind = kind or name
+        if kind not in vision_workers.MODELS:
+            raise KeyError(f"unknown vision model '{kind}'")
+        with self._lock:
+            if name not in self._workers:
+                self._workers[name] = _Worker(name, kind, kwargs)
+
+    def submit(self, name, frame, seq):
+        """
+        Queue `frame` for model `name`. Returns a Future tagged with .seq;
+        it is cancelled if the scheduler skips the frame or a newer frame
+        replaces it before inference starts.
+        """
+        fut = Future()
+        fut.seq = seq
+        if self.scheduler is not None and not self.scheduler.due(name):
+            fut.cancel()
+            return fut
+        with self._lock:
+            w = self._workers[name]
+            w.submitted += 1
+            if w.pending is not None:
+                w.pending[4].cancel()
+                w.dropped += 1
+                w.pending = None
+            # segment before process, so a forked child shares the resource tracker
+            self._ensure_capacity(w, frame.nbytes)
+            if not self._ensure_running(w):
+                w.dropped += 1
+                fut.cancel()
+                return fut
+            slot = 1 - w.busy[1] if w.busy else 0
+            dst = np.ndarray(frame.shape, frame.dtype, buffer=w.shm.buf,
+                             offset=slot * w.slot_bytes)
+            np.copyto(dst, frame)
+            del dst
+            w.pending = (seq, slot, frame.shape, frame.dtype.str, fut, time.perf_counter())
+            self._dispatch(w)
+        return fut
+
+    def wants(self, name):
+        """
+        True if submit(name, ...) would take a frame now: the scheduler has
+        it due and the worker is not failed or backing off. Consumes nothing,
+        so call it before fetching or converting the frame.
+        """
+        if self.scheduler is not None and not self.scheduler.ready(name):
+            return False
+        with self._lock:
+            w = self._workers.get(name)
+            return w is not None and not w.failed and (
+                w.conn is not None or time.monotonic() >= w.dead_until)
+
+    def is_busy(self, name):
+        """True while `name` has a frame in flight."""
+        w = self._workers.get(name)
+        return w is not None and w.busy is not None
+
+    # ---- internals (called with self._lock held) ----
+    def _ensure_running(self, w):
+        if w.failed:
+            return False
+        if w.conn is not None:
+            return True
+        if time.monotonic() < w.dead_until:
+            return False
+        parent_conn, child_conn = self._mp.Pipe()
+        w.proc = self._mp.Process(target=vision_workers.worker_main,
+                                  args=(w.kind, w.kwargs, child_conn),
+                                  name=f"vision-{w.name}", daemon=True)
+        w.proc.start()
+        child_conn.close()      # so a dead child shows up as EOF
+        w.conn = parent_conn
+        if self.scheduler is not None:
+            self.scheduler.attach_process(w.name, w.proc.pid)
+        return True
+
+    def _ensure_capacity(self, w, nbytes):
+        if w.shm is not None and nbytes <= w.slot_bytes:
+            return
+        if w.shm is not None:
+            if w.busy:
+                w.retired.append(w.shm)
+            else:
+                self._release(w.shm)
+        w.slot_bytes = nbytes
+        w.shm = shared_memory.SharedMemory(create=True, size=2 * nbytes)
+
+    def _dispatch(self, w):
+        while w.pending is not None and w.busy is None:
+            seq, slot, shape, dtype, fut, t0 = w.pending
+            w.pending = None
+            if not fut.set_running_or_notify_cancel():
+                continue
+            w.busy = (seq, slot, fut, t0)
+            try:
+                w.conn.send((seq, w.shm.name, slot * w.slot_bytes, shape, dtype))
+            except OSError:
+                # died before the receiver noticed; keep a load failure if it sent one
+                try:
+                    if w.conn.poll():
+                        msg = w.conn.recv()
+                        if msg[0] < 0:
+                            w.failed = msg[3]
+                except (EOFError, OSError):
+                    pass
+                self._lost(w, w.failed or "worker exited")
+
+    @staticmethod
+    def _release(shm):
+        shm.close()
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+    # ---- receiver thread ----
+    def _run(self):
+        while not self._halt.is_set():
+            with self._lock:
+                conns = {w.conn: w for w in self._workers.values() if w.conn is not None}
+            if not conns:
+                self._halt.wait(0.05)
+                continue
+            try:
+                ready = wait_conns(list(conns), timeout=0.05)
+            except OSError:
+                continue          # a connection was closed under us; re-snapshot
+            for conn in ready:
+                w = conns[conn]
+                try:
+                    msg = conn.recv()
+                except (EOFError, OSError):
+                    self._lost(w, "worker exited")
+                    continue
+                self._on_result(w, msg)
+
+    def _on_result(self, w, msg):
+        seq, out, infer_ms, err = msg
+        if seq < 0:
+            w.failed = err
+            self._lost(w, err)
+            return
+        with self._lock:
+            busy, w.busy = w.busy, None
+            for shm in w.retired:
+                self._release(shm)
+            w.retired.clear()
+            self._dispatch(w)
+        if busy is None:
+            return
+        fut, t0 = busy[2], busy[3]
+        w.completed += 1
+        w.infer_ms += (infer_ms - w.infer_ms) * 0.2
+        w.latency_ms += ((time.perf_counter() - t0) * 1000.0 - w.latency_ms) * 0.2
+        if self.scheduler is not None:
+            self.scheduler.report(w.name, infer_ms)
+        if err:
+            w.errors += 1
+            if w.errors == 1:
+                print(f"⚠️ vision model '{w.name}' raised:\n{err}")
+            fut.set_exception(RuntimeError(err))
+            return
+        fut.set_result(out)
+        self.resultReady.emit(w.name, seq, out)
+
+    def _lost(self, w, why):
+        with self._lock:
+            busy, pending = w.busy, w.pending
+            w.busy = w.pending = None
+            if w.conn is not None:
+                w.conn.close()
+            w.conn = w.proc = None
+            if not w.failed:
+                w.dead_until = time.monotonic() + min(2 ** w.restarts, self.max_backoff)
+                w.restarts += 1
+        if busy is not None:
+            busy[2].set_exception(RuntimeError(f"vision model '{w.name}': {why}"))
+        if pending is not None:
+            pending[4].cancel()
+        if not self._halt.is_set():
+            print(f"⚠️ vision model '{w.name}' stopped: {why}")
+
+    # ---- lifecycle ----
+    def shutdown(self):
+        self._halt.set()
+        self._thread.join(timeout=1.0)
+        with self._lock:
+            workers = list(self._workers.values())
+        for w in workers:
+            if w.conn is not None:
+                try:
+                    w.conn.send(None)
+                except OSError:
+                    pass
+            if w.proc is not None:
+                w.proc.join(timeout=1.0)
+                if w.proc.is_alive():
+                    w.proc.terminate()
+            if w.conn is not None:
+                w.conn.close()
+            w.conn = w.proc = None
+            if w.busy is not None:
+                w.busy[2].set_exception(RuntimeError("vision pool shut down"))
+            if w.pending is not None:
+                w.pending[4].cancel()
+            w.busy = w.pending = None
+            for shm in w.retired + ([w.shm] if w.shm else []):
+                self._release(shm)
+            w.shm, w.retired = None, []
+
+    def stats(self):
+        with self._lock:
+            return {
+                w.name: {"submitted": w.submitted, "completed": w.completed,
+                         "dropped": w.dropped, "errors": w.errors,
+                         "restarts": w.restarts, "infer_ms": w.infer_ms,
+                         "latency_ms": w.latency_ms, "running": w.conn is not None,
+                         "failed": w.failed}
+                for w in self._workers.values()
+            }
+
+
+POOL = None
+
+
+def install(parent=None, **kw):
+    global POOL
+    POOL = VisionPool(parent, **kw)
+    return POOL
+
+
+def get():
+    if POOL is None:
+        install()
+    return POOL
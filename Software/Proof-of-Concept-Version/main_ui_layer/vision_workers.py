@@ -0,0 +1,106 @@
+# vision_workers.py
+#
+# Child-process side of the vision pool (see vision_pool.py). Kept free of
+# Qt so a spawned worker only imports numpy, its model and nothing else.
+
+import time
+import traceback
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# mediapipe hand landmark indices used by the panes
+WRIST, THUMB_TIP, INDEX_FINGER_TIP = 0, 4, 8
+
+
+def _load_detector(**kw):
+    from tpu_detector import TPUDetector
+    return TPUDetector(**kw).detect
+
+
+def _load_gesture(**kw):
+    from apps.gesture_tracker import GestureTracker
+    kw.setdefault("every", 1)      # the parent's scheduler already skips frames
+    return GestureTracker(**kw).detect
+
+
+def _load_ocr(**kw):
+    # [(x, y, w, h, text, conf, cached)]; the region cache lives in this process
+    from ocr_manager import OCRManager
+    return OCRManager(**kw).read_regions
+
+
+def _load_hands(**kw):
+    import mediapipe as mp
+    opts = dict(static_image_mode=False, max_num_hands=1,
+                min_detection_confidence=0.6, min_tracking_confidence=0.6)
+    opts.update(kw)
+    hands = mp.solutions.hands.Hands(**opts)
+
+    def process(rgb):
+        # mediapipe results don't pickle; ship plain tuples instead:
+        # [(score, [(x, y, z) * 21]), ...] with normalised coordinates
+        res = hands.process(rgb)
+        if not res.multi_hand_landmarks:
+            return []
+        scores = [h.classification[0].score for h in (res.multi_handedness or [])]
+        out = []
+        for i, lm in enumerate(res.multi_hand_landmarks):
+            score = scores[i] if i < len(scores) else 1.0
+            out.append((score, [(p.x, p.y, p.z) for p in lm.landmark]))
+        return out
+    return process
+
+
+# kind -> loader(**kwargs) returning fn(frame) -> picklable result
+MODELS = {
+    "detector": _load_detector,
+    "gesture":  _load_gesture,
+    "ocr":      _load_ocr,
+    "hands":    _load_hands,
+}
+
+
+def worker_main(kind, kwargs, conn):
+    """
+    Long-lived model process. Receives (seq, shm_name, offset, shape, dtype)
+    jobs, runs the model on the frame in shared memory and replies with
+    (seq, result, infer_ms, error); seq -1 reports a model that failed to
+    load. None on the pipe means shut down.
+    """
+    try:
+        run = MODELS[kind](**kwargs)
+    except Exception as e:
+        conn.send((-1, None, 0.0, f"load failed: {e}"))
+        return
+
+    segments = {}
+    try:
+        while True:
+            try:
+                job = conn.recv()
+            except EOFError:
+                break
+            if job is None:
+                break
+            seq, name, offset, shape, dtype = job
+            shm = segments.get(name)
+            if shm is None:
+                # the pool moved to a bigger segment; drop the old mapping
+                for old in segments.values():
+                    old.close()
+                segments.clear()
+                shm = segments[name] = shared_memory.SharedMemory(name=name)
+            frame = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+            t0 = time.perf_counter()
+            try:
+                out, err = run(frame), None
+            except Exception:
+                out, err = None, traceback.format_exc(limit=3)
+            del frame
+            conn.send((seq, out, (time.perf_counter() - t0) * 1000.0, err))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for shm in segments.values():
+            shm.close()
@@ -1,56 +1,150 @@
 # voice_manager.py
 
-import queue
 import json
-import sounddevice as sd
-from vosk import Model, KaldiRecognizer
+import threading
+import time
+
 from PyQt5.QtCore import QThread, pyqtSignal
 
+import audio_capture
+
+try:
+    from vosk import Model, KaldiRecognizer
+except Exception:
+    Model = KaldiRecognizer = None
+
+MODEL_PATH = "models/vosk-model-small-en-us-0.15"
+
+_MODELS = {}
+_MODELS_LOCK = threading.Lock()
+
+
+def load_model(path=MODEL_PATH):
+    """Load a Vosk model once per process; every recogniser shares it."""
+    with _MODELS_LOCK:
+        model = _MODELS.get(path)
+        if model is None:
+            model = _MODELS[path] = Model(path)
+        return model
+
+
 class VoiceManager(QThread):
     """
-    Runs Vosk STT on the mic once triggered.
+    Streams mic audio into Vosk once triggered.
+
+    Audio comes from the shared always-open capture ring (audio_capture.py)
+    in 20 ms blocks, starting a little before the trigger. Blocks go to the
+    recogniser in ~100 ms chunks; after each chunk the partial hypothesis
+    is emitted as `partialResult` whenever it changes, so panes can act
+    before the utterance ends. A VAD endpointer closes the utterance after
+    a short silence instead of waiting for Kaldi's own endpoint.
     Emits `commandRecognized` with the final text.
+
+    stats() reports time-to-first-partial (speech onset to first non-empty
+    partial) and finalize latency (endpoint to final text), both smoothed.
     """
     commandRecognized = pyqtSignal(str)
+    partialResult = pyqtSignal(str)
+    speechStarted = pyqtSignal()
+
+    CHUNK_S = 0.1            # audio per AcceptWaveform call
+    PREROLL_S = 0.3          # audio kept from before start_listening()
+    LISTEN_TIMEOUT_S = 5.0   # give up if nobody speaks
 
     def __init__(self,
-                 model_path: str = "models/vosk-model-small-en-us-0.15"):
+                 model_path: str = MODEL_PATH):
         super().__init__()
-        self.q = queue.Queue()
         try:
-            self.model = Model(model_path)
-            self.rec = KaldiRecognizer(self.model, 16000)
+            self.model = load_model(model_path)
+            self.rec = KaldiRecognizer(self.model, audio_capture.SAMPLE_RATE)
             self.running = False
         except Exception as e:
             print(f"⚠️ VoiceManager init failed: {e}")
             self.rec = None
             self.running = False
+        self.capture = None
+        self.endpointer = audio_capture.Endpointer()
+        self.first_partial_ms = None
+        self.finalize_ms = None
+        self.utterances = 0
+        self.timeouts = 0
 
     def start_listening(self):
-        if not self.rec:
+        if not self.rec or self.isRunning():
+            return
+        self.capture = audio_capture.shared()
+        if not self.capture.running:
             return
         self.running = True
         self.start()
 
     def run(self):
-        def callback(indata, frames, time, status):
-            self.q.put(bytes(indata))
-
-        with sd.RawInputStream(
-            samplerate=16000, blocksize=8000,
-            dtype='int16', channels=1,
-            callback=callback
-        ):
-            while self.running:
-                data = self.q.get()
-                if self.rec.AcceptWaveform(data):
-                    res = json.loads(self.rec.Result())
-                    text = res.get("text","").strip()
-                    if text:
-                        self.commandRecognized.emit(text)
-                        break
+        ring = self.capture.ring
+        block = self.capture.block
+        chunk = int(self.CHUNK_S * ring.rate)
+        cursor = ring.cursor(self.PREROLL_S)
+        self.endpointer.reset()
+        self.rec.Reset()
+
+        deadline = time.monotonic() + self.LISTEN_TIMEOUT_S
+        t_speech = None
+        last_partial = ""
+        pending = []
+        text = ""
+        while self.running:
+            if not ring.wait(cursor, 0.05):
+                if t_speech is None and time.monotonic() > deadline:
+                    self.timeouts += 1
+                    break
+                continue
+            samples, cursor = ring.read(cursor)
+            ended = False
+            for i in range(0, len(samples) - block + 1, block):
+                event = self.endpointer.push(samples[i:i + block])
+                if event == "start":
+                    t_speech = time.monotonic()
+                    self.speechStarted.emit()
+                elif event == "end":
+                    ended = True
+            pending.append(samples)
+
+            if sum(len(p) for p in pending) < chunk and not ended:
+                continue
+            data = b"".join(p.tobytes() for p in pending)
+            pending = []
+            if self.rec.AcceptWaveform(data):
+                text = json.loads(self.rec.Result()).get("text", "").strip()
+                if text:
+                    break
+            elif t_speech is not None:
+                partial = json.loads(self.rec.PartialResult()).get("partial", "").strip()
+                if partial and partial != last_partial:
+                    if not last_partial:
+                        self._smooth("first_partial_ms", (time.monotonic() - t_speech) * 1000.0)
+                    last_partial = partial
+                    self.partialResult.emit(partial)
+            if ended:
+                t_end = time.monotonic()
+                text = json.loads(self.rec.FinalResult()).get("text", "").strip()
+                self._smooth("finalize_ms", (time.monotonic() - t_end) * 1000.0)
+                break
+
+        if text:
+            self.utterances += 1
+            self.commandRecognized.emit(text)
         self.running = False
 
+    def _smooth(self, attr, value):
+        old = getattr(self, attr)
+        setattr(self, attr, value if old is None else old + (value - old) * 0.2)
+
+    def stats(self):
+        ring = self.capture.ring if self.capture else None
+        return {"utterances": self.utterances, "timeouts": self.timeouts,
+                "first_partial_ms": self.first_partial_ms,
+                "finalize_ms": self.finalize_ms,
+                "overruns": ring.overruns if ring else 0}
+
     def stop(self):
         self.running = False
         self.wait()
@@ -1,11 +1,15 @@
 # drawing_pane.py
 
 import cv2, numpy as np
-import mediapipe as mp
-from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtCore import QRect, Qt
 from PyQt5.QtWidgets import QWidget
 from PyQt5.QtGui import QPainter, QPen, QColor
 
+from frame_scheduler import invalidate
+import vision_pool
+import inference_scheduler
+from vision_workers import INDEX_FINGER_TIP
+
 class DrawingPane(QWidget):
     """
     Air-drawing canvas: track your index fingertip
@@ -18,41 +22,51 @@ class DrawingPane(QWidget):
         self.setAttribute(Qt.WA_OpaquePaintEvent)
         self.setAutoFillBackground(False)
 
-        # Mediapipe hand tracker
-        self.hands = mp.solutions.hands.Hands(
-            static_image_mode=False,
-            max_num_hands=1,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.7
-        )
+        # Mediapipe hands run in the shared vision pool; results arrive
+        # asynchronously, tagged with the frame they belong to. The model
+        # name is this pane's own, so other panes' hand results never land
+        # here, and the stricter detection threshold applies only to drawing.
+        self.model = "hands_draw"
+        self.vision = vision_pool.get()
+        self.vision.register(self.model, kind="hands", max_num_hands=1,
+                             min_detection_confidence=0.7)
+        self.vision.resultReady.connect(self._on_vision)
+        inference_scheduler.get().declare(self.model, rate_hz=15, priority=1, owner=self)
+        self._hand_seq = 0
         self.path = []  # list of QPointF
 
-        # throttle to 15fps
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.step)
-        self.timer.start(66)
+        # shared RGB frames at mediapipe's working size (landmarks are
+        # normalised, so the downscale costs no accuracy in screen space)
+        self.frames = self.camera.frames.subscribe("rgb", size=(480, 270))
 
-    def step(self):
-        pix = self.camera.pixmap()
-        if pix is None or pix.isNull():
-            return
+        # offer every camera frame; the scheduler picks which ones run
+        self.camera.frameArrived.connect(self.step)
 
-        # convert to RGB numpy
-        img = pix.toImage().convertToFormat(pix.toImage().Format_RGB888)
-        w, h = img.width(), img.height()
-        ptr = img.constBits()
-        ptr.setsize(img.byteCount())
-        arr = np.frombuffer(ptr, np.uint8).reshape(h,w,3)
-        rgb = cv2.cvtColor(arr, cv2.COLOR_RGB2BGR)
+    def step(self, _seq=None):
+        # ask before polling: poll() converts the frame and marks it seen
+        if not self.isVisible() or not self.vision.wants(self.model):
+            return
+        f = self.frames.poll()
+        if f is None:
+            return
+        # never waits: a frame the worker can't take yet replaces the last one
+        self.vision.submit(self.model, f.frame, f.seq)
 
-        # detect hand + index fingertip
-        res = self.hands.process(rgb)
-        if res.multi_hand_landmarks:
-            lm = res.multi_hand_landmarks[0].landmark[mp.solutions.hands.HandLandmark.INDEX_FINGER_TIP]
-            x = int(lm.x * self.width())
-            y = int(lm.y * self.height())
-            self.path.append((x,y))
-        self.update()
+    def _on_vision(self, model, seq, hands):
+        if model != self.model or seq <= self._hand_seq:
+            return
+        self._hand_seq = seq
+        if not hands:
+            return
+        # detect index fingertip
+        lm = hands[0][1][INDEX_FINGER_TIP]
+        x = int(lm[0] * self.width())
+        y = int(lm[1] * self.height())
+        self.path.append((x,y))
+        # only the new segment (plus pen width) needs repainting
+        x0, y0 = self.path[-2] if len(self.path) > 1 else (x, y)
+        invalidate(self, QRect(min(x0, x) - 4, min(y0, y) - 4,
+                               abs(x - x0) + 9, abs(y - y0) + 9))
 
     def paintEvent(self, ev):
         p = QPainter(self)
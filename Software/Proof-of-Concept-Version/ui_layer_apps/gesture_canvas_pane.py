@@ -1,9 +1,12 @@
 import cv2
 import numpy as np
-import mediapipe as mp
 from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout
 from PyQt5.QtGui import QPixmap, QImage, QPainter, QPen, QColor
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt
+
+import vision_pool
+import inference_scheduler
+from vision_workers import INDEX_FINGER_TIP, THUMB_TIP
 
 class GestureCanvasPane(QWidget):
     """
@@ -21,73 +24,82 @@ class GestureCanvasPane(QWidget):
 
         # Canvas for drawing
         self.canvas = None
+        self._out = None
+        # full-size BGR for the overlay, small RGB for mediapipe
+        self.frames = self.camera.frames.subscribe("bgr")
+        self.hand_frames = self.camera.frames.subscribe("rgb", size=(480, 270))
         self.drawing = False
         self.prev_pt = None
 
-        # MediaPipe Hands
+        # MediaPipe Hands, in the shared vision pool (off the GUI thread),
+        # under this pane's own model name so only our results come back
+        self.model = "hands_pinch"
         try:
-            self.hands = mp.solutions.hands.Hands(
-                static_image_mode=False,
-                max_num_hands=1,
-                min_detection_confidence=0.6,
-                min_tracking_confidence=0.6
-            )
-            self.mp_draw = mp.solutions.drawing_utils
+            self.vision = vision_pool.get()
+            self.vision.register(self.model, kind="hands", max_num_hands=1)
+            self.vision.resultReady.connect(self._on_vision)
+            inference_scheduler.get().declare(self.model, rate_hz=30, priority=1, owner=self)
             self.gesture_enabled = True
         except Exception:
-            self.hands = None
+            self.vision = None
             self.gesture_enabled = False
+        self._hand_seq = 0
 
-        # Update loop
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_frame)
-        self.timer.start(30)
+        # Update loop: redraw at the camera's pace; hand tracking runs at
+        # whatever rate the scheduler grants it
+        self.camera.frameArrived.connect(self.update_frame)
 
-    def update_frame(self):
-        pix = self.camera.pixmap()
-        if pix is None or pix.isNull():
+    def update_frame(self, _seq=None):
+        if not self.isVisible():
+            return
+        f = self.frames.poll()
+        if f is None:
             return
-        # Convert to CV
-        img = self.qpixmap_to_cv(pix)
+        img = f.frame  # shared read-only BGR view
         h, w, _ = img.shape
 
-        if self.canvas is None:
+        if self.canvas is None or self.canvas.shape != img.shape:
             self.canvas = np.zeros_like(img)
+            self._out = np.empty_like(img)
 
-        if self.gesture_enabled:
-            rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-            res = self.hands.process(rgb)
-            if res.multi_hand_landmarks:
-                lm = res.multi_hand_landmarks[0]
-                # get tip of index finger and thumb
-                tip_i = lm.landmark[mp.solutions.hands.HandLandmark.INDEX_FINGER_TIP]
-                tip_t = lm.landmark[mp.solutions.hands.HandLandmark.THUMB_TIP]
-                pt_i = (int(tip_i.x*w), int(tip_i.y*h))
-                pt_t = (int(tip_t.x*w), int(tip_t.y*h))
-                # distance
-                d = np.hypot(pt_i[0]-pt_t[0], pt_i[1]-pt_t[1]) / max(w,h)
-                # pinch threshold
-                if d < 0.05:
-                    if self.prev_pt:
-                        cv2.line(self.canvas, self.prev_pt, pt_i, (0,255,0), 4)
-                    self.prev_pt = pt_i
-                else:
-                    self.prev_pt = None
+        # hand results land in _on_vision whenever the worker catches up;
+        # the overlay below keeps the camera's pace either way. Ask the pool
+        # first, so frames the scheduler would skip are never converted.
+        hand = None
+        if self.gesture_enabled and self.vision.wants(self.model):
+            hand = self.hand_frames.poll()
+        if hand is not None:
+            self.vision.submit(self.model, hand.frame, hand.seq)
 
-        # Overlay canvas on frame
-        overlay = cv2.addWeighted(img, 1.0, self.canvas, 0.7, 0)
+        # Overlay canvas on frame into the reused output buffer
+        overlay = cv2.addWeighted(img, 1.0, self.canvas, 0.7, 0, dst=self._out)
         qpix = self.cv_to_qpixmap(overlay)
         self.view.setPixmap(qpix.scaled(
             self.width(), self.height(),
             Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation
         ))
 
-    def qpixmap_to_cv(self, pix):
-        img = pix.toImage().convertToFormat(QImage.Format_RGBA8888)
-        w, h = img.width(), img.height()
-        ptr = img.constBits(); ptr.setsize(img.byteCount())
-        arr = np.frombuffer(ptr, np.uint8).reshape((h, w, 4))
-        return cv2.cvtColor(arr, cv2.COLOR_RGBA2BGR)
+    def _on_vision(self, model, seq, hands):
+        if model != self.model or seq <= self._hand_seq or self.canvas is None:
+            return
+        self._hand_seq = seq
+        if not hands:
+            return
+        h, w = self.canvas.shape[:2]
+        lm = hands[0][1]
+        # get tip of index finger and thumb
+        tip_i, tip_t = lm[INDEX_FINGER_TIP], lm[THUMB_TIP]
+        pt_i = (int(tip_i[0]*w), int(tip_i[1]*h))
+        pt_t = (int(tip_t[0]*w), int(tip_t[1]*h))
+        # distance
+        d = np.hypot(pt_i[0]-pt_t[0], pt_i[1]-pt_t[1]) / max(w,h)
+        # pinch threshold
+        if d < 0.05:
+            if self.prev_pt:
+                cv2.line(self.canvas, self.prev_pt, pt_i, (0,255,0), 4)
+            self.prev_pt = pt_i
+        else:
+            self.prev_pt = None
 
     def cv_to_qpixmap(self, frame):
         rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
@@ -11,14 +11,20 @@ except ImportError:
 class GestureTracker:
     """
     Runs a small palm-vs-fist or gesture classifier on the Edge TPU
-    every few frames, otherwise skips.
+    every `every` frames; skipped frames return the last result.
+    (In the vision pool the inference scheduler does the skipping, so the
+    worker uses every=1.)
     """
     def __init__(self,
                  model_path: str = "models/gesture_edgetpu.tflite",
                  resolution=(128,128),
-                 threshold: float = 0.6):
+                 threshold: float = 0.6,
+                 every: int = 3):
         self.resolution = resolution
         self.threshold = threshold
+        self.every = max(1, every)
+        self._frame = 0
+        self._last = None
         self.use_tpu = False
 
         if EDGE_SUPPORTED:
@@ -44,6 +50,9 @@ class GestureTracker:
         """
         if not self.use_tpu:
             return None
+        self._frame += 1
+        if (self._frame - 1) % self.every:
+            return self._last
 
         # Center-crop
         h, w, _ = frame.shape
@@ -57,5 +66,7 @@ class GestureTracker:
         self.interpreter.invoke()
         classes = classify.get_classes(self.interpreter, top_k=1)
         if classes and classes[0].score >= self.threshold:
-            return self.gesture_map.get(classes[0].id)
-        return None
+            self._last = self.gesture_map.get(classes[0].id)
+        else:
+            self._last = None
+        return self._last
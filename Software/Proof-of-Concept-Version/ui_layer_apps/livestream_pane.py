@@ -34,7 +34,12 @@ class LiveStreamPane(QWidget):
 
     def _stream_loop(self):
         # Stub: grab frames and push to RTSP/WebRTC server
-        while self.streaming:
-            pix = self.camera.pixmap()
-            # convert to CV and push...
-            pass
+        frames = self.camera.frames.subscribe("bgr", size=(640, 360), max_fps=15)
+        try:
+            while self.streaming:
+                f = frames.wait(timeout=0.5)
+                if f is None:
+                    continue
+                # push f.frame (BGR ndarray) to the encoder here...
+        finally:
+            frames.close()
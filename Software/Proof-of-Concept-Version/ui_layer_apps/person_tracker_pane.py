@@ -1,35 +1,68 @@
 # apps/person_tracker_pane.py
 import cv2
 from PyQt5.QtWidgets import QLabel, QVBoxLayout
-from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QImage, QPixmap, QPainter, QPen, QColor, QFont
+from PyQt5.QtCore import Qt, QRectF
+from PyQt5 import sip
 from .base_pane import BasePane
 
 class PersonTrackerPane(BasePane):
     """
     Shows live camera with bounding boxes for “person” and
-    follows the label around.
+    follows the label around (tracks from object_tracker.py keep their
+    id while the person moves).
     """
-    def __init__(self, camera_feed, ctx_assistant, parent=None):
+    def __init__(self, camera_feed, ctx_assistant, tracker=None, parent=None):
         super().__init__(parent)
         self.camera = camera_feed
         self.ctx    = ctx_assistant
+        self.people = []
+        if tracker is not None:
+            tracker.tracksUpdated.connect(self._on_tracks)
 
         layout = QVBoxLayout(self)
         self.lbl = QLabel(alignment=Qt.AlignCenter)
         layout.addWidget(self.lbl)
 
-        # Every time ContextualAssistant emits a new overlay frame:
-        self.ctx.frameOverlay.connect(self._update_frame)
-
-    def _update_frame(self, pixmap):
-        # draw your bounding‐box overlay out of the pixmap
-        self.lbl.setPixmap(
-            pixmap.scaled(
-                self.lbl.size(),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
+        # shared RGB frames from the camera's FrameBus
+        self.frames = self.camera.frames.subscribe("rgb", max_fps=10)
+
+        # Every time ContextualAssistant sees a new camera frame:
+        self.ctx.frameReady.connect(self._update_frame)
+
+    def _update_frame(self, _slot=None):
+        if not self.isVisible():
+            return
+        f = self.frames.poll()
+        if f is None:
+            return
+        # draw your bounding‐box overlay out of the frame
+        h, w = f.frame.shape[:2]
+        img = QImage(sip.voidptr(f.frame.ctypes.data), w, h, f.frame.strides[0], QImage.Format_RGB888)
+        pix = QPixmap.fromImage(img).scaled(
+            self.lbl.size(),
+            Qt.KeepAspectRatio,
+            Qt.SmoothTransformation
         )
+        if self.people:
+            self._draw_people(pix)
+        self.lbl.setPixmap(pix)
+
+    def _on_tracks(self, tracks):
+        self.people = [t for t in tracks if t.label == "person"]
+
+    def _draw_people(self, pix):
+        pw, ph = pix.width(), pix.height()
+        p = QPainter(pix)
+        p.setPen(QPen(QColor(255, 200, 0), 3))
+        p.setFont(QFont("Arial", 12, QFont.Bold))
+        for t in self.people:
+            x0, y0, x1, y1 = t.box
+            r = QRectF(x0 * pw, y0 * ph, (x1 - x0) * pw, (y1 - y0) * ph)
+            p.drawRect(r)
+            p.drawText(r.adjusted(0, -20, 0, 0), Qt.AlignLeft | Qt.AlignTop,
+                       f"person #{t.track_id} {t.score:.0%}")
+        p.end()
 
     def onShow(self):
         pass
\ No newline at end of file
@@ -1,14 +1,28 @@
-import pytesseract
+from concurrent.futures import ThreadPoolExecutor
+
 from googletrans import Translator
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PyQt5.QtGui import QFont
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSignal
+
+import vision_pool
+import inference_scheduler
 
 class TranslatorPane(QWidget):
+    translated = pyqtSignal(int, str)   # request number, translated text
+
     def __init__(self, camera_feed, parent=None):
         super().__init__(parent)
         self.camera = camera_feed
+        # googletrans is a network round trip per line: it runs on one
+        # worker thread and the result comes back through `translated`
         self.translator = Translator()
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="translate")
+        self._translations = {}     # source line -> translated line (worker thread only)
+        self._request = 0
+        self.translated.connect(self._on_translated)
+        self._ocr_seq = 0
+        self._shown = None
         layout = QVBoxLayout(self)
         font = QFont("Helvetica Neue",14)
         if not font.exactMatch(): font = QFont("Arial",14)
@@ -19,7 +33,58 @@ class TranslatorPane(QWidget):
         layout.addWidget(self.src_label)
         layout.addWidget(self.dst_label)
 
+        # OCR runs in the vision pool: text regions only, cached per region,
+        # so a sign that stays in view is read once
+        self.vision = vision_pool.get()
+        self.vision.register("ocr")
+        self.vision.resultReady.connect(self._on_vision)
+        inference_scheduler.get().declare("ocr", rate_hz=2, priority=3, owner=self)
+        # full-resolution gray: small text needs the pixels
+        self.frames = self.camera.frames.subscribe("gray")
+        self.camera.frameArrived.connect(self.step)
+
+    def step(self, _seq=None):
+        # ask before polling: a full-resolution gray conversion at camera
+        # rate is wasted on a 2 Hz model
+        if not self.isVisible() or not self.vision.wants("ocr"):
+            return
+        f = self.frames.poll()
+        if f is not None:
+            self.vision.submit("ocr", f.frame, f.seq)
+
+    def _on_vision(self, model, seq, regions):
+        if model != "ocr" or seq <= self._ocr_seq:
+            return
+        self._ocr_seq = seq
+        lines = tuple(r[4] for r in regions)
+        if not lines or lines == self._shown:
+            return
+        self._shown = lines
+        self.translate_current("\n".join(lines))
+
     def translate_current(self, text):
         self.src_label.setText(text)
-        res = self.translator.translate(text, dest='en')
-        self.dst_label.setText(res.text)
\ No newline at end of file
+        self._request += 1
+        self._pool.submit(self._translate, self._request, text)
+
+    def _translate(self, request, text):
+        # worker thread; a request overtaken while queued is not sent at all
+        if request != self._request:
+            return
+        # translate line by line so unchanged lines never go back to the service
+        out = []
+        for line in text.splitlines():
+            if line not in self._translations:
+                if len(self._translations) > 256:
+                    self._translations.clear()
+                try:
+                    self._translations[line] = self.translator.translate(line, dest='en').text
+                except Exception as e:
+                    print(f"⚠️ translate failed: {e}")
+                    return
+            out.append(self._translations[line])
+        self.translated.emit(request, "\n".join(out))
+
+    def _on_translated(self, request, text):
+        if request == self._request:
+            self.dst_label.setText(text)
@@ -1,5 +1,8 @@
 import pyttsx3
-engine = pyttsx3.init()
-engine.setProperty('rate', 150)
-engine.say("Hello, this is a test of the Text-to-Speech capabilities of AriesOS")
-engine.runAndWait()
\ No newline at end of file
+
+if __name__ == "__main__":
+    # blocking demo; the app speaks through a TTS worker thread instead
+    engine = pyttsx3.init()
+    engine.setProperty('rate', 150)
+    engine.say("Hello, this is a test of the Text-to-Speech capabilities of AriesOS")
+    engine.runAndWait()
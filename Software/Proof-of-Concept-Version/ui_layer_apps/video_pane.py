@@ -1,6 +1,7 @@
 import cv2, time, os
+import numpy as np
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 
 class VideoPane(QWidget):
     def __init__(self, camera_feed, parent=None):
@@ -8,6 +9,12 @@ class VideoPane(QWidget):
         self.camera = camera_feed
         self.recording = False
         self.writer = None
+        self.rec_size = (640,480)
+        self._seq = 0
+        self._scaled = np.empty((self.rec_size[1], self.rec_size[0], 3), np.uint8)
+        # pull frames from the capture ring at the writer's 20fps
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self._pull_frame)
         layout = QVBoxLayout(self)
         self.rec_btn = QPushButton("● Start Recording")
         layout.addWidget(self.rec_btn)
@@ -21,17 +28,28 @@ class VideoPane(QWidget):
             os.makedirs("videos",exist_ok=True)
             path = f"videos/{ts}.avi"
             fourcc = cv2.VideoWriter_fourcc(*'XVID')
-            size = (640,480)
-            self.writer = cv2.VideoWriter(path,fourcc,20.0,size)
+            self.writer = cv2.VideoWriter(path,fourcc,20.0,self.rec_size)
             self.recording = True
+            self.timer.start(50)
             self.rec_btn.setText("■ Stop Recording")
             self.status.setText(f"Recording to {path}")
         else:
+            self.timer.stop()
             self.writer.release()
             self.recording = False
             self.rec_btn.setText("● Start Recording")
             self.status.setText("Not recording")
 
+    def _pull_frame(self):
+        slot = self.camera.latest()
+        if slot is None or slot.seq == self._seq:
+            return
+        self._seq = slot.seq
+        self.process_frame(slot.frame)
+
     def process_frame(self, frame):
+        """frame: BGR numpy array (camera ring slots are already BGR)."""
         if self.recording and self.writer:
-            self.writer.write(cv2.cvtColor(frame, cv2.COLOR_RGB2BGR))
\ No newline at end of file
+            if frame.shape[1::-1] != self.rec_size:
+                frame = cv2.resize(frame, self.rec_size, dst=self._scaled)
+            self.writer.write(frame)
\ No newline at end of file
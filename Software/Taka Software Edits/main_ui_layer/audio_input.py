@@ -0,0 +1,201 @@
+# Software/Taka Software Edits/main_ui_layer/audio_input.py
+# =============================================================================
+# ALWAYS-OPEN MIC
+# -----------------------------------------------------------------------------
+# One 16 kHz mono input stream for the whole process, feeding a lock-free
+# ring of int16 samples. Opening PortAudio takes longer than a spoken word,
+# so the stream stays open and listeners (voice_pipeline.py) just take a
+# cursor into the ring.
+#
+#   AudioRing    single writer (PortAudio's callback), any number of readers,
+#                each with its own absolute sample cursor; readers can rewind
+#   AudioCapture the sounddevice stream writing BLOCK-sized pieces
+#   Endpointer   VAD on 20 ms frames (webrtcvad, or an adaptive energy gate)
+#   shared()     the process-wide AudioCapture, opened on first use
+# =============================================================================
+
+from __future__ import annotations
+import threading
+from typing import Any, Optional
+
+import numpy as np
+
+try:
+    import sounddevice as sd
+except Exception:      # also raises OSError when PortAudio is missing
+    sd = None
+try:
+    import webrtcvad
+except ImportError:
+    webrtcvad = None
+
+SAMPLE_RATE = 16000
+BLOCK = 320            # 20 ms: one VAD frame
+
+# ---------------------------- RING --------------------------------------
+class AudioRing:
+    """
+    Preallocated ring. The writer copies a block in and then advances
+    `head` (total samples ever written), so it never locks or waits on a
+    reader. A reader more than a ring behind skips to the oldest sample
+    still held; each skip counts as an overrun.
+    """
+    def __init__(self, seconds: float = 10.0, rate: int = SAMPLE_RATE) -> None:
+        self.rate = rate
+        self.size = int(seconds * rate)
+        self._buf = np.zeros(self.size, np.int16)
+        self.head = 0
+        self.overruns = 0
+        self._new = threading.Event()
+
+    def write(self, samples: np.ndarray) -> None:
+        n = len(samples)
+        if n >= self.size:
+            samples, n = samples[-self.size:], self.size
+        i = self.head % self.size
+        k = min(n, self.size - i)
+        self._buf[i:i + k] = samples[:k]
+        self._buf[:n - k] = samples[k:]
+        self.head += n                   # publish only after the copy
+        self._new.set()
+
+    def read(self, cursor: int, max_n: Optional[int] = None) -> tuple[np.ndarray, int]:
+        """(samples, new_cursor) from `cursor` up to the head (or max_n samples)."""
+        head = self.head
+        if head - cursor > self.size:
+            self.overruns += 1
+            cursor = head - self.size
+        n = head - cursor
+        if max_n is not None:
+            n = min(n, max_n)
+        if n <= 0:
+            return np.empty(0, np.int16), cursor
+        i = cursor % self.size
+        k = min(n, self.size - i)
+        out = np.concatenate((self._buf[i:i + k], self._buf[:n - k])) if k < n \
+            else self._buf[i:i + n].copy()
+        return out, cursor + n
+
+    def cursor(self, preroll_s: float = 0.0) -> int:
+        """A reader cursor at the head, or `preroll_s` seconds before it."""
+        return max(0, self.head - int(preroll_s * self.rate))
+
+    def wait(self, cursor: int, timeout: float) -> bool:
+        """Block until samples past `cursor` exist (or timeout)."""
+        if self.head > cursor:
+            return True
+        self._new.clear()
+        if self.head > cursor:
+            return True
+        return self._new.wait(timeout)
+
+# ---------------------------- CAPTURE -----------------------------------
+class AudioCapture:
+    """The mic stream; `running` is False when there is no mic or no PortAudio."""
+    def __init__(self, rate: int = SAMPLE_RATE, block: int = BLOCK,
+                 seconds: float = 10.0, device: Any = None) -> None:
+        self.rate = rate
+        self.block = block
+        self.device = device
+        self.ring = AudioRing(seconds, rate)
+        self.stream = None
+        self.status_errors = 0
+
+    def start(self) -> bool:
+        if self.stream is not None:
+            return True
+        if sd is None:
+            print("[audio] ?? sounddevice not available; no mic")
+            return False
+        try:
+            self.stream = sd.RawInputStream(
+                samplerate=self.rate, blocksize=self.block, device=self.device,
+                dtype="int16", channels=1, callback=self._callback)
+            self.stream.start()
+        except Exception as e:
+            print(f"[audio] ?? could not open the mic: {e}")
+            self.stream = None
+            return False
+        return True
+
+    def _callback(self, indata, frames, time_info, status) -> None:
+        if status:
+            self.status_errors += 1
+        self.ring.write(np.frombuffer(indata, np.int16))
+
+    def stop(self) -> None:
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream.close()
+            self.stream = None
+
+    @property
+    def running(self) -> bool:
+        return self.stream is not None
+
+# ---------------------------- ENDPOINTER --------------------------------
+class Endpointer:
+    """
+    Speech start/end on BLOCK-sized frames. Starts after `start_ms` of
+    voiced frames, ends after `hangover_ms` of unvoiced ones (or at max_s).
+    Without webrtcvad, "voiced" means louder than the tracked noise floor
+    times `energy_ratio`.
+    """
+    def __init__(self, rate: int = SAMPLE_RATE, block: int = BLOCK,
+                 aggressiveness: int = 2, start_ms: int = 60,
+                 hangover_ms: int = 600, max_s: float = 8.0,
+                 energy_ratio: float = 3.0) -> None:
+        self.rate, self.block = rate, block
+        frame_ms = 1000.0 * block / rate
+        self.start_frames = max(1, int(start_ms / frame_ms))
+        self.hang_frames = max(1, int(hangover_ms / frame_ms))
+        self.max_frames = int(max_s * 1000 / frame_ms)
+        self.energy_ratio = energy_ratio
+        self.vad = webrtcvad.Vad(aggressiveness) if webrtcvad is not None else None
+        self.noise: Optional[float] = None
+        self.reset()
+
+    def reset(self) -> None:
+        self.in_speech = False
+        self._voiced = self._silent = self._frames = 0
+
+    def is_voiced(self, frame: np.ndarray) -> bool:
+        if self.vad is not None:
+            return self.vad.is_speech(frame.tobytes(), self.rate)
+        rms = float(np.sqrt(np.mean(frame.astype(np.float32) ** 2))) + 1.0
+        if self.noise is None:
+            self.noise = rms
+        voiced = rms > self.noise * self.energy_ratio
+        if not voiced:
+            self.noise += (rms - self.noise) * 0.05     # follow the room, not the talker
+        return voiced
+
+    def push(self, frame: np.ndarray) -> Optional[str]:
+        """Feed one frame. Returns "start", "end" or None."""
+        voiced = self.is_voiced(frame)
+        if not self.in_speech:
+            self._voiced = self._voiced + 1 if voiced else 0
+            if self._voiced >= self.start_frames:
+                self.in_speech = True
+                self._silent = self._frames = 0
+                return "start"
+            return None
+        self._frames += 1
+        self._silent = 0 if voiced else self._silent + 1
+        if self._silent >= self.hang_frames or self._frames >= self.max_frames:
+            self.reset()
+            return "end"
+        return None
+
+# ---------------------------- SHARED STREAM -----------------------------
+_SHARED: Optional[AudioCapture] = None
+_SHARED_LOCK = threading.Lock()
+
+def shared() -> AudioCapture:
+    """The process-wide capture stream, opened on first use."""
+    global _SHARED
+    with _SHARED_LOCK:
+        if _SHARED is None:
+            _SHARED = AudioCapture()
+        _SHARED.start()
+        return _SHARED
@@ -0,0 +1,101 @@
+# Software/Taka Software Edits/main_ui_layer/bench_event_bus.py
+# =============================================================================
+# EVENT BUS BENCHMARK
+# -----------------------------------------------------------------------------
+# In-process EventBus (producer thread) vs. the shared-memory transport
+# (producer process via ProcessSupervisor). For each, two runs:
+#   burst - emit as fast as possible: events/s through the bus
+#   paced - emit at a fixed rate: publish -> handler latency (p50 / p99)
+#
+#   python bench_event_bus.py [--n 50000] [--rate 2000]
+# =============================================================================
+
+from __future__ import annotations
+import argparse
+import os
+import sys
+import threading
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+if HERE not in sys.path:
+    sys.path.insert(0, HERE)     # spawned workers import this module by name
+
+from event_bus import EventBus
+from shm_bus import ProcessSupervisor
+
+
+def _produce(emit, n: int, rate: float) -> None:
+    period = 1.0 / rate if rate else 0.0
+    t0 = time.perf_counter()
+    for i in range(n):
+        if period:
+            delay = t0 + i * period - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        emit("BENCH", i=i)
+
+
+def producer(bus, n: int, rate: float) -> None:
+    """Worker-process entry point used by the shm runs."""
+    time.sleep(0.2)              # let the UI side finish wiring up
+    _produce(bus.emit, n, rate)
+    bus.stopping.wait(10.0)
+
+
+def _consume(bus: EventBus, n: int, timeout: float = 60.0) -> tuple[float, list[float]]:
+    lat: list[float] = []
+    first: list[float] = []
+    def on_bench(evt):
+        now = time.monotonic()
+        if not first:
+            first.append(now)
+        lat.append(now - evt.ts)
+    bus.subscribe("BENCH", on_bench)
+    deadline = time.monotonic() + timeout
+    while len(lat) < n and time.monotonic() < deadline:
+        if not bus.drain(max_n=4096, budget_ms=50.0):
+            bus.wait(0.001)
+    elapsed = time.monotonic() - first[0] if first else 0.0
+    return elapsed, lat
+
+
+def _report(name: str, n: int, elapsed: float, lat: list[float]) -> None:
+    if not lat:
+        print(f"{name:<14} no events received")
+        return
+    lat.sort()
+    p = lambda q: 1e6 * lat[min(len(lat) - 1, int(q * len(lat)))]
+    eps = len(lat) / elapsed if elapsed else float("inf")
+    print(f"{name:<14} {len(lat):>7}/{n:<7} {eps:>12,.0f} ev/s   "
+          f"p50 {p(0.50):>8.1f} us   p99 {p(0.99):>9.1f} us")
+
+
+def bench_inproc(n: int, rate: float) -> None:
+    bus = EventBus({"BENCH": {"maxlen": n}})
+    t = threading.Thread(target=_produce, args=(bus.emit, n, rate), daemon=True)
+    t.start()
+    elapsed, lat = _consume(bus, n)
+    _report(f"inproc {'paced' if rate else 'burst'}", n, elapsed, lat)
+
+
+def bench_shm(n: int, rate: float) -> None:
+    bus = EventBus({"BENCH": {"maxlen": n}})
+    sup = ProcessSupervisor(bus, ring_bytes=16 << 20)
+    sup.spawn("bench", "bench_event_bus:producer", restart=False, n=n, rate=rate)
+    try:
+        elapsed, lat = _consume(bus, n)
+    finally:
+        sup.stop()
+    _report(f"shm {'paced' if rate else 'burst'}", n, elapsed, lat)
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=50000)
+    ap.add_argument("--rate", type=float, default=2000.0, help="paced run, events/s")
+    a = ap.parse_args()
+    paced_n = min(a.n, int(a.rate * 5))
+    for fn in (bench_inproc, bench_shm):
+        fn(a.n, 0.0)
+        fn(paced_n, a.rate)
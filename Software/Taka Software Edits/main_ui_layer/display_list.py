@@ -0,0 +1,129 @@
+# Software/Taka Software Edits/main_ui_layer/display_list.py
+# =============================================================================
+# RETAINED DISPLAY LIST
+# -----------------------------------------------------------------------------
+# Panes still call ctx.overlay.text/icon/card/toast every render(), but the
+# Overlay now records those calls as DrawOps instead of drawing right away.
+# At end_frame() the new list is diffed against the previous frame:
+#   * ops that did not change cost nothing (their raster stays cached),
+#   * only added/removed ops produce damage rects,
+#   * the backend rasterises only ops it has not seen before and recomposes
+#     just the damaged area from cached surfaces.
+# =============================================================================
+
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+Rect = tuple[int, int, int, int]   # x, y, w, h
+
+
+@dataclass(frozen=True, slots=True)
+class DrawOp:
+    """One overlay call. `args` holds everything that affects the pixels."""
+    kind: str              # "base" | "text" | "icon" | "card" | "toast"
+    args: tuple
+    x: int
+    y: int
+
+    @property
+    def key(self) -> tuple:
+        """Raster cache key: content only, so moving an op reuses its raster."""
+        return (self.kind, self.args)
+
+
+def intersects(a: Rect, b: Rect) -> bool:
+    return (a[0] < b[0] + b[2] and b[0] < a[0] + a[2] and
+            a[1] < b[1] + b[3] and b[1] < a[1] + a[3])
+
+
+class RasterCache:
+    """LRU of rasterised surfaces keyed by DrawOp.key."""
+    def __init__(self, max_items: int = 256) -> None:
+        self.max_items = max_items
+        self._items: "OrderedDict[tuple, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple, build: Callable[[], Any]) -> Any:
+        surf = self._items.get(key)
+        if surf is not None:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = build()
+        self._items[key] = surf
+        if len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+        return surf
+
+    def clear(self) -> None:
+        self._items.clear()
+
+
+@dataclass
+class FrameDiff:
+    added: list[DrawOp] = field(default_factory=list)
+    removed: list[DrawOp] = field(default_factory=list)
+    kept: int = 0
+    damage: list[Rect] = field(default_factory=list)
+
+
+class DisplayList:
+    """Ops for the current frame plus the rects they covered last frame."""
+    def __init__(self) -> None:
+        self.ops: list[DrawOp] = []
+        self._prev: list[DrawOp] = []
+        self.rects: dict[DrawOp, Rect] = {}
+
+    def begin(self) -> None:
+        self._prev, self.ops = self.ops, []
+
+    def add(self, op: DrawOp) -> None:
+        self.ops.append(op)
+
+    def diff(self, measure: Callable[[DrawOp], Rect]) -> FrameDiff:
+        """
+        Compare against the previous frame. `measure(op)` is only called for
+        added ops; kept ops reuse the rect recorded when they were added.
+        """
+        prev, cur = set(self._prev), set(self.ops)
+        d = FrameDiff()
+        # an op drawn twice (e.g. two identical toasts) has one rect entry
+        for op in dict.fromkeys(self._prev):
+            if op not in cur:
+                d.removed.append(op)
+                d.damage.append(self.rects.pop(op))
+        for op in self.ops:
+            if op in prev:
+                d.kept += 1
+            elif op not in self.rects:
+                d.added.append(op)
+                self.rects[op] = measure(op)
+                d.damage.append(self.rects[op])
+        return d
+
+    def in_damage(self, damage: list[Rect]) -> list[DrawOp]:
+        """Current ops (in paint order) that overlap any damaged rect."""
+        return [op for op in self.ops
+                if any(intersects(self.rects[op], r) for r in damage)]
+
+    def reset(self) -> None:
+        """Forget the previous frame so the next one redraws everything."""
+        self.ops, self._prev = [], []
+        self.rects.clear()
+
+
+if __name__ == "__main__":
+    # regression: an op drawn twice, then dropped, is removed once
+    dl = DisplayList()
+    twice = DrawOp("text", ("x", 16), 0, 0)
+    dl.begin(); dl.add(twice); dl.add(twice)
+    first = dl.diff(lambda op: (op.x, op.y, 10, 10))
+    assert len(first.added) == 1 and len(first.damage) == 1
+    dl.begin()
+    d = dl.diff(lambda op: (op.x, op.y, 10, 10))
+    assert d.removed == [twice] and d.damage == [(0, 0, 10, 10)] and not dl.rects
+    print("display_list: ok")
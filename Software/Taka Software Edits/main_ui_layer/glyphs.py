@@ -0,0 +1,275 @@
+# Software/Taka Software Edits/main_ui_layer/glyphs.py
+# =============================================================================
+# GLYPH ATLAS + TEXT LAYOUT CACHE
+# -----------------------------------------------------------------------------
+# Each (font, size) gets one growable 8-bit texture. A glyph is rendered with
+# Pillow the first time it is seen, packed into the texture, and from then on
+# drawing text is just copying alpha masks out of the atlas with numpy.
+# Without Pillow, glyphs fall back to solid boxes so layouts still work.
+#
+# On top of that, LayoutCache keeps whole laid-out strings (TextRun) keyed by
+# (text, font, size, max_width), evicted LRU by bytes. HUD strings such as
+# "CPU 12% · RAM 40%" usually change only at the end, so a miss first looks
+# for a recent run with the same prefix and re-lays out just the suffix.
+# =============================================================================
+
+from __future__ import annotations
+import os
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:
+    Image = ImageDraw = ImageFont = None
+
+DEFAULT_FONT = "DejaVuSans.ttf"
+FONT_DIRS = ("/usr/share/fonts/truetype/dejavu", "/usr/share/fonts/TTF",
+             "/Library/Fonts", "C:\\Windows\\Fonts")
+
+
+def _load_font(name: str, size: int):
+    if ImageFont is None:
+        return None
+    for path in (name, *(os.path.join(d, name) for d in FONT_DIRS)):
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError:
+            continue
+    try:
+        return ImageFont.load_default(size)
+    except TypeError:   # Pillow < 10.1 has a single bitmap size
+        return ImageFont.load_default()
+
+
+@dataclass(frozen=True, slots=True)
+class Glyph:
+    x: int          # position in the atlas texture
+    y: int
+    w: int
+    h: int
+    left: int       # offset from pen position to the mask's top-left
+    top: int
+    advance: int
+
+
+class GlyphAtlas:
+    """Alpha masks for one (font, size), packed row by row into one texture."""
+    def __init__(self, font: str = DEFAULT_FONT, size: int = 16, width: int = 512) -> None:
+        self.font_name, self.size = font, size
+        self.font = _load_font(font, size)
+        if self.font is not None:
+            ascent, descent = self.font.getmetrics()
+        else:
+            ascent, descent = int(size * 0.8), int(size * 0.25)
+        self.ascent = ascent
+        self.line_height = ascent + descent
+        self.tex = np.zeros((max(64, self.line_height * 4), width), np.uint8)
+        self.glyphs: dict[str, Glyph] = {}
+        self._cx = self._cy = self._row_h = 0
+
+    def glyph(self, ch: str) -> Glyph:
+        g = self.glyphs.get(ch)
+        if g is None:
+            g = self.glyphs[ch] = self._add(ch)
+        return g
+
+    def mask(self, g: Glyph) -> np.ndarray:
+        """Read-only view of a glyph's alpha mask (valid until the atlas grows)."""
+        return self.tex[g.y:g.y + g.h, g.x:g.x + g.w]
+
+    @property
+    def nbytes(self) -> int:
+        return self.tex.nbytes
+
+    # ----- packing -----
+    def _render(self, ch: str):
+        if self.font is None:
+            w = max(1, int(self.size * 0.55))
+            m = np.full((self.ascent, w), 0 if ch.isspace() else 255, np.uint8)
+            return m, 0, 0, w + 1
+        l, t, r, b = self.font.getbbox(ch)
+        advance = int(round(self.font.getlength(ch)))
+        if r <= l or b <= t:
+            return np.zeros((0, 0), np.uint8), 0, 0, advance
+        img = Image.new("L", (r - l, b - t), 0)
+        ImageDraw.Draw(img).text((-l, -t), ch, font=self.font, fill=255)
+        return np.asarray(img), l, t, advance
+
+    def _add(self, ch: str) -> Glyph:
+        m, left, top, advance = self._render(ch)
+        h, w = m.shape
+        W = self.tex.shape[1]
+        if self._cx + w > W:
+            self._cx, self._cy, self._row_h = 0, self._cy + self._row_h + 1, 0
+        while self._cy + h > self.tex.shape[0]:
+            grown = np.zeros((self.tex.shape[0] * 2, W), np.uint8)
+            grown[:self.tex.shape[0]] = self.tex
+            self.tex = grown
+        g = Glyph(self._cx, self._cy, w, h, left, top, advance)
+        self.tex[g.y:g.y + h, g.x:g.x + w] = m
+        self._cx += w + 1
+        self._row_h = max(self._row_h, h)
+        return g
+
+
+_ATLASES: dict[tuple[str, int], GlyphAtlas] = {}
+
+def atlas(size: int, font: str = DEFAULT_FONT) -> GlyphAtlas:
+    """Shared atlas for (font, size)."""
+    key = (font, size)
+    a = _ATLASES.get(key)
+    if a is None:
+        a = _ATLASES[key] = GlyphAtlas(font, size)
+    return a
+
+
+def measure(s: str, size: int, font: str = DEFAULT_FONT) -> tuple[int, int]:
+    a = atlas(size, font)
+    return sum(a.glyph(c).advance for c in s), a.line_height
+
+
+def _draw(a: GlyphAtlas, s: str, out: np.ndarray, pen: int = 0) -> int:
+    """Max-blend the glyphs of `s` into `out` starting at `pen`; returns the end pen."""
+    H, W = out.shape
+    for c in s:
+        g = a.glyph(c)
+        x0, y0 = pen + g.left, g.top
+        if g.w and g.h and x0 < W:
+            xs, ys = max(0, x0), max(0, y0)
+            x1, y1 = min(W, x0 + g.w), min(H, y0 + g.h)
+            if x1 > xs and y1 > ys:
+                dst = out[ys:y1, xs:x1]
+                np.maximum(dst, a.mask(g)[ys - y0:y1 - y0, xs - x0:x1 - x0], out=dst)
+        pen += g.advance
+    return pen
+
+
+def render_alpha(s: str, size: int, font: str = DEFAULT_FONT,
+                 out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Rasterise one line of text into an (h, w) uint8 alpha mask."""
+    a = atlas(size, font)
+    if out is None:
+        w = sum(a.glyph(c).advance for c in s)
+        out = np.zeros((a.line_height, max(1, w)), np.uint8)
+    _draw(a, s, out)
+    return out
+
+
+# ---------------------------- LAYOUT CACHE -------------------------------
+@dataclass(slots=True)
+class TextRun:
+    """A laid-out string: its alpha mask and, for one-line runs, pen positions."""
+    text: str
+    alpha: np.ndarray          # (h, w) uint8
+    pens: Optional[list[int]]  # pen x before each char + end; None if wrapped
+
+    @property
+    def nbytes(self) -> int:
+        return self.alpha.nbytes + (8 * len(self.pens) if self.pens else 0)
+
+
+def _wrap(a: GlyphAtlas, text: str, max_width: int) -> list[str]:
+    lines, cur, cur_w = [], "", 0
+    space = a.glyph(" ").advance
+    for word in text.split(" "):
+        w = sum(a.glyph(c).advance for c in word)
+        if cur and cur_w + space + w > max_width:
+            lines.append(cur)
+            cur, cur_w = word, w
+        else:
+            cur_w += (space if cur else 0) + w
+            cur = f"{cur} {word}" if cur else word
+    lines.append(cur)
+    return lines
+
+
+class LayoutCache:
+    """
+    LRU of TextRuns keyed by (text, font, size, max_width), bounded by bytes.
+
+    hits    - exact string seen before
+    partial - miss served by copying a cached prefix and laying out the suffix
+    misses  - laid out from scratch
+    """
+    RECENT = 8          # recent runs per style searched for a shared prefix
+    MIN_PREFIX = 3
+
+    def __init__(self, max_bytes: int = 2 << 20) -> None:
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._runs: "OrderedDict[tuple, TextRun]" = OrderedDict()
+        self._recent: dict[tuple, deque] = {}
+        self.hits = self.partial = self.misses = 0
+
+    def get(self, text: str, size: int, font: str = DEFAULT_FONT,
+            max_width: Optional[int] = None) -> TextRun:
+        key = (text, font, size, max_width)
+        run = self._runs.get(key)
+        if run is not None:
+            self._runs.move_to_end(key)
+            self.hits += 1
+            return run
+        a = atlas(size, font)
+        style = (font, size, max_width)
+
+        # longest shared prefix among recent one-line runs of this style
+        best, k = None, 0
+        for old in self._recent.get(style, ()):
+            n = len(os.path.commonprefix((old.text, text)))
+            if n > k:
+                best, k = old, n
+        if best is None or k < self.MIN_PREFIX:
+            best, k = None, 0
+        pens = best.pens[:k + 1] if best else [0]
+        for c in text[k:]:
+            pens.append(pens[-1] + a.glyph(c).advance)
+
+        if max_width is not None and pens[-1] > max_width:
+            self.misses += 1
+            lines = _wrap(a, text, max_width)
+            out = np.zeros((a.line_height * len(lines), max_width), np.uint8)
+            for i, line in enumerate(lines):
+                _draw(a, line, out[i * a.line_height:(i + 1) * a.line_height])
+            run = TextRun(text, out, None)
+        else:
+            out = np.zeros((a.line_height, max(1, pens[-1])), np.uint8)
+            if best:
+                # copy everything left of the first changed glyph, then redraw
+                # from the glyph before it so its overhang is restored
+                self.partial += 1
+                out[:, :pens[k]] = best.alpha[:, :pens[k]]
+                _draw(a, text[k - 1:], out, pens[k - 1])
+            else:
+                self.misses += 1
+                _draw(a, text, out)
+            run = TextRun(text, out, pens)
+        self._store(key, style, run)
+        return run
+
+    def _store(self, key: tuple, style: tuple, run: TextRun) -> None:
+        self._runs[key] = run
+        self.bytes += run.nbytes
+        if run.pens is not None:
+            self._recent.setdefault(style, deque(maxlen=self.RECENT)).append(run)
+        while self.bytes > self.max_bytes and len(self._runs) > 1:
+            _k, old = self._runs.popitem(last=False)
+            self.bytes -= old.nbytes
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.partial + self.misses
+        return {
+            "hits": self.hits,
+            "partial": self.partial,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._runs),
+            "bytes": self.bytes,
+        }
+
+
+# Shared by every Overlay backend in the process.
+LAYOUT = LayoutCache()
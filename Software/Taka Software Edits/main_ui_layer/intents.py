@@ -0,0 +1,286 @@
+# Software/Taka Software Edits/main_ui_layer/intents.py
+# =============================================================================
+# VOICE INTENTS
+# -----------------------------------------------------------------------------
+# Panes declare the commands they understand as phrase templates instead of
+# parsing transcripts with chains of `in` / startswith() checks:
+#
+#     @intent("set brightness to {level:0..100}")
+#     def _brightness(self, level: int) -> None: ...
+#
+# Slots:
+#   {name:0..100}   a number, spoken ("seventy five") or as digits
+#   {name:a|b|c}    one of a fixed set of words
+#   {name}          free text; or, with a provider passed to
+#                   @intent(..., name=lambda pane: [...]), one of the
+#                   provider's values (free text if none of them match)
+#
+# * Every template is compiled into a word trie per scope (a pane id, or
+#   GLOBAL for commands that work on any pane). dispatch() walks the active
+#   pane's trie, then the global one, and calls the handler with the slot
+#   values as keyword arguments, so the cost follows the length of the
+#   utterance rather than the number of commands.
+# * grammar(pane_id) expands the same templates (numbers as words, choices,
+#   provider values) into the phrase list a Vosk KaldiRecognizer accepts.
+#   Holding the recogniser to the few hundred phrases the active pane can
+#   act on makes it cheaper and much harder to mis-hear. Free text cannot
+#   be listed, so a scope with an open slot (e.g. a Wi-Fi password) gets
+#   None, meaning the full vocabulary.
+# * A phrase has to start the utterance, after at most a few filler words
+#   (the hotword, "please", "can you", ...). It is never found mid-sentence,
+#   so "don't open wifi" is not "open wifi".
+# =============================================================================
+
+from __future__ import annotations
+import itertools
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+GLOBAL = "*"
+MAX_PHRASES = 5000        # past this a grammar stops paying off
+MAX_FILLER = 4            # leading filler words skipped before a phrase
+FILLER = frozenset({"ok", "okay", "hey", "please", "can", "could", "would",
+                    "will", "you", "just", "um", "uh", "so", "now"})
+NEGATIONS = frozenset({"don't", "dont", "do", "not", "never", "no"})
+
+# ---------------------------- NUMBERS -----------------------------------
+_ONES = ("zero one two three four five six seven eight nine ten eleven twelve "
+         "thirteen fourteen fifteen sixteen seventeen eighteen nineteen").split()
+_TENS = "_ _ twenty thirty forty fifty sixty seventy eighty ninety".split()
+_WORD_VALUE = {w: i for i, w in enumerate(_ONES)}
+_WORD_VALUE.update({w: 10 * i for i, w in enumerate(_TENS) if i >= 2})
+
+def number_words(n: int) -> str:
+    """0..999 as the words a recogniser outputs: 75 -> 'seventy five'."""
+    if n < 20:
+        return _ONES[n]
+    if n < 100:
+        tens, ones = divmod(n, 10)
+        return _TENS[tens] + (f" {_ONES[ones]}" if ones else "")
+    hundreds, rest = divmod(n, 100)
+    return f"{_ONES[hundreds]} hundred" + (f" {number_words(rest)}" if rest else "")
+
+def parse_number(words: list[str]) -> Optional[int]:
+    """Inverse of number_words(); also takes '70' or '70%'. None if not a number."""
+    if len(words) == 1 and words[0].rstrip("%").isdigit():
+        return int(words[0].rstrip("%"))
+    total = None
+    for w in words:
+        if w == "hundred" and total:
+            total *= 100
+        elif w == "and" and total:
+            continue
+        elif w in _WORD_VALUE:
+            total = (total or 0) + _WORD_VALUE[w]
+        else:
+            return None
+    return total
+
+# ---------------------------- TEMPLATES ---------------------------------
+_SLOT = re.compile(r"\{(\w+)(?::([^}]*))?\}")
+
+def _norm(text: str) -> list[str]:
+    """One lowercase token per whitespace word, punctuation dropped: 'Lab-5G' -> ['lab5g']."""
+    return [re.sub(r"[^\w%']+", "", w) for w in text.lower().split()]
+
+@dataclass(frozen=True)
+class Slot:
+    name: str
+    kind: str                                  # "number" | "choice" | "free"
+    lo: int = 0
+    hi: int = 0
+    choices: tuple = ()                        # word tuples, for "choice"
+
+    @classmethod
+    def parse(cls, name: str, spec: Optional[str]) -> "Slot":
+        if spec and ".." in spec:
+            lo, hi = spec.split("..", 1)
+            return cls(name, "number", int(lo), int(hi))
+        if spec:
+            return cls(name, "choice", choices=tuple(tuple(_norm(c)) for c in spec.split("|")))
+        return cls(name, "free")
+
+    def spans(self, low: list[str], raw: list[str], i: int,
+              values: Optional[list[str]]):
+        """(end, value) candidates for this slot starting at token i, best first."""
+        if self.kind == "number":
+            for j in range(min(len(low), i + 4), i, -1):
+                n = parse_number(low[i:j])
+                if n is not None and self.lo <= n <= self.hi:
+                    yield j, n
+        elif self.kind == "choice":
+            for words in self.choices:
+                if tuple(low[i:i + len(words)]) == words:
+                    yield i + len(words), " ".join(words)
+        else:
+            # provider values compare with spaces ignored, so "campus wifi"
+            # finds "CampusWiFi"
+            for v in values or ():
+                key = "".join(_norm(v))
+                for j in range(i + 1, len(low) + 1):
+                    if "".join(low[i:j]) == key:
+                        yield j, v
+            for j in range(len(low), i, -1):      # free text, longest first
+                yield j, " ".join(raw[i:j])
+
+    def phrases(self, values: Optional[list[str]]) -> Optional[list[str]]:
+        """Every way this slot can be spoken, or None when it is open text."""
+        if self.kind == "number":
+            return [number_words(n) for n in range(self.lo, self.hi + 1)]
+        if self.kind == "choice":
+            return [" ".join(w) for w in self.choices]
+        return [" ".join(_norm(v)) for v in values] if values else None
+
+@dataclass
+class Intent:
+    scope: str
+    phrase: str
+    handler: Callable[..., Any]
+    parts: list                                # words (str) and Slots
+
+@dataclass
+class _Node:
+    words: dict = field(default_factory=dict)    # word -> _Node
+    slots: list = field(default_factory=list)    # [(Slot, _Node)]
+    intent: Optional[Intent] = None
+
+# ---------------------------- DECORATOR ---------------------------------
+def intent(*phrases: str, **values: Callable[[Any], list[str]]):
+    """
+    Mark a pane method as the handler for one or more phrase templates.
+    Keyword arguments supply values for free slots: callables taking the
+    pane and returning the strings the slot can be (e.g. scanned SSIDs).
+    """
+    def mark(fn):
+        fn.__dict__.setdefault("_intents", []).extend((p, values) for p in phrases)
+        return fn
+    return mark
+
+# ---------------------------- REGISTRY ----------------------------------
+class IntentRegistry:
+    """Phrase templates per scope, compiled to tries for dispatch and grammars."""
+
+    def __init__(self, hotword: str = "") -> None:
+        self.filler = (FILLER | set(_norm(hotword))) - NEGATIONS
+        self._roots: dict[str, _Node] = {}
+        self._intents: dict[str, dict[str, Intent]] = {}
+        self._values: dict[str, dict[str, Callable[[], list[str]]]] = {}
+        self.hits = self.misses = 0
+
+    def register(self, scope: str, phrase: str, handler: Callable[..., Any],
+                 **values: Callable[[], list[str]]) -> Intent:
+        """Add (or replace) one template. `values` are zero-arg slot providers."""
+        parts: list = []
+        pos = 0
+        for m in _SLOT.finditer(phrase):
+            parts += _norm(phrase[pos:m.start()])
+            parts.append(Slot.parse(m.group(1), m.group(2)))
+            pos = m.end()
+        parts += _norm(phrase[pos:])
+
+        it = Intent(scope, phrase, handler, parts)
+        node = self._roots.setdefault(scope, _Node())
+        for part in parts:
+            if isinstance(part, str):
+                node = node.words.setdefault(part, _Node())
+                continue
+            for slot, child in node.slots:
+                if slot == part:
+                    node = child
+                    break
+            else:
+                child = _Node()
+                node.slots.append((part, child))
+                node = child
+        node.intent = it
+        self._intents.setdefault(scope, {})[phrase] = it
+        self._values.setdefault(scope, {}).update(values)
+        return it
+
+    def add_pane(self, pane: Any) -> None:
+        """Register every @intent method of `pane` under its id."""
+        for name in dir(type(pane)):
+            for phrase, values in getattr(getattr(type(pane), name), "_intents", ()):
+                providers = {k: (lambda f=f: f(pane)) for k, f in values.items()}
+                self.register(pane.id, phrase, getattr(pane, name), **providers)
+
+    # ----- dispatch -----
+    def match(self, text: str, scope: str) -> Optional[tuple[Intent, dict]]:
+        """(intent, slot values) for a transcript, or None."""
+        raw = text.split()
+        low = _norm(text)
+        # a phrase may follow a little leading filler ("hey vision, please
+        # ..."), but never a negation or any other word: no mid-sentence hits
+        starts = [0]
+        for w in low[:MAX_FILLER]:
+            if w not in self.filler:
+                break
+            starts.append(starts[-1] + 1)
+        for sc in (scope, GLOBAL):
+            root = self._roots.get(sc)
+            if root is None:
+                continue
+            for start in starts:
+                hit = self._walk(root, low, raw, start, {}, self._values.get(sc, {}))
+                if hit:
+                    return hit
+        return None
+
+    def _walk(self, node: _Node, low: list[str], raw: list[str], i: int,
+              slots: dict, providers: dict) -> Optional[tuple[Intent, dict]]:
+        if i == len(low):
+            return (node.intent, dict(slots)) if node.intent else None
+        child = node.words.get(low[i])
+        if child is not None:
+            hit = self._walk(child, low, raw, i + 1, slots, providers)
+            if hit:
+                return hit
+        for slot, child in node.slots:
+            provider = providers.get(slot.name)
+            for j, value in slot.spans(low, raw, i, provider() if provider else None):
+                slots[slot.name] = value
+                hit = self._walk(child, low, raw, j, slots, providers)
+                if hit:
+                    return hit
+            slots.pop(slot.name, None)
+        return None
+
+    def dispatch(self, text: str, scope: str) -> bool:
+        """Run the handler matching `text` in `scope` (or globally). False if none."""
+        hit = self.match(text or "", scope)
+        if hit is None:
+            self.misses += 1
+            return False
+        self.hits += 1
+        it, slots = hit
+        it.handler(**slots)
+        return True
+
+    # ----- grammar -----
+    def grammar(self, scope: str) -> Optional[list[str]]:
+        """Vosk phrase list for `scope` plus global commands; None = full vocabulary."""
+        phrases: dict[str, None] = {}
+        for sc in (scope, GLOBAL):
+            providers = self._values.get(sc, {})
+            for it in self._intents.get(sc, {}).values():
+                options = []
+                for part in it.parts:
+                    if isinstance(part, str):
+                        options.append([part])
+                        continue
+                    provider = providers.get(part.name)
+                    alts = part.phrases(provider() if provider else None)
+                    if alts is None:
+                        return None
+                    options.append(alts)
+                for combo in itertools.product(*options):
+                    phrases[" ".join(combo)] = None
+                if len(phrases) > MAX_PHRASES:
+                    return None
+        phrases["[unk]"] = None
+        return list(phrases)
+
+    def stats(self) -> dict:
+        return {"intents": sum(len(v) for v in self._intents.values()),
+                "hits": self.hits, "misses": self.misses}
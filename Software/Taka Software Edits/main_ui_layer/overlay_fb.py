@@ -0,0 +1,229 @@
+# Software/Taka Software Edits/main_ui_layer/overlay_fb.py
+# =============================================================================
+# HEADLESS FRAMEBUFFER BACKEND
+# -----------------------------------------------------------------------------
+# Renders the Overlay's display list into a preallocated numpy RGBA
+# framebuffer sized from DisplayProfile. No window system is involved, so the
+# same code runs in CI and on the device's direct-to-panel path.
+#
+#   * surfaces are premultiplied RGBA numpy arrays (cached by the Overlay)
+#   * text comes from the glyph atlas + layout cache (glyphs.py)
+#   * two buffers: compose() draws into the back buffer, then swaps
+#   * `framebuffer` is a memoryview of the front buffer for zero-copy handoff
+#
+# Select it with `overlay: {backend: framebuffer}` in config.yaml.
+# =============================================================================
+
+from __future__ import annotations
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+try:
+    from .display_list import DrawOp, Rect
+    from . import glyphs
+except ImportError:   # loaded by path, not as a package
+    from display_list import DrawOp, Rect
+    import glyphs
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+WHITE = (255, 255, 255)
+CARD_BG = (20, 20, 24, 200)
+TOAST_BG = (40, 40, 48, 220)
+PAD = 10
+
+
+def _premul(alpha: np.ndarray, rgb=WHITE, opacity: int = 255) -> np.ndarray:
+    """(h, w) alpha mask -> premultiplied (h, w, 4) RGBA."""
+    a = alpha.astype(np.uint16) * opacity // 255
+    out = np.empty(alpha.shape + (4,), np.uint8)
+    for c in range(3):
+        out[..., c] = a * rgb[c] // 255
+    out[..., 3] = a
+    return out
+
+
+def _rounded_rect(w: int, h: int, r: int, rgba) -> np.ndarray:
+    yy, xx = np.ogrid[:h, :w]
+    cx = np.clip(xx, r, w - 1 - r)
+    cy = np.clip(yy, r, h - 1 - r)
+    inside = ((xx - cx) ** 2 + (yy - cy) ** 2) <= r * r
+    return _premul(inside.astype(np.uint8) * 255, rgba[:3], rgba[3])
+
+
+def _blit(dst: np.ndarray, src: np.ndarray, x: int, y: int) -> None:
+    """Premultiplied 'over' of src onto dst at (x, y), clipped to dst."""
+    H, W = dst.shape[:2]
+    h, w = src.shape[:2]
+    x0, y0, x1, y1 = max(0, x), max(0, y), min(W, x + w), min(H, y + h)
+    if x1 <= x0 or y1 <= y0:
+        return
+    s = src[y0 - y:y1 - y, x0 - x:x1 - x]
+    d = dst[y0:y1, x0:x1]
+    inv = 255 - s[..., 3:4].astype(np.uint16)
+    d[:] = np.minimum(s + (d * inv + 127) // 255, 255)
+
+
+def _copy(dst: np.ndarray, src: np.ndarray, x: int, y: int) -> None:
+    """Plain copy of an opaque src onto dst at (x, y), clipped to dst."""
+    H, W = dst.shape[:2]
+    h, w = src.shape[:2]
+    x0, y0, x1, y1 = max(0, x), max(0, y), min(W, x + w), min(H, y + h)
+    if x1 > x0 and y1 > y0:
+        dst[y0:y1, x0:x1] = src[y0 - y:y1 - y, x0 - x:x1 - x]
+
+
+class FramebufferBackend:
+    """Overlay backend that composes into a double-buffered RGBA array."""
+    def __init__(self, display: Any, assets: Any = None,
+                 on_present: Optional[Callable[[memoryview], None]] = None) -> None:
+        self.width, self.height = display.width, display.height
+        self.assets = assets
+        self.on_present = on_present
+        shape = (self.height, self.width, 4)
+        self._bufs = [np.zeros(shape, np.uint8), np.zeros(shape, np.uint8)]
+        self._front = 0
+        # the back buffer is one presented frame behind the front, so it
+        # must also be repaired where the previous frame changed
+        self._prev_damage: list[Rect] = [(0, 0, self.width, self.height)]
+        self._base_buf = np.empty(shape, np.uint8)
+        self._base_idx = None
+        self.frame_id = 0
+
+    # ----- outputs -----
+    @property
+    def front(self) -> np.ndarray:
+        return self._bufs[self._front]
+
+    @property
+    def framebuffer(self) -> memoryview:
+        """Zero-copy view of the last presented frame (H x W x RGBA)."""
+        return memoryview(self.front)
+
+    # ----- Overlay backend protocol -----
+    def rasterize(self, op: DrawOp, overlay: Any) -> np.ndarray:
+        if op.kind == "base":
+            return self._base(overlay.base_frame)
+        if op.kind == "text":
+            s, size = op.args
+            return _premul(glyphs.LAYOUT.get(s, size).alpha)
+        if op.kind == "icon":
+            return self._icon(*op.args)
+        if op.kind == "card":
+            return self._card(*op.args)
+        if op.kind == "toast":
+            return self._toast(op.args[0])
+        raise ValueError(f"unknown draw op {op.kind!r}")
+
+    def buffer_damage(self, damage: list[Rect]) -> list[Rect]:
+        """Damage to repaint in the back buffer: this frame's plus the last one's, merged."""
+        out = self._merge(damage + self._prev_damage)
+        self._prev_damage = damage
+        return out
+
+    def compose(self, layers, damage: list[Rect], added) -> None:
+        back = self._bufs[1 - self._front]
+        # the camera base is opaque and full-screen: copy it, don't blend it
+        opaque = bool(layers) and layers[0][0].kind == "base"
+        for x, y, w, h in damage:
+            region = back[y:y + h, x:x + w]
+            if not opaque:
+                region[:] = 0
+            for op, surf, (lx, ly, _lw, _lh) in layers:
+                if op.kind == "base":
+                    _copy(region, surf, lx - x, ly - y)
+                else:
+                    _blit(region, surf, lx - x, ly - y)
+        self._front = 1 - self._front
+        self.frame_id += 1
+        if self.on_present:
+            self.on_present(self.framebuffer)
+
+    # ----- surfaces -----
+    def _merge(self, rects: list[Rect]) -> list[Rect]:
+        """
+        Clip, then union overlapping rects so no pixel is composed twice.
+        Anything covering the whole screen short-circuits to one rect.
+        """
+        out: list[tuple] = []
+        for x, y, w, h in self._clip(rects):
+            if w >= self.width and h >= self.height:
+                return [(0, 0, self.width, self.height)]
+            x1, y1 = x + w, y + h
+            i = 0
+            while i < len(out):
+                ox, oy, ox1, oy1 = out[i]
+                if ox < x1 and x < ox1 and oy < y1 and y < oy1:
+                    # grew: re-check everything already kept against the union
+                    x, y, x1, y1 = min(x, ox), min(y, oy), max(x1, ox1), max(y1, oy1)
+                    out.pop(i)
+                    i = 0
+                else:
+                    i += 1
+            out.append((x, y, x1, y1))
+        return [(x, y, x1 - x, y1 - y) for x, y, x1, y1 in out]
+
+    def _clip(self, rects: list[Rect]) -> list[Rect]:
+        out = []
+        for x, y, w, h in rects:
+            x0, y0 = max(0, x), max(0, y)
+            x1, y1 = min(self.width, x + w), min(self.height, y + h)
+            if x1 > x0 and y1 > y0:
+                out.append((x0, y0, x1 - x0, y1 - y0))
+        return out
+
+    def _base(self, frame) -> np.ndarray:
+        """BGR camera frame -> opaque RGBA at display size (nearest neighbour)."""
+        out = self._base_buf   # never cached by the Overlay, so reuse one buffer
+        out[..., 3] = 255
+        if frame is None:
+            out[..., :3] = 0
+            return out
+        h, w = frame.shape[:2]
+        if (h, w) != (self.height, self.width):
+            if self._base_idx is None or self._base_idx[0] != (h, w):
+                ys = np.arange(self.height) * h // self.height
+                xs = np.arange(self.width) * w // self.width
+                self._base_idx = ((h, w), ys[:, None], xs[None, :])
+            _, ys, xs = self._base_idx
+            frame = frame[ys, xs]
+        out[..., 0] = frame[..., 2]
+        out[..., 1] = frame[..., 1]
+        out[..., 2] = frame[..., 0]
+        return out
+
+    def _icon(self, name: str, size: int) -> np.ndarray:
+        if Image is not None and self.assets is not None:
+            try:
+                img = Image.open(self.assets.get_icon(name)).convert("RGBA")
+                img = img.resize((size, size), Image.LANCZOS)
+                rgba = np.asarray(img).astype(np.uint16)
+                out = np.empty_like(rgba, dtype=np.uint8)
+                out[..., :3] = rgba[..., :3] * rgba[..., 3:4] // 255
+                out[..., 3] = rgba[..., 3]
+                return out
+            except OSError:
+                pass
+        # missing asset: translucent disc placeholder
+        return _rounded_rect(size, size, size // 2, (255, 255, 255, 90))
+
+    def _card(self, title: str, body: str) -> np.ndarray:
+        t = glyphs.LAYOUT.get(title, 18).alpha
+        b = glyphs.LAYOUT.get(body, 14).alpha
+        w = max(t.shape[1], b.shape[1]) + 2 * PAD
+        h = t.shape[0] + b.shape[0] + 2 * PAD + 4
+        out = _rounded_rect(w, h, 12, CARD_BG)
+        _blit(out, _premul(t), PAD, PAD)
+        _blit(out, _premul(b, (200, 200, 210)), PAD, PAD + t.shape[0] + 4)
+        return out
+
+    def _toast(self, s: str) -> np.ndarray:
+        t = glyphs.LAYOUT.get(s, 16).alpha
+        w, h = t.shape[1] + 2 * PAD + 8, t.shape[0] + PAD
+        out = _rounded_rect(w, h, h // 2, TOAST_BG)
+        _blit(out, _premul(t), PAD + 4, PAD // 2)
+        return out
@@ -0,0 +1,129 @@
+# Software/Taka Software Edits/main_ui_layer/pane_base.py
+# Base class for all panes (Bluetooth, Maps, Assistant, etc.)
+# Keep panes lightweight: they receive a shared `ctx` with services
+# (overlay, event_bus, camera, voice, notify, assets, store, config, display,
+# redraw).
+
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+try:
+    from .intents import intent    # re-exported: panes take both from here
+except ImportError:
+    from intents import intent
+
+class Pane(ABC):
+    """
+    Minimal lifecycle & event surface for a UI pane.
+
+    Subclass this in ui_layer_apps, e.g.:
+        class BluetoothPane(Pane):
+            id = "bluetooth"
+            title = "Bluetooth"
+            icon = "icons/icon-bluetooth.png"
+
+            def render(self):
+                self.ctx.overlay.card(self.title, "Say 'pair device' or 'disconnect'")
+
+            @intent("pair device", "pair")
+            def _pair(self):
+                self.ctx.bluetooth.pair_mode()
+                self.ctx.overlay.toast("Pairing…")
+
+    Voice commands are @intent phrase templates (see intents.py); on_voice()
+    only sees transcripts that matched none of them.
+
+    render() only runs when something is dirty. Input handlers are followed by
+    a redraw automatically; state that changes in the background (timers,
+    threads) should call self.invalidate().
+    """
+
+    # Unique identity for routing/telemetry
+    id: str = "pane"
+    # Short title for headers/cards
+    title: str = "Pane"
+    # Relative icon path inside VA-Assets (optional)
+    icon: Optional[str] = None
+    # True for panes that change every frame (e.g. a live camera view)
+    animated: bool = False
+
+    def __init__(self, ctx: Any = None) -> None:
+        # ctx may be passed early (trial_app does); panes still only use it
+        # between mount() and unmount()
+        self.ctx: Any = None            # populated by mount()
+        self._mounted: bool = False
+
+    # ----- Lifecycle ---------------------------------------------------------
+
+    def mount(self, ctx: Any) -> None:
+        """Called when the pane becomes active."""
+        self.ctx = ctx
+        self._mounted = True
+        self.on_mount()
+        redraw = getattr(ctx, "redraw", None)
+        if redraw:
+            redraw.invalidate()
+            if self.animated:
+                redraw.begin_animation(self.id)
+
+    def unmount(self) -> None:
+        """Called when the pane is deactivated."""
+        try:
+            self.on_unmount()
+        finally:
+            redraw = getattr(self.ctx, "redraw", None)
+            if redraw and self.animated:
+                redraw.end_animation(self.id)
+            self._mounted = False
+            self.ctx = None
+
+    def on_mount(self) -> None:
+        """Optional: init resources, subscribe to events, warm caches."""
+        pass
+
+    def on_unmount(self) -> None:
+        """Optional: release resources, unsubscribe, stop timers."""
+        pass
+
+    # ----- Draw loop ---------------------------------------------------------
+
+    @abstractmethod
+    def render(self) -> None:
+        """Draw the pane. Use ctx.overlay.* helpers."""
+        raise NotImplementedError
+
+    def invalidate(self, rect: Optional[tuple[int, int, int, int]] = None) -> None:
+        """Request a redraw of rect (x, y, w, h), or of the whole pane."""
+        redraw = getattr(self.ctx, "redraw", None)
+        if redraw:
+            redraw.invalidate(rect)
+
+    # ----- Inputs / events ---------------------------------------------------
+
+    def on_voice(self, text: str) -> None:
+        """Voice transcript that matched none of this pane's @intent phrases."""
+        pass
+
+    def on_gesture(self, name: str, data: Any | None = None) -> None:
+        """
+        High-level gesture events (e.g., 'tap', 'swipe_left').
+        The rotary encoder sends 'rotate' with the coalesced signed step
+        count as data, and 'press' for its push button.
+        """
+        pass
+
+    def on_action(self, name: str, **payload: Any) -> None:
+        """Generic actions routed from the system (e.g., notifications)."""
+        pass
+
+    # ----- Helpers -----------------------------------------------------------
+
+    def ensure_mounted(self) -> None:
+        if not self._mounted:
+            raise RuntimeError(f"{self.id} not mounted before use")
+
+    def toast(self, msg: str) -> None:
+        """Quick user feedback helper."""
+        self.ensure_mounted()
+        self.ctx.overlay.toast(msg)
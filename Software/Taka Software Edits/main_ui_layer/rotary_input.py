@@ -0,0 +1,283 @@
+# Software/Taka Software Edits/main_ui_layer/rotary_input.py
+# =============================================================================
+# ROTARY ENCODER INPUT
+# -----------------------------------------------------------------------------
+# Reads encoder ticks on a dedicated thread and hands the UI one coalesced
+# delta per frame instead of one relayout per click.
+#
+#   source  -> Debouncer -> pending (delta, presses) -> "INPUT" on the EventBus
+#
+# Sources (all return batches of (ts, kind, value), kind "rotate" or "press"):
+#   * EvdevSource  - Linux input events (rotary-encoder overlay, or any
+#                    evdev-compatible stand-in file / FIFO with the same records)
+#   * GpioSource   - quadrature pins via gpiozero on the Pi
+#   * TraceSource  - a recorded tick trace, replayed in real time or instantly
+#
+# The thread emits a single INPUT event per burst; the UI loop answers it with
+# take(), which returns everything that arrived since the last frame. Trace
+# files are plain text, one tick per line:
+#       0.000 rotate +1
+#       0.012 rotate +1
+#       0.500 press
+# replay(path, frame_s) runs a trace through the same Debouncer offline and
+# returns the per-frame deltas, so encoder handling can be checked without
+# hardware.
+# =============================================================================
+
+from __future__ import annotations
+import os
+import queue
+import select
+import struct
+import threading
+import time
+from typing import Any, Callable, Optional
+
+Tick = tuple[float, str, int]          # (timestamp s, "rotate" | "press", value)
+
+# ---------------------------- DEBOUNCE ----------------------------------
+class Debouncer:
+    """
+    Drops contact bounce: a rotate tick that reverses direction within
+    `rotate_s` of the previous tick, and presses closer than `press_s`.
+    """
+    def __init__(self, rotate_s: float = 0.003, press_s: float = 0.05) -> None:
+        self.rotate_s = rotate_s
+        self.press_s = press_s
+        self._last_rot: Optional[Tick] = None
+        self._last_press = -1e9
+        self.dropped = 0
+
+    def accept(self, tick: Tick) -> bool:
+        ts, kind, value = tick
+        if kind == "press":
+            if ts - self._last_press < self.press_s:
+                self.dropped += 1
+                return False
+            self._last_press = ts
+            return True
+        last = self._last_rot
+        self._last_rot = tick
+        if last is not None and (value > 0) != (last[2] > 0) and ts - last[0] < self.rotate_s:
+            self.dropped += 1
+            return False
+        return True
+
+# ---------------------------- SOURCES -----------------------------------
+class TraceSource:
+    """Recorded ticks; speed=1.0 replays in real time, 0 as fast as possible."""
+    def __init__(self, path: str, speed: float = 1.0) -> None:
+        self.ticks = load_trace(path)
+        self.speed = speed
+        self._i = 0
+        self._t0: Optional[float] = None
+
+    def read(self, timeout: float) -> Optional[list[Tick]]:
+        if self._i >= len(self.ticks):
+            return None
+        if self._t0 is None:
+            self._t0 = time.monotonic() - self.ticks[0][0] * self.speed
+        out = []
+        deadline = time.monotonic() + timeout
+        while self._i < len(self.ticks):
+            ts, kind, value = self.ticks[self._i]
+            due = self._t0 + ts * self.speed
+            now = time.monotonic()
+            if due > now:
+                if out or due > deadline:
+                    break
+                time.sleep(due - now)
+            out.append((ts, kind, value))
+            self._i += 1
+        return out
+
+    def close(self) -> None:
+        pass
+
+
+class EvdevSource:
+    """
+    struct input_event records from /dev/input/eventN (or a stand-in file).
+    EV_REL on REL_X/REL_DIAL/REL_WHEEL is rotation, EV_KEY down is a press.
+    """
+    EV_KEY, EV_REL = 0x01, 0x02
+    REL_AXES = (0x00, 0x07, 0x08)       # REL_X, REL_DIAL, REL_WHEEL
+    FMT = "llHHi"                        # timeval, type, code, value
+    SIZE = struct.calcsize(FMT)
+
+    def __init__(self, path: str) -> None:
+        self.fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        self._buf = b""
+
+    def read(self, timeout: float) -> Optional[list[Tick]]:
+        r, _, _ = select.select([self.fd], [], [], timeout)
+        if not r:
+            return []
+        data = os.read(self.fd, self.SIZE * 64)
+        if not data:
+            return None                  # EOF: stand-in file fully consumed
+        self._buf += data
+        out = []
+        n = len(self._buf) // self.SIZE * self.SIZE
+        for off in range(0, n, self.SIZE):
+            sec, usec, typ, code, value = struct.unpack_from(self.FMT, self._buf, off)
+            ts = sec + usec / 1e6
+            if typ == self.EV_REL and code in self.REL_AXES and value:
+                out.append((ts, "rotate", value))
+            elif typ == self.EV_KEY and value == 1:
+                out.append((ts, "press", 1))
+        self._buf = self._buf[n:]
+        return out
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class GpioSource:
+    """Quadrature encoder (and optional push button) through gpiozero."""
+    def __init__(self, pin_a: int, pin_b: int, pin_sw: Optional[int] = None) -> None:
+        from gpiozero import Button, RotaryEncoder
+        self._q: "queue.Queue[Tick]" = queue.Queue()
+        self._enc = RotaryEncoder(pin_a, pin_b, max_steps=0)
+        self._enc.when_rotated_clockwise = lambda: self._q.put((time.monotonic(), "rotate", 1))
+        self._enc.when_rotated_counter_clockwise = lambda: self._q.put((time.monotonic(), "rotate", -1))
+        self._btn = None
+        if pin_sw is not None:
+            self._btn = Button(pin_sw)
+            self._btn.when_pressed = lambda: self._q.put((time.monotonic(), "press", 1))
+
+    def read(self, timeout: float) -> Optional[list[Tick]]:
+        try:
+            out = [self._q.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+        while True:
+            try:
+                out.append(self._q.get_nowait())
+            except queue.Empty:
+                return out
+
+    def close(self) -> None:
+        self._enc.close()
+        if self._btn:
+            self._btn.close()
+
+
+def load_trace(path: str) -> list[Tick]:
+    ticks = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            parts = line.split("#", 1)[0].split()
+            if not parts:
+                continue
+            value = int(parts[2]) if len(parts) > 2 else 1
+            ticks.append((float(parts[0]), parts[1], value))
+    return ticks
+
+# ---------------------------- INPUT THREAD ------------------------------
+class EncoderInput(threading.Thread):
+    """
+    Reads a source on its own thread, debounces, and accumulates ticks.
+    The first tick after a take() emits one INPUT event on the bus; later
+    ticks just add to the pending delta until the UI takes it.
+    """
+    def __init__(self, source: Any, event_bus: Any = None,
+                 debouncer: Optional[Debouncer] = None,
+                 on_input: Optional[Callable[[], None]] = None) -> None:
+        super().__init__(name="encoder-input", daemon=True)
+        self.source = source
+        self.event_bus = event_bus
+        self.debouncer = debouncer or Debouncer()
+        self.on_input = on_input
+        self._lock = threading.Lock()
+        self._delta = 0
+        self._presses = 0
+        self._signalled = False
+        self._halt = threading.Event()
+        self.ticks = self.bursts = 0
+
+    def run(self) -> None:
+        try:
+            while not self._halt.is_set():
+                batch = self.source.read(0.1)
+                if batch is None:
+                    break
+                for tick in batch:
+                    self._push(tick)
+        except Exception as e:
+            print(f"[input] ?? encoder stopped: {e}")
+        finally:
+            self.source.close()
+
+    def _push(self, tick: Tick) -> None:
+        if not self.debouncer.accept(tick):
+            return
+        self.ticks += 1
+        with self._lock:
+            if tick[1] == "press":
+                self._presses += 1
+            else:
+                self._delta += tick[2]
+            signal, self._signalled = not self._signalled, True
+        if signal:
+            self.bursts += 1
+            if self.event_bus is not None:
+                self.event_bus.emit("INPUT", source="encoder")
+            if self.on_input:
+                self.on_input()
+
+    def take(self) -> tuple[int, int]:
+        """(delta, presses) accumulated since the last take()."""
+        with self._lock:
+            out = (self._delta, self._presses)
+            self._delta = self._presses = 0
+            self._signalled = False
+        return out
+
+    def stop(self) -> None:
+        self._halt.set()
+
+    def stats(self) -> dict:
+        return {"ticks": self.ticks, "bursts": self.bursts,
+                "dropped": self.debouncer.dropped}
+
+
+def replay(path: str, frame_s: float = 1 / 30,
+           debouncer: Optional[Debouncer] = None) -> list[tuple[int, int, int]]:
+    """Offline run of a trace: [(frame_index, delta, presses)] for frames with input."""
+    deb = debouncer or Debouncer()
+    frames: dict[int, list[int]] = {}
+    for tick in load_trace(path):
+        if deb.accept(tick):
+            f = frames.setdefault(int(tick[0] // frame_s), [0, 0])
+            if tick[1] == "press":
+                f[1] += 1
+            else:
+                f[0] += tick[2]
+    return [(i, d, p) for i, (d, p) in sorted(frames.items())]
+
+
+def make_encoder(spec: Optional[str], event_bus: Any = None, **kw: Any) -> Optional[EncoderInput]:
+    """
+    Build and start an encoder from a config string, or None:
+        "evdev:/dev/input/event3"   "gpio:17,18[,27]"   "trace:ticks.txt[@speed]"
+    """
+    if not spec or spec == "none":
+        return None
+    kind, _, arg = spec.partition(":")
+    try:
+        if kind == "evdev":
+            source = EvdevSource(arg)
+        elif kind == "gpio":
+            source = GpioSource(*(int(p) for p in arg.split(",")))
+        elif kind == "trace":
+            path, _, speed = arg.partition("@")
+            source = TraceSource(path, float(speed or 1.0))
+        else:
+            raise ValueError(f"unknown encoder source '{kind}'")
+    except Exception as e:
+        print(f"[input] ?? encoder unavailable ({spec}): {e}")
+        return None
+    enc = EncoderInput(source, event_bus, **kw)
+    enc.start()
+    return enc
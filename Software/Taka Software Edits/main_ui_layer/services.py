@@ -8,8 +8,17 @@
 #       * overlay   ? for drawing UI elements
 #       * event_bus ? messaging between components
 #       * camera    ? camera access
-#       * voice     ? voice command system
-#       * notify    ? toast notifications
+#       * frames    ? shared, pre-converted camera frames (FrameBus)
+#       * redraw    ? render-on-change frame scheduler
+#       * voice     ? voice commands (hotword-gated mic pipeline when
+#                     config voice.listen is on, push_transcript() always)
+#       * intents   ? voice command phrases -> handlers (intents.py), and the
+#                     recogniser grammar for the active pane
+#       * input     ? rotary encoder (None unless config input.encoder is set)
+#       * processes ? worker processes on the shared-memory bus (or None)
+#       * notify    ? toast notifications (also spoken when tts is on)
+#       * tts       ? queued, cached text-to-speech (None unless config
+#                     tts.enabled is set)
 #       * config    ? system-wide settings
 #       * store     ? small key-value state storage
 #   - Provides fallback implementations for hardware that may not exist yet
@@ -24,12 +33,45 @@
 # =============================================================================
 
 from __future__ import annotations
+import copy
+import math
 import os
-import queue
+import threading
+import time
 from dataclasses import dataclass
 from types import SimpleNamespace
 from typing import Any, Optional
 
+try:
+    from .boot_timeline import BOOT
+except ImportError:
+    from boot_timeline import BOOT
+try:
+    from .display_list import DisplayList, DrawOp, FrameDiff, RasterCache, Rect
+except ImportError:   # loaded by path, not as a package
+    from display_list import DisplayList, DrawOp, FrameDiff, RasterCache, Rect
+try:
+    from .frame_bus import FrameBus
+except ImportError:   # loaded by path, or OpenCV missing
+    try:
+        from frame_bus import FrameBus
+    except ImportError:
+        FrameBus = None
+try:
+    from .event_bus import EventBus
+    from .intents import IntentRegistry
+    from .rotary_input import make_encoder
+    from .shm_bus import make_supervisor
+    from .tts_service import ALERT, CHATTER, make_tts
+    from .voice_pipeline import make_pipeline
+except ImportError:
+    from event_bus import EventBus
+    from intents import IntentRegistry
+    from rotary_input import make_encoder
+    from shm_bus import make_supervisor
+    from tts_service import ALERT, CHATTER, make_tts
+    from voice_pipeline import make_pipeline
+
 # ---------------------------- CONFIG LOADING ----------------------------
 try:
     import yaml  # for reading config.yaml
@@ -48,18 +90,51 @@ DEFAULT_CONFIG = {
     "enabled_panes": ["launcher", "wifi", "settings"],
     "assets_dir": "VA-Assets",
     "voice_hotword": "hey vision",
+    "voice": {
+        # always-on mic: energy gate -> hotword spotter -> full recogniser
+        "listen": False,
+        "model": "models/vosk-model-small-en-us-0.15"
+    },
+    "tts": {
+        # spoken toasts and prompts; phrases are synthesised once into cache_dir
+        "enabled": False,
+        "voice": None,          # pyttsx3 voice id, None = system default
+        "rate": 170,
+        "cache_dir": "cache/tts",
+        "cache_mb": 32
+    },
+    "input": {
+        # "evdev:/dev/input/event0", "gpio:17,18,27" or "trace:ticks.txt"
+        "encoder": "none"
+    },
+    # worker processes bridged onto ctx.event_bus (shm_bus.py), e.g.
+    #   {"vision": "vision_worker:main"}
+    "processes": {},
+    "overlay": {
+        "backend": "console"   # or "framebuffer" (headless numpy RGBA)
+    },
     "features": {
         "background_removal": False,
         "background_mode": "black"
     }
 }
 
+def merge_config(user_cfg: dict) -> dict:
+    """DEFAULT_CONFIG with user_cfg merged in (one level deep); defaults stay untouched."""
+    cfg = copy.deepcopy(DEFAULT_CONFIG)
+    for key, val in user_cfg.items():
+        if isinstance(val, dict) and isinstance(cfg.get(key), dict):
+            cfg[key].update(val)
+        else:
+            cfg[key] = val
+    return cfg
+
 def load_config(repo_root: Optional[str] = None) -> dict:
     """
     Loads config.yaml from the repo root if present.
     Otherwise falls back to DEFAULT_CONFIG.
     """
-    cfg = DEFAULT_CONFIG.copy()
+    cfg = merge_config({})
     repo_root = repo_root or os.getcwd()
     config_path = os.path.join(repo_root, "config.yaml")
 
@@ -67,12 +142,7 @@ def load_config(repo_root: Optional[str] = None) -> dict:
         try:
             with open(config_path, "r", encoding="utf-8") as f:
                 user_cfg = yaml.safe_load(f) or {}
-            # Merge user config into default
-            for key, val in user_cfg.items():
-                if isinstance(val, dict) and isinstance(cfg.get(key), dict):
-                    cfg[key].update(val)
-                else:
-                    cfg[key] = val
+            cfg = merge_config(user_cfg)
         except Exception as e:
             print(f"[services] ?? Failed to read config.yaml: {e}")
     else:
@@ -97,19 +167,150 @@ class DisplayProfile:
         return int(px)
 
 # ---------------------------- EVENT BUS ---------------------------------
-class EventBus:
-    """Thread-safe queue for passing messages between parts of the app."""
-    def __init__(self) -> None:
-        self._q: "queue.Queue[dict]" = queue.Queue()
+# Topic pub/sub with priority lanes and bounded queues; see event_bus.py.
+# ctx.event_bus.emit("NAVIGATE", pane_id="wifi") from anywhere, and the main
+# loop calls ctx.event_bus.drain() once per frame.
 
-    def emit(self, type_: str, **payload: Any) -> None:
-        self._q.put({"type": type_, "payload": payload})
+# ---------------------------- RENDER SCHEDULER ---------------------------
+def _bbox(rects: list[Rect]) -> Rect:
+    x0 = min(r[0] for r in rects); y0 = min(r[1] for r in rects)
+    x1 = max(r[0] + r[2] for r in rects); y1 = max(r[1] + r[3] for r in rects)
+    return (x0, y0, x1 - x0, y1 - y0)
 
-    def next(self, block: bool = False, timeout: float = 0.0) -> dict:
-        try:
-            return self._q.get(block=block, timeout=timeout)
-        except queue.Empty:
-            return {"type": "NOP", "payload": {}}
+class RenderScheduler:
+    """
+    Decides when the main loop composes a frame.
+
+    Panes and services call invalidate(rect) when something visible changes,
+    and begin_animation()/end_animation() around anything that moves on its
+    own. The loop calls wait_frame(), which sleeps to the next vsync-aligned
+    tick and returns the dirty rects, or None when there is nothing to draw.
+    """
+    MAX_RECTS = 8   # beyond this, merge into one bounding box
+
+    def __init__(self, display: DisplayProfile, idle_hz: float = 10.0) -> None:
+        self.display = display
+        self.period = 1.0 / max(10, display.fps)
+        self.idle_period = 1.0 / idle_hz
+        self._t0 = time.perf_counter()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._rects: list[Rect] = []
+        self._full = True                        # first frame draws everything
+        self._anims: dict[Any, Optional[Rect]] = {}
+        self._timers: list[tuple[float, Optional[Rect]]] = []   # (due, rect)
+        self._last_frame: Optional[float] = None
+        # stats
+        self.frames = 0
+        self.skipped = 0
+        self._frame_s = 0.0
+        self._frame_max = 0.0
+
+    # ----- producers -----
+    def invalidate(self, rect: Optional[Rect] = None) -> None:
+        """Mark a screen rect (or the whole screen) dirty."""
+        with self._lock:
+            if rect is None:
+                self._full = True
+            elif not self._full:
+                self._rects.append(rect)
+                if len(self._rects) > self.MAX_RECTS:
+                    self._rects = [_bbox(self._rects)]
+        self._wake.set()
+
+    def invalidate_after(self, seconds: float, rect: Optional[Rect] = None) -> None:
+        """Mark rect dirty once `seconds` from now (e.g. when a toast expires)."""
+        with self._lock:
+            self._timers.append((time.perf_counter() + seconds, rect))
+        self._wake.set()
+
+    def wake(self) -> None:
+        """Cut an idle wait_frame() short without dirtying anything (e.g. new events)."""
+        self._wake.set()
+
+    def _fire_timers(self) -> None:
+        now = time.perf_counter()
+        with self._lock:
+            due = [t for t in self._timers if t[0] <= now]
+            if not due:
+                return
+            self._timers = [t for t in self._timers if t[0] > now]
+        for _t, rect in due:
+            self.invalidate(rect)
+
+    def begin_animation(self, key: Any, rect: Optional[Rect] = None) -> None:
+        """Redraw `rect` (or everything) every frame until end_animation(key)."""
+        with self._lock:
+            self._anims[key] = rect
+        self._wake.set()
+
+    def end_animation(self, key: Any) -> None:
+        with self._lock:
+            rect = self._anims.pop(key, None)
+        self.invalidate(rect)   # draw the final resting state once
+
+    @property
+    def pending(self) -> bool:
+        return self._full or bool(self._rects) or bool(self._anims)
+
+    # ----- consumer (main loop) -----
+    def wait_frame(self) -> Optional[list[Rect]]:
+        """
+        Sleep until the next frame slot. Returns the dirty rects to compose,
+        or None if the frame can be skipped. While idle this blocks for up to
+        1/idle_hz so the loop can still poll its input queues.
+        """
+        self._fire_timers()
+        if not self.pending:
+            timeout = self.idle_period
+            if self._timers:
+                timeout = min(timeout, max(0.0, min(t[0] for t in self._timers)
+                                           - time.perf_counter()))
+            self._wake.wait(timeout)
+            self._wake.clear()
+            self._fire_timers()
+            if not self.pending:
+                return None
+        now = time.perf_counter()
+        k = math.floor((now - self._t0) / self.period) + 1
+        time.sleep(max(0.0, self._t0 + k * self.period - now))
+        tick = time.perf_counter()
+
+        with self._lock:
+            if self._full or None in self._anims.values():
+                rects = [(0, 0, self.display.width, self.display.height)]
+            else:
+                rects = self._rects + [r for r in self._anims.values() if r]
+            self._rects = []
+            self._full = False
+        self._wake.clear()
+
+        if self._last_frame is not None:
+            self.skipped += max(0, round((tick - self._last_frame) / self.period) - 1)
+        self._last_frame = tick
+        self.frames += 1
+        return rects
+
+    def frame_done(self, seconds: float) -> None:
+        """Report how long composing the frame took."""
+        self._frame_s += seconds
+        self._frame_max = max(self._frame_max, seconds)
+
+    def stats(self) -> dict:
+        # wait_frame() counts skipped ticks when the next frame renders; the
+        # ticks idled away since the last frame haven't been counted yet
+        skipped = self.skipped
+        if self._last_frame is not None:
+            skipped += max(0, math.floor((time.perf_counter() - self._last_frame) / self.period))
+        total = self.frames + skipped
+        return {
+            "frames": self.frames,
+            "skipped": skipped,
+            "idle_pct": 100.0 * skipped / total if total else 0.0,
+            "frame_avg_ms": 1e3 * self._frame_s / self.frames if self.frames else 0.0,
+            "frame_max_ms": 1e3 * self._frame_max,
+            "animations": len(self._anims),
+        }
 
 # ---------------------------- ASSET LOADER -------------------------------
 class AssetLoader:
@@ -123,6 +324,36 @@ class AssetLoader:
         return os.path.join(self.assets_dir, "icons", name)
 
 # ---------------------------- OVERLAY (UI DRAWING) -----------------------
+class ConsoleBackend:
+    """
+    Stand-in renderer for machines without a display: "rasterising" an op
+    just estimates its size, and compose() prints the ops that changed.
+    """
+    def rasterize(self, op: DrawOp, overlay: "Overlay") -> SimpleNamespace:
+        if op.kind == "base":
+            return SimpleNamespace(shape=(overlay.display.height, overlay.display.width))
+        if op.kind == "icon":
+            return SimpleNamespace(shape=(op.args[1], op.args[1]))
+        text = " ".join(a for a in op.args if isinstance(a, str))
+        size = op.args[-1] if isinstance(op.args[-1], int) else 16
+        return SimpleNamespace(shape=(int(size * 1.4), int(len(text) * size * 0.6)))
+
+    def buffer_damage(self, damage):
+        return damage
+
+    def compose(self, layers, damage, added) -> None:
+        for op in added:
+            if op.kind == "text":
+                s, size = op.args
+                print(f"[overlay] Draw text '{s}' at ({op.x},{op.y}) size {size}")
+            elif op.kind == "icon":
+                name, size = op.args
+                print(f"[overlay] Draw icon {name} at ({op.x},{op.y}) size {size}")
+            elif op.kind == "card":
+                print(f"[overlay] Draw card {op.args[0]}: {op.args[1]}")
+            elif op.kind == "toast":
+                print(f"[overlay] Toast: {op.args[0]}")
+
 class Overlay:
     """
     Provides a stable interface for drawing UI:
@@ -130,90 +361,281 @@ class Overlay:
       - icon()   ? draw icon
       - card()   ? draw info card
       - toast()  ? quick popup message
+
+    Calls are recorded into a retained display list (display_list.py) and
+    diffed at end_frame(); only ops that changed are rasterised, and only the
+    damaged area is recomposed from cached surfaces by the backend.
     """
-    def __init__(self, assets: AssetLoader, display: DisplayProfile) -> None:
+    TOAST_SECONDS = 2.0
+
+    def __init__(self, assets: AssetLoader, display: DisplayProfile,
+                 backend: Any = None, redraw: Optional[RenderScheduler] = None) -> None:
         self.assets = assets
         self.display = display
+        self.backend = backend or ConsoleBackend()
+        self.redraw = redraw
+        self.list = DisplayList()
+        self.cache = RasterCache()
+        self.dirty: Optional[list] = None
+        self.base_frame = None
+        self._base_seq = 0
+        self._toasts: list[tuple[float, str]] = []   # (expires, text)
+        self.last_diff = FrameDiff()
+
+    def begin_frame(self, dirty: Optional[list] = None):
+        self.dirty = dirty   # rects changed since the last frame (None = all)
+        self.list.begin()
 
-    def begin_frame(self): pass
-    def end_frame(self): pass
-    def draw_base(self, frame): pass
+    def end_frame(self):
+        self._add_toasts()
+        d = self.list.diff(self._measure)
+        if self.dirty:
+            d.damage.extend(self.dirty)
+        self.last_diff = d
+        if not d.damage:
+            return   # identical frame: nothing to rasterise or compose
+        damage = self.backend.buffer_damage(d.damage)
+        layers = [(op, self._surface(op), self.list.rects[op])
+                  for op in self.list.in_damage(damage)]
+        self.backend.compose(layers, damage, d.added)
+
+    def draw_base(self, frame):
+        """Camera/background layer. Every call is new content."""
+        self.base_frame = frame
+        self._base_seq += 1
+        self.list.add(DrawOp("base", (self._base_seq,), 0, 0))
 
     def text(self, s: str, x: int, y: int, size: int = 16):
-        print(f"[overlay] Draw text '{s}' at ({x},{y}) size {size}")
+        self.list.add(DrawOp("text", (s, size), x, y))
 
     def icon(self, name: str, x: int, y: int, size: int = 24):
-        print(f"[overlay] Draw icon {name} at ({x},{y}) size {size}")
+        self.list.add(DrawOp("icon", (name, size), x, y))
 
     def card(self, title: str, body: str, x: int = 12, y: Optional[int] = None):
-        print(f"[overlay] Draw card {title}: {body}")
+        if y is None:
+            y = self.display.safe_insets[0]
+        self.list.add(DrawOp("card", (title, body), x, y))
 
     def toast(self, s: str):
-        print(f"[overlay] Toast: {s}")
+        # toasts usually come from input handlers, outside render(), so they
+        # are kept here and re-added to each frame until they expire
+        self._toasts.append((time.monotonic() + self.TOAST_SECONDS, s))
+        if self.redraw:
+            self.redraw.invalidate()
+            self.redraw.invalidate_after(self.TOAST_SECONDS)
+
+    def stats(self) -> dict:
+        d = self.last_diff
+        return {
+            "ops": len(self.list.ops),
+            "added": len(d.added),
+            "removed": len(d.removed),
+            "kept": d.kept,
+            "cache_hits": self.cache.hits,
+            "cache_misses": self.cache.misses,
+        }
+
+    # ----- internals -----
+    def _add_toasts(self):
+        now = time.monotonic()
+        self._toasts = [t for t in self._toasts if t[0] > now]
+        live = self._toasts
+        y = self.display.height - self.display.safe_insets[2] - 40
+        for _exp, s in reversed(live[-3:]):
+            self.list.add(DrawOp("toast", (s,), self.display.width // 2, y))
+            y -= 32
+
+    def _surface(self, op: DrawOp):
+        if op.kind == "base":   # changes every frame; never worth caching
+            return self.backend.rasterize(op, self)
+        return self.cache.get(op.key, lambda: self.backend.rasterize(op, self))
+
+    def _measure(self, op: DrawOp) -> Rect:
+        if op.kind == "base":
+            return (0, 0, self.display.width, self.display.height)
+        h, w = self._surface(op).shape[:2]
+        x = op.x - w // 2 if op.kind == "toast" else op.x
+        return (x, op.y, w, h)
+
+# ---------------------------- OPTIONAL MODULES ---------------------------
+def _import_or_none(modpath: str) -> Optional[Any]:
+    """Import one of the main_ui_layer modules if it and its dependencies are present."""
+    try:
+        import importlib
+        return importlib.import_module(modpath)
+    except ImportError:
+        return None
 
 # ---------------------------- CAMERA MANAGER -----------------------------
 class CameraManager:
-    """Manages camera input. Falls back to OpenCV if no custom camera module exists."""
-    def __init__(self) -> None:
+    """
+    Camera input on a background thread that keeps only the newest frame,
+    numbered by seq. read()/latest() never block the UI loop, and wait()
+    sleeps until a newer frame exists, so FrameBus subscribers on worker
+    threads don't spin. Frames are read-only; copy before editing.
+    """
+    def __init__(self, index: int = 0) -> None:
+        self._slot: Optional[SimpleNamespace] = None
+        self._cond = threading.Condition()
+        self._halt = threading.Event()
+        self._cap = None
+        self._thread: Optional[threading.Thread] = None
         try:
             import cv2
-            self._cv2 = cv2
-            self._cap = cv2.VideoCapture(0)
+            cap = cv2.VideoCapture(index)
         except Exception:
-            self._cv2 = None
-            self._cap = None
+            return
+        if not cap.isOpened():
+            cap.release()
+            return
+        self._cap = cap
+        self._thread = threading.Thread(target=self._run, name="camera", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        seq = 0
+        while not self._halt.is_set():
+            ok, frame = self._cap.read()
+            if not ok:
+                self._halt.wait(0.05)
+                continue
+            frame.flags.writeable = False
+            seq += 1
+            with self._cond:
+                self._slot = SimpleNamespace(index=0, seq=seq, ts=time.monotonic(), frame=frame)
+                self._cond.notify_all()
 
     def read(self):
-        if self._cv2 and self._cap:
-            return self._cap.read()
-        return False, None
+        """Return (ok, frame) for the newest frame."""
+        slot = self._slot
+        return (slot is not None), (slot.frame if slot else None)
+
+    def latest(self):
+        """Newest slot(index, seq, ts, frame) for the FrameBus, or None."""
+        return self._slot
+
+    def wait(self, after_seq: int, timeout: float) -> bool:
+        """Block until a frame newer than after_seq exists (or timeout)."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._slot is not None and self._slot.seq > after_seq, timeout)
+
+    def close(self) -> None:
+        self._halt.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+        if self._cap is not None:
+            self._cap.release()
 
 # ---------------------------- VOICE MANAGER ------------------------------
 class VoiceManager:
-    """Manages voice commands (simulated for now)."""
-    def __init__(self, event_bus: EventBus, hotword: str) -> None:
+    """
+    Manages voice commands. With listen=True the mic runs through the
+    hotword-gated pipeline (voice_pipeline.py), which publishes VOICE and
+    WAKE events; push_transcript() injects a command by hand either way.
+    """
+    def __init__(self, event_bus: EventBus, hotword: str, listen: bool = False,
+                 model_path: str = "") -> None:
         self.event_bus = event_bus
         self.hotword = hotword
+        self.pipeline = make_pipeline(event_bus, hotword, model_path) if listen else None
 
     def push_transcript(self, text: str):
         """Simulate receiving a voice command."""
         self.event_bus.emit("VOICE", text=text)
 
+    def set_grammar(self, phrases: Optional[list[str]]) -> None:
+        """Restrict recognition to `phrases` (see IntentRegistry.grammar); None = anything."""
+        if self.pipeline:
+            self.pipeline.set_grammar(phrases)
+
+    def stats(self) -> Optional[dict]:
+        """Per-stage CPU% and wake/false-wake counters, or None without a pipeline."""
+        return self.pipeline.stats() if self.pipeline else None
+
+    def stop(self) -> None:
+        if self.pipeline:
+            self.pipeline.stop()
+
 # ---------------------------- NOTIFICATION CENTER -----------------------
 class NotificationCenter:
-    """Simplifies sending notifications via overlay."""
-    def __init__(self, overlay: Overlay) -> None:
+    """Simplifies sending notifications via overlay (and speech, given a TTSService)."""
+    def __init__(self, overlay: Overlay, tts: Any = None) -> None:
         self.overlay = overlay
+        self.tts = tts
 
-    def info(self, msg: str):
-        self.overlay.toast(msg)
+    def info(self, msg: str, priority: int = CHATTER):
+        self.overlay.toast(msg)   # schedules its own redraws
+        if self.tts:
+            self.tts.say(msg, priority)   # queued; never waits for the audio
 
     def error(self, msg: str):
-        self.overlay.toast(f"Error: {msg}")
+        self.info(f"Error: {msg}", ALERT)
 
 # ---------------------------- MAKE SERVICES ------------------------------
-def make_services(repo_root: Optional[str] = None) -> Any:
+def _make_backend(config: dict, display: DisplayProfile, assets: AssetLoader) -> Any:
+    """Overlay renderer from config["overlay"]["backend"]."""
+    name = config.get("overlay", {}).get("backend", "console")
+    if name == "framebuffer":
+        try:
+            from . import overlay_fb as fb
+        except ImportError:
+            fb = _import_or_none("overlay_fb")
+        if fb:
+            return fb.FramebufferBackend(display, assets)
+        print("[services] ?? overlay_fb unavailable (numpy missing?); using console overlay.")
+    return ConsoleBackend()
+
+def _boot_phase(step: str):
+    """Time one make_services() step on the boot timeline."""
+    return BOOT.phase(f"services.{step}")
+
+def make_services(repo_root: Optional[str] = None, config: Optional[dict] = None) -> Any:
     """
     Creates and returns the shared context (ctx).
     This ctx is passed to every pane at mount() time.
+    An explicit `config` (merged over DEFAULT_CONFIG) skips config.yaml.
     """
-    config = load_config(repo_root)
-    d = config["display"]
-
-    display = DisplayProfile(
-        width=d["width"],
-        height=d["height"],
-        ppi=d["ppi"],
-        safe_insets=tuple(d["safe_insets"]),
-        fps=d["fps"]
-    )
+    with _boot_phase("config"):
+        config = merge_config(config) if config is not None else load_config(repo_root)
+        d = config["display"]
+
+        display = DisplayProfile(
+            width=d["width"],
+            height=d["height"],
+            ppi=d["ppi"],
+            safe_insets=tuple(d["safe_insets"]),
+            fps=d["fps"]
+        )
 
-    event_bus = EventBus()
-    assets = AssetLoader(config["assets_dir"])
-    overlay = Overlay(assets, display)
-    camera = CameraManager()
-    voice = VoiceManager(event_bus, config["voice_hotword"])
-    notify = NotificationCenter(overlay)
+    with _boot_phase("event_bus"):
+        event_bus = EventBus()
+        redraw = RenderScheduler(display)
+        # an idle loop sleeps in wait_frame(); new events should not wait for it
+        event_bus.on_publish = redraw.wake
+    with _boot_phase("overlay"):
+        assets = AssetLoader(config["assets_dir"])
+        overlay = Overlay(assets, display, _make_backend(config, display, assets),
+                          redraw=redraw)
+    with _boot_phase("camera"):
+        camera = CameraManager()
+    with _boot_phase("frames"):
+        # One conversion per (format, size) per frame, shared by every pane
+        frames = FrameBus(camera) if FrameBus else None
+    with _boot_phase("voice"):
+        vcfg = config.get("voice", {})
+        voice = VoiceManager(event_bus, config["voice_hotword"],
+                             listen=vcfg.get("listen", False),
+                             model_path=vcfg.get("model", ""))
+        intents = IntentRegistry(config["voice_hotword"])
+    with _boot_phase("tts"):
+        tts = make_tts(event_bus, config.get("tts", {}))
+    with _boot_phase("notify"):
+        notify = NotificationCenter(overlay, tts)
+    with _boot_phase("input"):
+        encoder = make_encoder(config.get("input", {}).get("encoder"), event_bus)
+    with _boot_phase("processes"):
+        processes = make_supervisor(event_bus, config.get("processes"))
 
     # A simple store for global state like battery %, WiFi status, etc.
     store = {
@@ -231,8 +653,30 @@ def make_services(repo_root: Optional[str] = None) -> Any:
         config=config,
         store=store,
         camera=camera,
+        frames=frames,
+        redraw=redraw,
         voice=voice,
-        notify=notify
+        intents=intents,
+        notify=notify,
+        tts=tts,
+        input=encoder,
+        processes=processes
     )
+    ctx.shutdown = lambda: shutdown(ctx)
 
     return ctx
+
+def make_context(config: Optional[dict] = None, repo_root: Optional[str] = None) -> Any:
+    """make_services() for apps that build their config in code (see trial_app.py)."""
+    return make_services(repo_root, config)
+
+def shutdown(ctx: Any) -> None:
+    """Stop background threads and release devices owned by ctx."""
+    if ctx.input:
+        ctx.input.stop()
+    ctx.voice.stop()
+    if ctx.tts:
+        ctx.tts.stop()
+    if ctx.processes:
+        ctx.processes.stop()
+    ctx.camera.close()
@@ -0,0 +1,446 @@
+# Software/Taka Software Edits/main_ui_layer/shm_bus.py
+# =============================================================================
+# CROSS-PROCESS EVENT BUS (shared memory)
+# -----------------------------------------------------------------------------
+# Lets vision, voice and the UI run as separate processes but share one
+# EventBus API.
+#
+#   UI process                               worker process
+#   EventBus --tap--> down ring (shm) ---->  RemoteBus.drain() -> handlers
+#   EventBus <------  up ring   (shm) <----  RemoteBus.emit()
+#
+# * Each worker gets two single-producer / single-consumer byte rings in
+#   multiprocessing.shared_memory: "up" (worker -> UI) and "down" (UI ->
+#   worker). No pickling and no pipes on the hot path.
+# * Events are encoded compactly. A record holds the event-class code, the
+#   timestamp and the dataclass fields in order, each with a 1-byte type tag.
+#   Only values the tags don't cover fall back to pickle.
+# * A worker only receives the topics it subscribed to. Events are never
+#   echoed back to the worker that sent them.
+# * ProcessSupervisor starts workers, restarts crashed ones with backoff, and
+#   unlinks their shared memory on stop(). make_services() builds one when
+#   config["processes"] lists workers:
+#
+#       processes:
+#         vision: "vision_worker:main"      # module:function(bus, **kwargs)
+#
+# bench_event_bus.py compares this transport with the in-process bus.
+# =============================================================================
+
+from __future__ import annotations
+import importlib
+import multiprocessing as mp
+import pickle
+import struct
+import threading
+import time
+from dataclasses import fields
+from multiprocessing import shared_memory
+from typing import Any, Callable, Optional
+
+try:
+    from .event_bus import EVENT_TYPES, Event, EventBus, Generic, make_event, topic_of
+except ImportError:
+    from event_bus import EVENT_TYPES, Event, EventBus, Generic, make_event, topic_of
+
+# ---------------------------- CODEC -------------------------------------
+REC_EVENT, REC_SUBSCRIBE, REC_STOP = 1, 2, 3
+
+_CLASSES = list(EVENT_TYPES.values())                  # code = index
+_CODES = {cls: i for i, cls in enumerate(_CLASSES)}
+_GENERIC = 255
+_FIELDS = {cls: tuple(f.name for f in fields(cls) if f.name != "ts") for cls in _CLASSES}
+
+_HEAD = struct.Struct("<BBd")         # record kind, class code, ts
+_U8, _U16, _U32 = struct.Struct("<B"), struct.Struct("<H"), struct.Struct("<I")
+_I64, _F64 = struct.Struct("<q"), struct.Struct("<d")
+
+T_NONE, T_INT, T_FLOAT, T_STR, T_TRUE, T_FALSE, T_BYTES, T_DICT, T_LIST, T_PICKLE = range(10)
+
+
+def _put_value(out: bytearray, v: Any) -> None:
+    if v is None:
+        out.append(T_NONE)
+    elif v is True or v is False:
+        out.append(T_TRUE if v else T_FALSE)
+    elif isinstance(v, int) and -2**63 <= v < 2**63:
+        out.append(T_INT); out += _I64.pack(v)
+    elif isinstance(v, float):
+        out.append(T_FLOAT); out += _F64.pack(v)
+    elif isinstance(v, str):
+        b = v.encode("utf-8")
+        out.append(T_STR); out += _U32.pack(len(b)); out += b
+    elif isinstance(v, (bytes, bytearray, memoryview)):
+        out.append(T_BYTES); out += _U32.pack(len(v)); out += v
+    elif isinstance(v, dict) and all(isinstance(k, str) for k in v):
+        out.append(T_DICT); out += _U16.pack(len(v))
+        for k, x in v.items():
+            _put_value(out, k); _put_value(out, x)
+    elif isinstance(v, (list, tuple)):
+        out.append(T_LIST); out += _U16.pack(len(v))
+        for x in v:
+            _put_value(out, x)
+    else:
+        b = pickle.dumps(v, protocol=pickle.HIGHEST_PROTOCOL)
+        out.append(T_PICKLE); out += _U32.pack(len(b)); out += b
+
+
+def _get_value(buf: memoryview, off: int) -> tuple[Any, int]:
+    tag = buf[off]; off += 1
+    if tag == T_NONE:
+        return None, off
+    if tag == T_TRUE or tag == T_FALSE:
+        return tag == T_TRUE, off
+    if tag == T_INT:
+        return _I64.unpack_from(buf, off)[0], off + 8
+    if tag == T_FLOAT:
+        return _F64.unpack_from(buf, off)[0], off + 8
+    if tag in (T_STR, T_BYTES, T_PICKLE):
+        n = _U32.unpack_from(buf, off)[0]; off += 4
+        raw = bytes(buf[off:off + n])
+        if tag == T_STR:
+            return raw.decode("utf-8"), off + n
+        return (raw if tag == T_BYTES else pickle.loads(raw)), off + n
+    n = _U16.unpack_from(buf, off)[0]; off += 2
+    if tag == T_DICT:
+        d = {}
+        for _ in range(n):
+            k, off = _get_value(buf, off)
+            d[k], off = _get_value(buf, off)
+        return d, off
+    items = []
+    for _ in range(n):
+        x, off = _get_value(buf, off)
+        items.append(x)
+    return items, off
+
+
+def encode(evt: Event) -> bytes:
+    cls = type(evt)
+    code = _CODES.get(cls, _GENERIC)
+    out = bytearray(_HEAD.pack(REC_EVENT, code, evt.ts))
+    if code == _GENERIC:
+        _put_value(out, topic_of(evt))
+        _put_value(out, evt.payload if isinstance(evt, Generic) else
+                   {f.name: getattr(evt, f.name) for f in fields(evt) if f.name != "ts"})
+    else:
+        for name in _FIELDS[cls]:
+            _put_value(out, getattr(evt, name))
+    return bytes(out)
+
+
+def decode(rec: bytes) -> tuple[int, Any]:
+    """(record kind, Event | topic | None)."""
+    buf = memoryview(rec)
+    kind, code, ts = _HEAD.unpack_from(buf, 0)
+    off = _HEAD.size
+    if kind == REC_SUBSCRIBE:
+        return kind, _get_value(buf, off)[0]
+    if kind != REC_EVENT:
+        return kind, None
+    if code == _GENERIC:
+        topic, off = _get_value(buf, off)
+        payload, off = _get_value(buf, off)
+        return kind, Generic(name=topic, payload=payload, ts=ts)
+    cls = _CLASSES[code]
+    vals = []
+    for _name in _FIELDS[cls]:
+        v, off = _get_value(buf, off)
+        vals.append(v)
+    return kind, cls(*vals, ts=ts)
+
+
+def _control(kind: int, topic: Optional[str] = None) -> bytes:
+    out = bytearray(_HEAD.pack(kind, 0, 0.0))
+    if topic is not None:
+        _put_value(out, topic)
+    return bytes(out)
+
+# ---------------------------- SHM RING ----------------------------------
+class ShmRing:
+    """
+    Single-producer / single-consumer ring of length-prefixed records.
+
+    head and tail are byte counters that only ever grow. The producer
+    writes the record first and publishes head after it, and the consumer
+    does the same with tail. Plain stores to shared memory carry no ordering
+    on weakly ordered CPUs (the device is ARM): the other process could see
+    the new head before the record bytes. So head and tail are stored and
+    loaded under `sync`, a process-shared lock whose acquire/release are
+    full barriers. Only the index accesses are locked, never the copies.
+    Threads within the producing process serialise on a local lock.
+
+    The creating side makes `sync` from its multiprocessing context; the
+    other process attaches with ShmRing(name, sync=that_lock).
+    """
+    CTRL = 64                       # head (u64) @0, tail (u64) @8, rest padding
+    WRAP = 0xFFFFFFFF
+    _POS = struct.Struct("<Q")
+
+    def __init__(self, name: Optional[str] = None, size: int = 1 << 20,
+                 sync: Any = None, ctx: Any = None) -> None:
+        self.owner = name is None
+        if sync is None:
+            if not self.owner:
+                raise ValueError("attaching to a ShmRing needs its creator's sync lock")
+            sync = (ctx or mp).Lock()
+        self.sync = sync
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=self.CTRL + size)
+            self.shm.buf[:self.CTRL] = bytes(self.CTRL)
+        else:
+            # workers share the supervisor's resource tracker, so attaching
+            # here does not hand the segment's lifetime to this process
+            self.shm = shared_memory.SharedMemory(name=name)
+        self._wlock = threading.Lock()
+        self.name = self.shm.name
+        self.buf = self.shm.buf
+        self.cap = self.shm.size - self.CTRL
+        self.dropped = 0
+
+    def _positions(self) -> tuple[int, int]:
+        """(head, tail), read under the barrier."""
+        with self.sync:
+            return self._POS.unpack_from(self.buf, 0)[0], self._POS.unpack_from(self.buf, 8)[0]
+
+    def _publish(self, off: int, value: int) -> None:
+        with self.sync:
+            self._POS.pack_into(self.buf, off, value)
+
+    def put(self, data: bytes) -> bool:
+        """Append one record; False (and counted as dropped) if the ring is full."""
+        with self._wlock:
+            return self._put(data)
+
+    def _put(self, data: bytes) -> bool:
+        n = len(data)
+        head, tail = self._positions()
+        pos = head % self.cap
+        room_to_end = self.cap - pos
+        skip = room_to_end if room_to_end < 4 + n else 0
+        if head + skip + 4 + n - tail > self.cap:
+            self.dropped += 1
+            return False
+        if skip:
+            if room_to_end >= 4:
+                _U32.pack_into(self.buf, self.CTRL + pos, self.WRAP)
+            pos = 0
+        base = self.CTRL + pos
+        _U32.pack_into(self.buf, base, n)
+        self.buf[base + 4:base + 4 + n] = data
+        self._publish(0, head + skip + 4 + n)     # after the record bytes
+        return True
+
+    def get(self) -> Optional[bytes]:
+        head, tail = self._positions()
+        if tail == head:
+            return None
+        pos = tail % self.cap
+        room_to_end = self.cap - pos
+        if room_to_end < 4 or _U32.unpack_from(self.buf, self.CTRL + pos)[0] == self.WRAP:
+            tail += room_to_end
+            pos = 0
+        base = self.CTRL + pos
+        n = _U32.unpack_from(self.buf, base)[0]
+        data = bytes(self.buf[base + 4:base + 4 + n])
+        self._publish(8, tail + 4 + n)            # after the copy out
+        return data
+
+    def close(self) -> None:
+        self.buf = None
+        self.shm.close()
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _poll(ring: ShmRing, handle: Callable[[bytes], bool], stop: threading.Event) -> None:
+    """Reader loop: drain the ring, then back off from 50 us up to 1 ms while idle."""
+    idle = 0
+    while not stop.is_set():
+        rec = ring.get()
+        if rec is None:
+            idle += 1
+            time.sleep(min(0.001, 0.00005 * idle))
+            continue
+        idle = 0
+        if not handle(rec):
+            return
+
+# ---------------------------- WORKER SIDE -------------------------------
+class RemoteBus:
+    """
+    The EventBus API inside a worker process: emit()/publish() go up to the
+    UI process; subscribe() registers locally and asks the UI process to
+    forward that topic; drain()/wait() dispatch what has arrived.
+    """
+    def __init__(self, up: ShmRing, down: ShmRing) -> None:
+        self.up, self.down = up, down
+        self.local = EventBus()
+        self.stopping = threading.Event()
+        self._reader = threading.Thread(target=_poll, name="shm-bus-down",
+                                        args=(down, self._on_record, self.stopping),
+                                        daemon=True)
+        self._reader.start()
+
+    def _on_record(self, rec: bytes) -> bool:
+        kind, evt = decode(rec)
+        if kind == REC_STOP:
+            self.stopping.set()
+            return False
+        if kind == REC_EVENT:
+            self.local.publish(evt, origin="ui")
+        return True
+
+    def emit(self, type_: str, **payload: Any) -> None:
+        self.publish(make_event(type_, payload))
+
+    def publish(self, evt: Event) -> bool:
+        evt.ts = time.monotonic()
+        return self.up.put(encode(evt))
+
+    def subscribe(self, topic: str, handler: Callable[[Event], Any]) -> Callable[[], None]:
+        self.up.put(_control(REC_SUBSCRIBE, topic))
+        return self.local.subscribe(topic, handler)
+
+    def drain(self, max_n: int = 64, budget_ms: float = 4.0) -> int:
+        return self.local.drain(max_n, budget_ms)
+
+    def wait(self, timeout: float) -> bool:
+        return self.local.wait(timeout)
+
+
+def _child_main(target: str, up: tuple, down: tuple, kwargs: dict) -> None:
+    up, down = ShmRing(up[0], sync=up[1]), ShmRing(down[0], sync=down[1])
+    bus = RemoteBus(up, down)
+    try:
+        mod, _, fn = target.partition(":")
+        getattr(importlib.import_module(mod), fn or "main")(bus, **kwargs)
+    finally:
+        bus.stopping.set()
+        up.close(); down.close()
+
+# ---------------------------- SUPERVISOR (UI side) ----------------------
+class _Worker:
+    __slots__ = ("name", "target", "kwargs", "restart", "proc", "up", "down",
+                 "topics", "stop", "reader", "restarts", "next_start")
+
+
+class ProcessSupervisor:
+    """
+    Starts workers as separate processes wired to `bus` through shm rings,
+    restarts them (with exponential backoff) when they die, and stops them
+    cleanly with stop().
+    """
+    def __init__(self, bus: EventBus, ring_bytes: int = 1 << 20,
+                 start_method: str = "spawn", max_backoff: float = 30.0) -> None:
+        self.bus = bus
+        self.ring_bytes = ring_bytes
+        self.mp = mp.get_context(start_method)
+        self.max_backoff = max_backoff
+        self.workers: dict[str, _Worker] = {}
+        self._lock = threading.Lock()
+        self._halt = threading.Event()
+        bus.add_tap(self._forward)
+        self._watchdog = threading.Thread(target=self._watch, name="proc-supervisor",
+                                          daemon=True)
+        self._watchdog.start()
+
+    def spawn(self, name: str, target: str, restart: bool = True, **kwargs: Any) -> None:
+        """Run `module:function(bus, **kwargs)` in its own process."""
+        w = _Worker()
+        w.name, w.target, w.kwargs, w.restart = name, target, kwargs, restart
+        w.restarts, w.next_start, w.proc = 0, 0.0, None
+        with self._lock:
+            self.workers[name] = w
+        self._start(w)
+
+    def _start(self, w: _Worker) -> None:
+        w.up = ShmRing(size=self.ring_bytes, ctx=self.mp)
+        w.down = ShmRing(size=self.ring_bytes, ctx=self.mp)
+        w.topics = frozenset()
+        w.stop = threading.Event()
+        w.reader = threading.Thread(target=_poll, name=f"shm-bus-{w.name}",
+                                    args=(w.up, lambda rec, w=w: self._on_record(w, rec), w.stop),
+                                    daemon=True)
+        w.reader.start()
+        w.proc = self.mp.Process(target=_child_main, name=w.name, daemon=True,
+                                 args=(w.target, (w.up.name, w.up.sync),
+                                       (w.down.name, w.down.sync), w.kwargs))
+        w.proc.start()
+
+    def _on_record(self, w: _Worker, rec: bytes) -> bool:
+        kind, evt = decode(rec)
+        if kind == REC_EVENT:
+            self.bus.publish(evt, origin=w.name)
+        elif kind == REC_SUBSCRIBE:
+            w.topics = w.topics | {evt}
+        return True
+
+    def _forward(self, evt: Event, origin: Any) -> None:
+        topic = topic_of(evt)
+        rec = None
+        for w in list(self.workers.values()):
+            if w.name != origin and w.proc is not None and (topic in w.topics or "*" in w.topics):
+                rec = rec or encode(evt)
+                w.down.put(rec)
+
+    def _teardown(self, w: _Worker) -> None:
+        w.proc = None                # stops _forward() first
+        w.stop.set()
+        w.reader.join(1.0)
+        w.up.close(); w.down.close()
+
+    def _watch(self) -> None:
+        while not self._halt.wait(0.5):
+            now = time.monotonic()
+            for w in list(self.workers.values()):
+                if w.proc is not None and not w.proc.is_alive():
+                    code = w.proc.exitcode
+                    self._teardown(w)
+                    if not w.restart:
+                        print(f"[procs] {w.name} exited ({code})")
+                        continue
+                    delay = min(self.max_backoff, 0.5 * 2 ** w.restarts)
+                    w.restarts += 1
+                    w.next_start = now + delay
+                    print(f"[procs] ?? {w.name} died ({code}); restarting in {delay:.1f}s")
+                elif w.proc is None and w.restart and w.next_start and now >= w.next_start:
+                    w.next_start = 0.0
+                    self._start(w)
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._halt.set()
+        for w in list(self.workers.values()):
+            if w.proc is None:
+                continue
+            w.down.put(_control(REC_STOP))
+            w.proc.join(timeout)
+            if w.proc.is_alive():
+                w.proc.terminate()
+                w.proc.join(timeout)
+            self._teardown(w)
+
+    def stats(self) -> dict:
+        return {w.name: {"alive": bool(w.proc and w.proc.is_alive()),
+                         "restarts": w.restarts, "topics": sorted(w.topics),
+                         "dropped_up": w.up.dropped if w.proc else 0,
+                         "dropped_down": w.down.dropped if w.proc else 0}
+                for w in self.workers.values()}
+
+
+def make_supervisor(bus: EventBus, processes: dict[str, Any]) -> Optional[ProcessSupervisor]:
+    """From config["processes"]: {name: "module:function"} or {name: {target, restart, kwargs}}."""
+    if not processes:
+        return None
+    sup = ProcessSupervisor(bus)
+    for name, spec in processes.items():
+        if isinstance(spec, str):
+            spec = {"target": spec}
+        try:
+            sup.spawn(name, spec["target"], spec.get("restart", True), **spec.get("kwargs", {}))
+        except Exception as e:
+            print(f"[procs] ?? could not start {name}: {e}")
+    return sup
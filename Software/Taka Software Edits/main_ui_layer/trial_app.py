@@ -1,8 +1,11 @@
 # Software/Taka Software Edits/main_ui_layer/trial_app.py
 from __future__ import annotations
 import time
+from .boot_timeline import BOOT
 from .services import make_context
 from .pane_base import Pane
+from .intents import GLOBAL
+from .tts_service import PROMPT
 from .pane_wrappers import make_functional_pane
 
 # import real panes (adjust names if your files differ)
@@ -32,6 +35,8 @@ def run():
         "assets_dir": "VA-Assets",
         "features": {"background_removal": False, "background_mode": "black"},
         "voice_hotword": "hey vision",
+        "voice": {"listen": True},
+        "tts": {"enabled": True},
     }
     ctx = make_context(config)
 
@@ -44,32 +49,96 @@ def run():
         "demo":     demo_cls(ctx),
     }
 
+    redraw, bus, intents = ctx.redraw, ctx.event_bus, ctx.intents
+
+    # voice commands: each pane's @intent phrases, plus a few that work anywhere
+    for pane in panes.values():
+        intents.add_pane(pane)
+
+    def open_pane(pane: str):
+        if pane in panes:
+            bus.emit("NAVIGATE", pane_id=pane)
+        else:
+            ctx.notify.info(f"Pane '{pane}' not found")
+
+    intents.register(GLOBAL, "open {pane}", open_pane, pane=lambda: list(panes))
+    intents.register(GLOBAL, "go home", lambda: open_pane("launcher"))
+
     current = panes[config.get("default_pane","launcher")]
     current.mount(ctx)
-    last = time.perf_counter()
+    ctx.voice.set_grammar(intents.grammar(current.id))
+
+    def on_navigate(evt):
+        nonlocal current
+        if evt.pane_id in panes and panes[evt.pane_id] is not current:
+            current.unmount(); current = panes[evt.pane_id]; current.mount(ctx)
+            ctx.voice.set_grammar(intents.grammar(current.id))
+            if ctx.tts:
+                ctx.tts.say(current.title, PROMPT)   # cuts off older chatter
+
+    def on_voice(evt):
+        # trie lookup first; panes without a matching phrase get the raw text
+        if not intents.dispatch(evt.text, current.id):
+            current.on_voice(evt.text)
+        redraw.invalidate()   # handlers mutate pane state
+
+    def on_input(evt):
+        if not ctx.input:
+            return
+        # one event per burst: take everything since last frame
+        delta, presses = ctx.input.take()
+        if delta:
+            current.on_gesture("rotate", delta)
+        for _ in range(presses):
+            current.on_gesture("press")
+        redraw.invalidate()
+
+    def on_wake(evt):
+        ctx.notify.info("Listening…")
+
+    bus.subscribe("NAVIGATE", on_navigate)
+    bus.subscribe("WAKE", on_wake)
+    bus.subscribe("VOICE", on_voice)
+    bus.subscribe("INPUT", on_input)
 
     try:
         while True:
-            now = time.perf_counter(); dt = now - last; last = now
-            for evt in list(ctx.event_bus.poll()):
-                if evt["type"] == "NAVIGATE":
-                    pid = evt.get("pane_id")
-                    if pid in panes and panes[pid] is not current:
-                        current.unmount(); current = panes[pid]; current.mount(ctx)
-                elif evt["type"] == "VOICE":
-                    current.on_voice(evt.get("text",""))
-
-            ctx.overlay.begin_frame()
+            # input first, then navigation, voice, telemetry; never blocks
+            bus.drain(max_n=32, budget_ms=4.0)
+
+            # paced to display.fps; returns None when nothing is dirty
+            # (new events cut the idle wait short)
+            dirty = redraw.wait_frame()
+            if dirty is None:
+                continue
+            t = time.perf_counter()
+            ctx.overlay.begin_frame(dirty)
             current.render()
             ctx.overlay.end_frame()
-
-            fps = max(10, int(ctx.display.fps))
-            time.sleep(max(0.0, (1/fps) - (time.perf_counter() - now)))
+            redraw.frame_done(time.perf_counter() - t)
+            if BOOT.end is None:
+                print(f"[boot] {BOOT.finish('first_frame')} → {BOOT.path}")
     except KeyboardInterrupt:
         pass
     finally:
+        if BOOT.end is None:
+            BOOT.finish("shutdown")   # saves the trace and drops the import hook
         try: current.unmount()
         except: pass
+        st = redraw.stats()
+        print(f"[render] {st['frames']} frames, {st['skipped']} skipped "
+              f"({st['idle_pct']:.0f}% idle), avg {st['frame_avg_ms']:.1f} ms")
+        vs = ctx.voice.stats()
+        if vs:
+            cpu = " · ".join(f"{k} {v:.1f}%" for k, v in vs["cpu_pct"].items())
+            print(f"[voice] {cpu} · {vs['wakes']} wakes, {vs['false_wakes']} false, "
+                  f"{vs['gate_rejects']} gate rejects")
+        if ctx.tts:
+            ts = ctx.tts.stats()
+            print(f"[tts] {ts['spoken']} spoken, {ts['preempted']} cut off, {ts['dropped']} dropped · "
+                  f"cache {ts['cache_hits']} hits / {ts['cache_misses']} misses")
+        its = intents.stats()
+        print(f"[intents] {its['intents']} phrases · {its['hits']} matched, {its['misses']} unmatched")
         ctx.shutdown()
 
 if __name__ == "__main__":
@@ -0,0 +1,259 @@
+# Software/Taka Software Edits/main_ui_layer/tts_service.py
+# =============================================================================
+# TEXT-TO-SPEECH SERVICE
+# -----------------------------------------------------------------------------
+# Spoken feedback (toasts, pane names, assistant replies) without blocking the
+# UI. pyttsx3's runAndWait() holds its caller for the whole utterance, so all
+# speech goes through one worker thread:
+#
+#   say(text, priority) -> priority queue -> worker: cache hit?  -> play PCM
+#                                                    cache miss? -> synthesise
+#                                                                   to WAV once
+#
+# * Priorities: CHATTER (toasts) < ALERT (errors) < PROMPT (navigation).
+#   A new utterance that outranks the one playing cuts it off at the next
+#   50 ms block and drops every lower-priority utterance still queued, so
+#   the user never hears stale chatter after switching panes. Equal
+#   priorities queue up; a phrase already queued is not queued twice.
+# * Synthesised audio is cached on disk as WAV, keyed by (text, voice,
+#   rate), and trimmed oldest-first past cache_mb. Repeated phrases
+#   ("Listening…", pane names) stream straight from the cache.
+# * Playback writes the cached PCM to a sounddevice output stream in small
+#   blocks, so preemption is quick. Without sounddevice the worker falls
+#   back to pyttsx3 speaking directly. That still runs off the UI thread,
+#   but it can't be interrupted.
+# * Ducking: "DUCK" (active=True/False) goes out on the EventBus around each
+#   utterance, so music and other audio sources can lower themselves.
+# =============================================================================
+
+from __future__ import annotations
+import hashlib
+import heapq
+import itertools
+import os
+import threading
+import time
+import wave
+from typing import Any, Optional
+
+try:
+    import pyttsx3
+except ImportError:
+    pyttsx3 = None
+try:
+    import sounddevice as sd
+except Exception:      # also raises OSError when PortAudio is missing
+    sd = None
+
+CHATTER, ALERT, PROMPT = 0, 1, 2
+
+# ---------------------------- PHRASE CACHE ------------------------------
+class PhraseCache:
+    """Synthesised WAV files on disk, one per (text, voice, rate)."""
+    def __init__(self, root: str, max_mb: float = 32.0) -> None:
+        self.root = root
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        os.makedirs(root, exist_ok=True)
+        self.hits = self.misses = 0
+
+    def path(self, text: str, voice: str, rate: int) -> str:
+        key = hashlib.sha1(f"{voice}\0{rate}\0{text}".encode("utf-8")).hexdigest()
+        return os.path.join(self.root, f"{key}.wav")
+
+    def lookup(self, text: str, voice: str, rate: int) -> Optional[str]:
+        p = self.path(text, voice, rate)
+        if os.path.exists(p):
+            self.hits += 1
+            os.utime(p)                  # keep recently spoken phrases
+            return p
+        self.misses += 1
+        return None
+
+    def trim(self) -> None:
+        """Delete least recently used files until the cache fits max_mb."""
+        files = []
+        for name in os.listdir(self.root):
+            if name.endswith(".wav"):
+                st = os.stat(os.path.join(self.root, name))
+                files.append((st.st_mtime, st.st_size, name))
+        total = sum(f[1] for f in files)
+        for _mtime, size, name in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.root, name))
+                total -= size
+            except OSError:
+                pass
+
+# ---------------------------- SERVICE -----------------------------------
+class TTSService(threading.Thread):
+    """Queued, interruptible speech on a worker thread. say() never blocks."""
+    BLOCK_S = 0.05            # playback granularity = worst-case preempt delay
+    MAX_QUEUE = 8             # chatter beyond this is dropped, oldest first
+
+    def __init__(self, event_bus: Any = None, voice: Optional[str] = None,
+                 rate: int = 170, cache_dir: str = "cache/tts",
+                 cache_mb: float = 32.0) -> None:
+        super().__init__(name="tts", daemon=True)
+        self.event_bus = event_bus
+        self.voice = voice or ""
+        self.rate = int(rate)
+        self.cache = PhraseCache(cache_dir, cache_mb)
+        self._queue: list = []                    # (-priority, seq, text, t_said)
+        self._seq = itertools.count()
+        self._cv = threading.Condition()
+        self._playing: Optional[int] = None       # priority of the current utterance
+        self._preempt = threading.Event()
+        self._halt = False
+        self._engine = None                       # made on the worker thread
+        self.spoken = self.preempted = self.dropped = 0
+        self.latency_ms: Optional[float] = None   # say() to first audio, smoothed
+
+    # ----- producer side (any thread) -----
+    def say(self, text: str, priority: int = CHATTER) -> None:
+        text = " ".join((text or "").split())
+        if not text:
+            return
+        with self._cv:
+            if any(t == text for _p, _s, t, _ts in self._queue):
+                return
+            if self._playing is not None and priority > self._playing:
+                self._preempt.set()
+            if priority > CHATTER:
+                # a prompt makes everything less urgent than it stale
+                kept = [q for q in self._queue if -q[0] >= priority]
+                self.dropped += len(self._queue) - len(kept)
+                self._queue = kept
+                heapq.heapify(self._queue)
+            heapq.heappush(self._queue, (-priority, next(self._seq), text, time.monotonic()))
+            while len(self._queue) > self.MAX_QUEUE:
+                oldest = min((q for q in self._queue if -q[0] == CHATTER),
+                             key=lambda q: q[1], default=None)
+                if oldest is None:
+                    break
+                self._queue.remove(oldest)
+                heapq.heapify(self._queue)
+                self.dropped += 1
+            self._cv.notify()
+
+    def interrupt(self) -> None:
+        """Stop the current utterance and forget everything queued."""
+        with self._cv:
+            self.dropped += len(self._queue)
+            self._queue.clear()
+            if self._playing is not None:
+                self._preempt.set()
+
+    def stop(self) -> None:
+        with self._cv:
+            self._halt = True
+            self._queue.clear()
+            self._preempt.set()
+            self._cv.notify()
+
+    # ----- worker -----
+    def run(self) -> None:
+        while True:
+            with self._cv:
+                while not self._queue and not self._halt:
+                    self._cv.wait()
+                if self._halt:
+                    return
+                neg_pri, _seq, text, t_said = heapq.heappop(self._queue)
+                self._playing = -neg_pri
+                self._preempt.clear()
+            try:
+                self._duck(True)
+                self._speak(text, t_said)
+            except Exception as e:
+                print(f"[tts] ?? could not speak '{text}': {e}")
+            finally:
+                self._duck(False)
+                with self._cv:
+                    self._playing = None
+
+    def _speak(self, text: str, t_said: float) -> None:
+        if sd is None:
+            engine = self._get_engine()
+            self._first_audio(t_said)
+            engine.say(text)
+            engine.runAndWait()
+            self.spoken += 1
+            return
+        path = self.cache.lookup(text, self.voice, self.rate)
+        if path is None:
+            path = self._synthesise(text)
+        self._play(path, t_said)
+
+    def _synthesise(self, text: str) -> str:
+        path = self.cache.path(text, self.voice, self.rate)
+        tmp = f"{path}.{os.getpid()}.tmp.wav"
+        engine = self._get_engine()
+        engine.save_to_file(text, tmp)
+        engine.runAndWait()
+        os.replace(tmp, path)        # readers never see a half-written file
+        self.cache.trim()
+        return path
+
+    def _play(self, path: str, t_said: float) -> None:
+        with wave.open(path, "rb") as wf:
+            rate, ch, width = wf.getframerate(), wf.getnchannels(), wf.getsampwidth()
+            block = max(1, int(rate * self.BLOCK_S))
+            dtype = {1: "uint8", 2: "int16", 4: "int32"}[width]
+            with sd.RawOutputStream(samplerate=rate, channels=ch, dtype=dtype) as out:
+                first = True
+                while True:
+                    if self._preempt.is_set():
+                        self.preempted += 1
+                        out.abort()
+                        return
+                    data = wf.readframes(block)
+                    if not data:
+                        break
+                    if first:
+                        self._first_audio(t_said)
+                        first = False
+                    out.write(data)
+        self.spoken += 1
+
+    def _get_engine(self) -> Any:
+        # pyttsx3 engines belong to the thread that created them
+        if self._engine is None:
+            if pyttsx3 is None:
+                raise RuntimeError("pyttsx3 not installed")
+            self._engine = pyttsx3.init()
+            self._engine.setProperty("rate", self.rate)
+            if self.voice:
+                self._engine.setProperty("voice", self.voice)
+        return self._engine
+
+    def _first_audio(self, t_said: float) -> None:
+        ms = (time.monotonic() - t_said) * 1000.0
+        self.latency_ms = ms if self.latency_ms is None else self.latency_ms + (ms - self.latency_ms) * 0.2
+
+    def _duck(self, active: bool) -> None:
+        if self.event_bus is not None:
+            self.event_bus.emit("DUCK", active=active)
+
+    def stats(self) -> dict:
+        return {
+            "spoken": self.spoken, "preempted": self.preempted,
+            "dropped": self.dropped, "queued": len(self._queue),
+            "cache_hits": self.cache.hits, "cache_misses": self.cache.misses,
+            "latency_ms": self.latency_ms,
+        }
+
+
+def make_tts(event_bus: Any, cfg: dict) -> Optional[TTSService]:
+    """Start the TTS worker from config["tts"], or None when disabled/unavailable."""
+    if not cfg.get("enabled", False):
+        return None
+    if pyttsx3 is None:
+        print("[tts] ?? pyttsx3 not installed; spoken feedback is off")
+        return None
+    tts = TTSService(event_bus, voice=cfg.get("voice"), rate=cfg.get("rate", 170),
+                     cache_dir=cfg.get("cache_dir", "cache/tts"),
+                     cache_mb=cfg.get("cache_mb", 32))
+    tts.start()
+    return tts
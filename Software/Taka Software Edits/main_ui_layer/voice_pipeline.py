@@ -0,0 +1,289 @@
+# Software/Taka Software Edits/main_ui_layer/voice_pipeline.py
+# =============================================================================
+# TWO-STAGE VOICE PIPELINE
+# -----------------------------------------------------------------------------
+# Keeps the mic open all the time, but only runs full speech recognition
+# after the hotword is heard.
+#
+#   mic ring -> [gate]      energy/VAD per 20 ms block        (always on, ~free)
+#            -> [spotter]   KaldiRecognizer restricted to the hotword
+#                           (only while the gate hears speech)
+#            -> [recognizer] full-vocabulary KaldiRecognizer
+#                           (only after a spotter hit, until the endpoint)
+#            -> "VOICE" on the EventBus
+#
+# * Audio comes from the shared mic ring (audio_input.py):
+#   20 ms blocks in a lock-free ring, so every stage reads with its own
+#   cursor and can rewind. On a hit the recogniser replays the utterance
+#   from its start, so "hey vision open wifi" said in one breath still
+#   yields "open wifi".
+# * Each stage's CPU is measured with thread_time() around its calls and
+#   reported as % of one core over the pipeline's lifetime. Counters:
+#   gate opens, gate rejects (speech but no hotword), wakes, and false
+#   wakes (no command within LISTEN_TIMEOUT_S of a wake). A pause after
+#   the hotword ("hey vision ... open wifi") keeps listening.
+# * set_grammar() narrows the full recogniser to the phrases the active pane
+#   understands (IntentRegistry.grammar). The swap happens on the pipeline
+#   thread at the next wake, never mid-utterance.
+# * stats() returns all of it; the same numbers go out every few seconds as
+#   TELEMETRY name="voice".
+# =============================================================================
+
+from __future__ import annotations
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Optional
+
+try:
+    from . import audio_input
+except ImportError:               # loaded by path, or numpy missing
+    try:
+        import audio_input
+    except ImportError:
+        audio_input = None
+try:
+    from vosk import KaldiRecognizer, Model
+except ImportError:
+    KaldiRecognizer = Model = None
+
+GATE, SPOT, LISTEN = "gate", "spotter", "recognizer"
+
+# ---------------------------- MODELS ------------------------------------
+_MODELS: dict[str, Any] = {}
+_MODELS_LOCK = threading.Lock()
+
+def load_model(path: str) -> Any:
+    """Load a Vosk model once per process; every recogniser shares it."""
+    with _MODELS_LOCK:
+        model = _MODELS.get(path)
+        if model is None:
+            model = _MODELS[path] = Model(path)
+        return model
+
+# ---------------------------- STAGE METER -------------------------------
+class StageMeter:
+    """CPU seconds per stage, from thread_time() deltas on the pipeline thread."""
+    def __init__(self, *stages: str) -> None:
+        self.cpu = {s: 0.0 for s in stages}
+        self.calls = {s: 0 for s in stages}
+        self.t0 = time.monotonic()
+        self._stage: Optional[str] = None
+        self._c0 = 0.0
+
+    def __call__(self, stage: str) -> "StageMeter":
+        self._stage = stage
+        return self
+
+    def __enter__(self) -> None:
+        self._c0 = time.thread_time()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.cpu[self._stage] += time.thread_time() - self._c0
+        self.calls[self._stage] += 1
+
+    def percent(self) -> dict[str, float]:
+        wall = max(1e-6, time.monotonic() - self.t0)
+        return {s: 100.0 * c / wall for s, c in self.cpu.items()}
+
+# ---------------------------- PIPELINE ----------------------------------
+class VoicePipeline(threading.Thread):
+    """
+    Hotword-gated recognition on its own thread. Publishes VOICE(text) for
+    each command and a "WAKE" event when the hotword is heard (so the UI
+    can show that it is listening).
+    """
+    CHUNK_BLOCKS = 5          # 100 ms of audio per Kaldi call
+    PREROLL_S = 0.3           # audio kept from before the gate opened
+    SPOT_TIMEOUT_S = 2.5      # the hotword has to come early in an utterance
+    LISTEN_TIMEOUT_S = 6.0    # wake with no command after this = false wake
+    TELEMETRY_S = 5.0
+
+    def __init__(self, event_bus: Any, hotword: str, model: Any, ring: Any,
+                 endpointer: Any = None) -> None:
+        super().__init__(name="voice-pipeline", daemon=True)
+        self.event_bus = event_bus
+        self.hotword = hotword.strip().lower()
+        self.ring = ring
+        self.gate = endpointer or audio_input.Endpointer(hangover_ms=500)
+        self.block = self.gate.block
+        self.model = model
+        rate = ring.rate
+        grammar = json.dumps([self.hotword, "[unk]"])
+        self.spotter = KaldiRecognizer(model, rate, grammar)
+        self.recognizer = KaldiRecognizer(model, rate)
+        self.grammar_size = 0        # phrases in the recogniser's grammar, 0 = full
+        self._grammar: Any = None    # pending set_grammar() list, None = no change
+        self.meter = StageMeter(GATE, SPOT, LISTEN)
+        self.state = GATE
+        self._halt = threading.Event()
+        self.gate_opens = self.gate_rejects = 0
+        self.wakes = self.false_wakes = self.commands = 0
+
+    # ----- loop -----
+    def run(self) -> None:
+        cursor = self.ring.cursor()
+        preroll: deque = deque(maxlen=max(1, int(self.PREROLL_S * self.ring.rate / self.block)))
+        batch: list = []
+        utt_start = 0            # ring position where the current utterance began
+        deadline = 0.0
+        next_report = time.monotonic() + self.TELEMETRY_S
+        try:
+            while not self._halt.is_set():
+                if time.monotonic() >= next_report:
+                    self._report()
+                    next_report = time.monotonic() + self.TELEMETRY_S
+                if not self.ring.wait(cursor, 0.1):
+                    continue
+                samples, cursor = self.ring.read(cursor)
+                n, extra = divmod(len(samples), self.block)
+                cursor -= extra          # partial block: read it again next time
+                for i in range(n):
+                    blk = samples[i * self.block:(i + 1) * self.block]
+                    with self.meter(GATE):
+                        edge = self.gate.push(blk)
+                    now = time.monotonic()
+
+                    if self.state == GATE:
+                        preroll.append(blk)
+                        if edge == "start":
+                            self.gate_opens += 1
+                            self.state = SPOT
+                            utt_start = cursor - (n - i - 1 + len(preroll)) * self.block
+                            self.spotter.Reset()
+                            batch = list(preroll)
+                            preroll.clear()
+                            deadline = now + self.SPOT_TIMEOUT_S
+                        continue
+
+                    batch.append(blk)
+                    if len(batch) < self.CHUNK_BLOCKS and edge != "end":
+                        continue
+                    data = b"".join(b.tobytes() for b in batch)
+                    batch = []
+
+                    if self.state == SPOT:
+                        if self._spot(data):
+                            self._wake()
+                            self._apply_grammar()
+                            # replay the utterance so words right after the
+                            # hotword (same breath) reach the full recogniser
+                            self.recognizer.Reset()
+                            pos = cursor - (n - i - 1) * self.block
+                            replay, _ = self.ring.read(utt_start, pos - utt_start)
+                            with self.meter(LISTEN):
+                                self.recognizer.AcceptWaveform(replay.tobytes())
+                            self.state = LISTEN
+                            deadline = now + self.LISTEN_TIMEOUT_S
+                            self._listen(False, edge, False)
+                        elif edge == "end" or now > deadline:
+                            self.gate_rejects += 1
+                            self._reset_gate()
+                    elif self.state == LISTEN:
+                        with self.meter(LISTEN):
+                            done = self.recognizer.AcceptWaveform(data)
+                        self._listen(done, edge, now > deadline)
+        except Exception as e:
+            print(f"[voice] ?? pipeline stopped: {e}")
+
+    def _spot(self, data: bytes) -> bool:
+        with self.meter(SPOT):
+            if self.spotter.AcceptWaveform(data):
+                text = json.loads(self.spotter.Result()).get("text", "")
+            else:
+                text = json.loads(self.spotter.PartialResult()).get("partial", "")
+        return self.hotword in text
+
+    def _apply_grammar(self) -> None:
+        phrases, self._grammar = self._grammar, None
+        if phrases is None:
+            return
+        rate = self.ring.rate
+        if phrases:
+            # the replayed utterance still starts with the hotword
+            spoken = [p for p in phrases if p != "[unk]"]
+            full = phrases + [f"{self.hotword} {p}" for p in spoken]
+            self.recognizer = KaldiRecognizer(self.model, rate, json.dumps(full))
+        else:
+            self.recognizer = KaldiRecognizer(self.model, rate)
+        self.grammar_size = len(phrases)
+
+    def _wake(self) -> None:
+        self.wakes += 1
+        self.event_bus.emit("WAKE", hotword=self.hotword)
+
+    def _command(self, res: str, key: str = "text") -> str:
+        """Recognised text without the hotword (the replayed audio starts with it)."""
+        text = json.loads(res).get(key, "").strip()
+        if text.startswith(self.hotword):
+            text = text[len(self.hotword):].strip()
+        return text
+
+    def _listen(self, done: bool, edge: Optional[str], expired: bool) -> None:
+        """
+        After each LISTEN chunk: publish once a command has been heard and
+        the speaker paused (or Kaldi endpointed). A pause with nothing but
+        the hotword so far is the gap before the command, so keep listening;
+        only the deadline turns that into a false wake.
+        """
+        with self.meter(LISTEN):
+            if done:
+                text = self._command(self.recognizer.Result())
+            elif edge == "end" or expired:
+                heard = self._command(self.recognizer.PartialResult(), "partial")
+                text = self._command(self.recognizer.FinalResult()) if heard or expired else ""
+            else:
+                return
+        if text:
+            self.commands += 1
+            self.event_bus.emit("VOICE", text=text)
+            self._reset_gate()
+        elif expired:
+            self.false_wakes += 1
+            self._reset_gate()
+
+    def _reset_gate(self) -> None:
+        self.state = GATE
+        self.gate.reset()
+
+    def _report(self) -> None:
+        self.event_bus.emit("TELEMETRY", name="voice", value=self.stats())
+
+    # ----- control -----
+    def stop(self) -> None:
+        self._halt.set()
+
+    def set_grammar(self, phrases: Optional[list[str]]) -> None:
+        """Phrase list for the full recogniser from the next wake on; None = full vocabulary."""
+        self._grammar = list(phrases) if phrases else []
+
+    def stats(self) -> dict:
+        cpu = self.meter.percent()
+        return {
+            "state": self.state,
+            "cpu_pct": {k: round(v, 2) for k, v in cpu.items()},
+            "gate_opens": self.gate_opens, "gate_rejects": self.gate_rejects,
+            "wakes": self.wakes, "false_wakes": self.false_wakes,
+            "commands": self.commands,
+            "grammar": self.grammar_size,
+            "overruns": getattr(self.ring, "overruns", 0),
+        }
+
+
+def make_pipeline(event_bus: Any, hotword: str, model_path: str) -> Optional[VoicePipeline]:
+    """Start the pipeline on the shared mic, or None if vosk/mic/model are missing."""
+    if audio_input is None or Model is None:
+        print("[voice] ?? vosk or numpy unavailable; voice is push_transcript() only")
+        return None
+    try:
+        model = load_model(model_path)
+    except Exception as e:
+        print(f"[voice] ?? could not load {model_path}: {e}")
+        return None
+    capture = audio_input.shared()
+    if not capture.running:
+        return None
+    pipe = VoicePipeline(event_bus, hotword, model, capture.ring)
+    pipe.start()
+    return pipe
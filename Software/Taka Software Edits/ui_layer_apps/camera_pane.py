@@ -26,25 +26,27 @@ except Exception:
 
 # Robust import of Pane base
 try:
-    from ..main_ui_layer.pane_base import Pane
+    from ..main_ui_layer.pane_base import Pane, intent
 except Exception:
     BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     ML = os.path.join(BASE, "main_ui_layer")
     if ML not in sys.path:
         sys.path.insert(0, ML)
-    from pane_base import Pane  # type: ignore
+    from pane_base import Pane, intent  # type: ignore
 
 
 class CameraPane(Pane):
     id = "camera"
     title = "Camera"
     icon = "icons/icon-camera.png"
+    animated = True   # live preview: redraw every frame
 
     def on_mount(self) -> None:
         self.save_dir = os.path.join(os.getcwd(), "captures")
         os.makedirs(self.save_dir, exist_ok=True)
         self.recording = False
         self._writer = None
+        self._size = (0, 0)
         self._status = ""
 
     def on_unmount(self) -> None:
@@ -78,8 +80,7 @@ class CameraPane(Pane):
             ok, frame = self.ctx.camera.read()
             if ok and frame is not None:
                 try:
-                    fw = int(self._writer.get(cv2.CAP_PROP_FRAME_WIDTH))
-                    fh = int(self._writer.get(cv2.CAP_PROP_FRAME_HEIGHT))
+                    fw, fh = self._size     # VideoWriter can't report its own size
                     if frame.shape[1] != fw or frame.shape[0] != fh:
                         frame = cv2.resize(frame, (fw, fh))
                     self._writer.write(frame)
@@ -88,10 +89,65 @@ class CameraPane(Pane):
                     self._status = "Recording halted (write error)."
 
     # ------------------------------ VOICE -------------------------------------
-    def on_voice(self, text: str) -> None:
-        t = (text or "").strip().lower()
+    @intent("open launcher", "open home", "launcher")
+    def _voice_home(self) -> None:
+        self.ctx.event_bus.emit("NAVIGATE", pane_id="launcher")
 
-        if t in ("open launcher", "go home", "open home", "launcher"):
-            self.ctx.event_bus.emit("NAVIGATE", pane_id="launcher"); return
+    @intent("snap", "take photo", "snap photo", "capture photo")
+    def _voice_snap(self) -> None:
+        self._snap()
 
-        if t in ("snap", "take photo", "snap photo", "capture photo"):
+    @intent("start recording")
+    def _voice_record(self) -> None:
+        self._start_recording()
+
+    @intent("stop recording")
+    def _voice_stop(self) -> None:
+        if self._stop_recording_if_needed():
+            self._status = "Recording saved."
+            self.toast("Recording saved")
+
+    # ----------------------------- ACTIONS ------------------------------------
+    def _stamp(self) -> str:
+        return datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+
+    def _snap(self) -> None:
+        if cv2 is None:
+            self.toast("Photo needs OpenCV"); return
+        ok, frame = self.ctx.camera.read()
+        if not ok or frame is None:
+            self.toast("No camera frame"); return
+        path = os.path.join(self.save_dir, f"photo-{self._stamp()}.jpg")
+        if cv2.imwrite(path, frame):
+            self._status = f"Saved {os.path.basename(path)}"
+            self.toast("Photo saved")
+        else:
+            self.toast("Could not save photo")
+
+    def _start_recording(self) -> None:
+        if self.recording:
+            return
+        if cv2 is None:
+            self.toast("Recording needs OpenCV"); return
+        ok, frame = self.ctx.camera.read()
+        if not ok or frame is None:
+            self.toast("No camera frame"); return
+        h, w = frame.shape[:2]
+        path = os.path.join(self.save_dir, f"video-{self._stamp()}.mp4")
+        fps = float(self.ctx.display.fps)
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, (w, h))
+        if not writer.isOpened():
+            self.toast("Could not start recording"); return
+        self._writer, self._size = writer, (w, h)
+        self.recording = True
+        self._status = f"Recording {os.path.basename(path)}"
+
+    def _stop_recording_if_needed(self) -> bool:
+        """Close the writer if one is open. True if a recording was stopped."""
+        if not self.recording:
+            return False
+        self.recording = False
+        if self._writer is not None:
+            self._writer.release()
+            self._writer = None
+        return True
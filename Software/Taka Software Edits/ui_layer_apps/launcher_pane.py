@@ -18,13 +18,13 @@ import os, sys
 
 # Robust import (works when registry loads by path)
 try:
-    from ..main_ui_layer.pane_base import Pane
+    from ..main_ui_layer.pane_base import Pane, intent
 except Exception:
     BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     ML = os.path.join(BASE, "main_ui_layer")
     if ML not in sys.path:
         sys.path.insert(0, ML)
-    from pane_base import Pane  # type: ignore
+    from pane_base import Pane, intent  # type: ignore
 
 
 class LauncherPane(Pane):
@@ -75,26 +75,30 @@ class LauncherPane(Pane):
         self.ctx.overlay.text(f"Wi-Fi: {status}", 12, int(h * 0.88), size=16)
 
     # -------------------------- INPUT (VOICE) ---------------------------------
-    def on_voice(self, text: str) -> None:
-        """
-        Minimal intents:
-          • "next" / "previous"
-          • "open <pane>", e.g. "open wifi" / "open settings" / "open camera"
-        """
-        t = (text or "").strip().lower()
-
-        if t in ("next", "right", "go right"):
-            self._move(+1); return
-        if t in ("previous", "prev", "left", "go left"):
-            self._move(-1); return
-
-        if t.startswith("open "):
-            name = t.split("open ", 1)[1].strip()
-            pid = self._resolve_pane_id(name)
-            if pid:
-                self._open(pid)
-            else:
-                self.toast(f"Pane '{name}' not found")
+    @intent("next", "right", "go right")
+    def _voice_next(self) -> None:
+        self._move(+1)
+
+    @intent("previous", "prev", "left", "go left")
+    def _voice_prev(self) -> None:
+        self._move(-1)
+
+    @intent("open {name}", name=lambda self: [a[0] for a in self.apps] + [a[1] for a in self.apps])
+    def _voice_open(self, name: str) -> None:
+        """open <pane>, e.g. "open wifi" / "open settings" / "open camera"."""
+        pid = self._resolve_pane_id(name)
+        if pid:
+            self._open(pid)
+        else:
+            self.toast(f"Pane '{name}' not found")
+
+    # ------------------------- INPUT (ENCODER) --------------------------------
+    def on_gesture(self, name: str, data=None) -> None:
+        """Rotary encoder: 'rotate' moves by the coalesced delta, 'press' opens."""
+        if name == "rotate" and data:
+            self._move(int(data))
+        elif name == "press":
+            self._open(self._get(self.sel)[1])
 
     # ---------------------------- HELPERS -------------------------------------
     def _get(self, i: int):
@@ -16,7 +16,7 @@
 # =============================================================================
 
 from __future__ import annotations
-from ..main_ui_layer.pane_base import Pane
+from ..main_ui_layer.pane_base import Pane, intent
 
 def _clamp(v: int, lo: int, hi: int) -> int:
     return max(lo, min(hi, int(v)))
@@ -44,52 +44,44 @@ class SettingsPane(Pane):
         self.ctx.overlay.text(f"Background: {'ON' if self._bg_remove else 'OFF'} ({self._bg_mode})", 12, y, size=16); y += 22
         self.ctx.overlay.text(f"Hotword:    {self.ctx.config.get('voice_hotword', 'hey vision')}", 12, y, size=16)
 
-    def on_voice(self, text: str) -> None:
-        t = (text or "").strip().lower()
+    def _set_feature(self, key: str, value) -> None:
+        self.ctx.config.setdefault("features", {})[key] = value
+
+    @intent("toggle background removal")
+    def _voice_bg_toggle(self) -> None:
+        self._bg_remove = not self._bg_remove
+        self._set_feature("background_removal", self._bg_remove)
+        self.ctx.overlay.toast(f"Background {'ON' if self._bg_remove else 'OFF'}")
+
+    @intent("set background {mode:blur|black}")
+    def _voice_bg_mode(self, mode: str) -> None:
+        self._bg_mode = mode
+        self._set_feature("background_mode", mode)
+        self.ctx.overlay.toast(f"Background mode: {mode}")
 
-        # Background removal toggle
-        if "toggle background removal" in t:
-            self._bg_remove = not self._bg_remove
-            self.ctx.config.setdefault("features", {})["background_removal"] = self._bg_remove
-            self.ctx.overlay.toast(f"Background {'ON' if self._bg_remove else 'OFF'}")
-            return
+    @intent("set brightness to {level:0..100}", "set brightness to {level:0..100} percent")
+    def _voice_brightness(self, level: int) -> None:
+        self.ctx.store["brightness"] = _clamp(level, 0, 100)
+        self.ctx.overlay.toast(f"Brightness {self.ctx.store['brightness']}%")
 
-        # Background blur/black
-        if "set background blur" in t:
-            self._bg_mode = "blur"
-            self.ctx.config.setdefault("features", {})["background_mode"] = "blur"
-            self.ctx.overlay.toast("Background mode: blur")
-            return
-        if "set background black" in t:
-            self._bg_mode = "black"
-            self.ctx.config.setdefault("features", {})["background_mode"] = "black"
-            self.ctx.overlay.toast("Background mode: black")
-            return
+    @intent("volume up")
+    def _voice_volume_up(self) -> None:
+        self._step_volume(+10)
 
-        # Brightness
-        if t.startswith("set brightness to "):
-            try:
-                val = int(t.split("set brightness to ", 1)[1].strip().split("%")[0])
-                self.ctx.store["brightness"] = _clamp(val, 0, 100)
-                self.ctx.overlay.toast(f"Brightness {self.ctx.store['brightness']}%")
-            except Exception:
-                self.ctx.overlay.toast("Say: set brightness to 70")
-            return
+    @intent("volume down")
+    def _voice_volume_down(self) -> None:
+        self._step_volume(-10)
 
-        # Volume up/down
-        if "volume up" in t:
-            self.ctx.store["volume"] = _clamp(self.ctx.store["volume"] + 10, 0, 100)
-            self.ctx.overlay.toast(f"Volume {self.ctx.store['volume']}%")
-            return
-        if "volume down" in t:
-            self.ctx.store["volume"] = _clamp(self.ctx.store["volume"] - 10, 0, 100)
-            self.ctx.overlay.toast(f"Volume {self.ctx.store['volume']}%")
-            return
+    def _step_volume(self, d: int) -> None:
+        self.ctx.store["volume"] = _clamp(self.ctx.store["volume"] + d, 0, 100)
+        self.ctx.overlay.toast(f"Volume {self.ctx.store['volume']}%")
 
-        # Hotword
-        if t.startswith("hotword is "):
-            new_hw = text.split("hotword is ", 1)[1].strip()
-            if new_hw:
-                self.ctx.config["voice_hotword"] = new_hw
-                self.ctx.overlay.toast(f"Hotword: {new_hw}")
-            return
+    @intent("hotword is {hotword}")
+    def _voice_hotword(self, hotword: str) -> None:
+        self.ctx.config["voice_hotword"] = hotword
+        self.ctx.overlay.toast(f"Hotword: {hotword}")
+
+    def on_voice(self, text: str) -> None:
+        # heard something about brightness that no template took (e.g. "to 150")
+        if "brightness" in (text or "").lower():
+            self.ctx.overlay.toast("Say: set brightness to 70")
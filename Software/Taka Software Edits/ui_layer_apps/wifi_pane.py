@@ -21,7 +21,7 @@ import os
 import subprocess
 from typing import Any, List, Tuple
 
-from ..main_ui_layer.pane_base import Pane  # import by relative path is fine when registry imports by path
+from ..main_ui_layer.pane_base import Pane, intent  # import by relative path is fine when registry imports by path
 
 def _has_nmcli() -> bool:
     """Detect nmcli (Linux/NetworkManager)."""
@@ -78,7 +78,7 @@ class WiFiPane(Pane):
 
     def on_mount(self) -> None:
         """
-        Initialize pane state. Keep it tinythis is wearable UI.
+        Initialize pane state. Keep it tiny—this is wearable UI.
         """
         self.networks: List[Tuple[str, int]] = []  # list of (ssid, signal)
         self.simulated = not _has_nmcli()
@@ -109,35 +109,26 @@ class WiFiPane(Pane):
         status = "Connected" if self.ctx.store.get("wifi_connected") else "Disconnected"
         self.ctx.overlay.text(f"Status: {status}", 12, y + 28, size=16)
 
-    def on_voice(self, text: str) -> None:
-        """
-        Very simple intent parsing for MVP:
-          - "scan networks"
-          - "connect to <ssid>"
-          - "disconnect wifi"
-        For protected networks, set password first by:
-          - "password is <your password>"
-        """
-        t = (text or "").strip().lower()
-
-        if "scan" in t:
-            self._do_scan()
-            return
-
-        if t.startswith("password is "):
-            self._last_password = text.split("password is ", 1)[1].strip()
-            self.ctx.overlay.toast("Password stored")
-            return
-
-        if t.startswith("connect to "):
-            ssid = text.split("connect to ", 1)[1].strip()
-            self._last_ssid = ssid
-            self._do_connect(ssid, self._last_password)
-            return
-
-        if "disconnect" in t:
-            self._do_disconnect()
-            return
+    # For protected networks, set the password first ("password is <...>").
+    # The SSID slot prefers scanned names, so "connect to campus wifi"
+    # connects to "CampusWiFi".
+    @intent("scan", "scan networks", "scan wifi")
+    def _voice_scan(self) -> None:
+        self._do_scan()
+
+    @intent("password is {password}")
+    def _voice_password(self, password: str) -> None:
+        self._last_password = password
+        self.ctx.overlay.toast("Password stored")
+
+    @intent("connect to {ssid}", ssid=lambda self: [ssid for ssid, _sig in self.networks])
+    def _voice_connect(self, ssid: str) -> None:
+        self._last_ssid = ssid
+        self._do_connect(ssid, self._last_password)
+
+    @intent("disconnect", "disconnect wifi")
+    def _voice_disconnect(self) -> None:
+        self._do_disconnect()
 
     # --------------------- actions ---------------------
 